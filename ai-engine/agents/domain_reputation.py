@@ -0,0 +1,130 @@
+"""
+Per-domain reputation store for the Risk Agent.
+
+Most opportunities come from a few dozen domains, yet every risk assessment
+re-derived the same URL heuristics and asked the LLM again whether the listing
+was legitimate. Domain-level results (TLD / IP / subdomain heuristics, trusted
+platform status and the last legitimacy verdict) are kept here with a TTL.
+
+Shared hosts where anyone can publish (GitHub, Twitter, Medium, forms, ...)
+say nothing about an individual listing, so their legitimacy verdicts are
+cached per URL instead of per domain. The same goes for the listing platforms
+the scrapers read (DoraHacks, Superteam Earn, Devpost, Gitcoin, ...): one
+sponsor's verdict must not decide every other listing on the platform.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from config import DOMAIN_REPUTATION_TTL
+
+SUSPICIOUS_TLDS = ('.xyz', '.tk', '.ml', '.ga', '.cf', '.gq')
+
+TRUSTED_DOMAINS = (
+    'github.com', 'ethereum.org', 'solana.com', 'arbitrum.io',
+    'optimism.io', 'polygon.technology', 'gitcoin.co'
+)
+
+SHARED_HOSTS = (
+    'github.com', 'twitter.com', 'x.com', 't.me', 'discord.gg', 'discord.com',
+    'medium.com', 'mirror.xyz', 'notion.site', 'docs.google.com', 'forms.gle',
+    'linktr.ee', 'reddit.com', 'youtube.com'
+)
+
+# Listing platforms where organizers post their own bounties / hackathons / grants
+LISTING_PLATFORMS = (
+    'dorahacks.io', 'superteam.fun', 'devpost.com', 'devfolio.co', 'gitcoin.co',
+    'galxe.com', 'layer3.xyz', 'questbook.app', 'hackquest.io', 'dework.xyz',
+    'zealy.io', 'taikai.network'
+)
+
+# Hosts whose legitimacy verdicts are kept per URL
+PER_URL_HOSTS = SHARED_HOSTS + LISTING_PLATFORMS
+
+# Bound on per-URL verdicts kept for shared hosts and listing platforms
+MAX_URL_VERDICTS = 5000
+
+_IP_HOST = re.compile(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}')
+
+
+def domain_of(url: str) -> str:
+    """Lower-cased host of a URL ('' if there is none)."""
+    url = (url or '').lower()
+    return url.replace('https://', '').replace('http://', '').split('/')[0]
+
+
+def is_shared_host(domain: str) -> bool:
+    return any(domain == host or domain.endswith('.' + host) for host in PER_URL_HOSTS)
+
+
+class DomainReputation:
+    """What is known about one domain; built once, reused until it expires."""
+
+    __slots__ = ('domain', 'url_penalty', 'trusted_platform', 'legitimacy', 'created_at')
+
+    def __init__(self, domain: str):
+        self.domain = domain
+        self.created_at = time.monotonic()
+        self.legitimacy: Optional[float] = None
+
+        penalty = 0.0
+        if any(tld in domain for tld in SUSPICIOUS_TLDS):
+            penalty += 40
+        if _IP_HOST.search(domain):
+            penalty += 50
+        if len(domain.split('.')) > 4:
+            penalty += 20
+        self.url_penalty = penalty
+        self.trusted_platform = any(trusted in domain for trusted in TRUSTED_DOMAINS)
+
+
+class DomainReputationStore:
+    def __init__(self, ttl: float = DOMAIN_REPUTATION_TTL):
+        self.ttl = ttl
+        self._domains: Dict[str, DomainReputation] = {}
+        # Legitimacy verdicts for listings on shared hosts / listing platforms, keyed by URL
+        self._urls: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> DomainReputation:
+        domain = domain_of(url)
+        entry = self._domains.get(domain)
+        if entry is None or time.monotonic() - entry.created_at >= self.ttl:
+            entry = DomainReputation(domain)
+            with self._lock:
+                self._domains[domain] = entry
+        return entry
+
+    def legitimacy(self, url: str) -> Optional[float]:
+        """Cached legitimacy verdict for a URL, or None if the LLM must be asked."""
+        domain = domain_of(url)
+        if not domain:
+            return None
+        if is_shared_host(domain):
+            cached = self._urls.get(url.lower())
+            if cached and time.monotonic() - cached[1] < self.ttl:
+                return cached[0]
+            return None
+        return self.get(url).legitimacy
+
+    def remember_legitimacy(self, url: str, score: float):
+        domain = domain_of(url)
+        if not domain:
+            return
+        if is_shared_host(domain):
+            now = time.monotonic()
+            with self._lock:
+                if len(self._urls) >= MAX_URL_VERDICTS:
+                    self._urls = {k: v for k, v in self._urls.items() if now - v[1] < self.ttl}
+                    if len(self._urls) >= MAX_URL_VERDICTS:
+                        self._urls.clear()
+                self._urls[url.lower()] = (score, now)
+        else:
+            self.get(url).legitimacy = score
+
+    def clear(self):
+        with self._lock:
+            self._domains.clear()
+            self._urls.clear()
@@ -0,0 +1,19 @@
+"""
+Reward value for the scoring and risk agents.
+
+Rewards are normalized in one place: the backend parses reward_pool (token
+amounts priced from its token table, see backend/app/utils/rewards.py) at
+ingest and sends estimated_value_usd. The agents only read that number; a
+payload without it is scored as "unknown reward" rather than re-parsed here,
+so "25 ETH" never turns into $25.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def reward_value_usd(opportunity: Dict[str, Any]) -> Optional[float]:
+    """USD value of an opportunity's reward, or None if unknown."""
+    value = opportunity.get('estimated_value_usd')
+    if isinstance(value, (int, float)) and value > 0:
+        return float(value)
+    return None
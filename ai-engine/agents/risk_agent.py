@@ -9,12 +9,28 @@ import logging
 from datetime import datetime
 import re
 
-from config import GROQ_API_KEY, GROQ_MODEL, GROQ_API_URL, RISK_TEMPERATURE, MAX_TOKENS, TIMEOUT
+from config import GROQ_API_KEY, GROQ_MODEL, GROQ_API_URL, RISK_TEMPERATURE, MAX_TOKENS, TIMEOUT, SCAM_VOCABULARY_PATH
+from agents.domain_reputation import DomainReputationStore
+from agents.rewards import reward_value_usd
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _compile_phrases(phrases) -> re.Pattern:
+    """One case-insensitive pass that finds every phrase, overlapping ones included."""
+    ordered = sorted({p.lower() for p in phrases if p}, key=len, reverse=True)
+    if not ordered:
+        return re.compile(r'(?!)')
+    return re.compile('(?=(' + '|'.join(re.escape(p) for p in ordered) + '))')
+
+
+with open(SCAM_VOCABULARY_PATH, encoding='utf-8') as _f:
+    SCAM_KEYWORDS = json.load(_f)['scam_keywords']
+_SCAM_PATTERN = _compile_phrases(SCAM_KEYWORDS)
+_HYPE_EMOJI = re.compile(r'[🚀💰💸🤑💎🔥⚡️]')
+
+
 class RiskAgent:
     """
     Assesses opportunity risk and legitimacy.
@@ -23,6 +39,7 @@ class RiskAgent:
     def __init__(self):
         self.api_key = GROQ_API_KEY
         self.model = GROQ_MODEL
+        self.domains = DomainReputationStore()
     
     async def assess_risk(
         self,
@@ -107,17 +124,9 @@ class RiskAgent:
         score = 100.0
         text = (opportunity.get('title', '') + ' ' + opportunity.get('description', '')).lower()
         
-        # Red flag keywords
-        scam_keywords = [
-            'guaranteed', 'risk-free', '100% profit', 'double your',
-            'limited time', 'act now', 'secret', 'exclusive insider',
-            'instant riches', 'no experience needed', 'get rich quick',
-            'make money fast', 'financial freedom', 'x1000', 'moon'
-        ]
-        
-        for keyword in scam_keywords:
-            if keyword in text:
-                score -= 15
+        # Red flag keywords: -15 for each distinct one present
+        found = {match.group(1) for match in _SCAM_PATTERN.finditer(text)}
+        score -= 15 * len(found)
         
         # Check for excessive punctuation (!!!!, ????)
         if text.count('!') > 5 or text.count('?') > 5:
@@ -128,7 +137,7 @@ class RiskAgent:
             score -= 10
         
         # Check for suspicious emojis overuse
-        emoji_count = len(re.findall(r'[🚀💰💸🤑💎🔥⚡️]', text))
+        emoji_count = len(_HYPE_EMOJI.findall(text))
         if emoji_count > 10:
             score -= 15
         
@@ -151,14 +160,8 @@ class RiskAgent:
                 return 95.0
         
         # Platform domains
-        trusted_domains = [
-            'github.com', 'ethereum.org', 'solana.com', 'arbitrum.io',
-            'optimism.io', 'polygon.technology', 'gitcoin.co'
-        ]
-        
-        for domain in trusted_domains:
-            if domain in url:
-                return 90.0
+        if self.domains.get(url).trusted_platform:
+            return 90.0
         
         # Has official domain
         if any(tld in url for tld in ['.org', '.io', '.com', '.network']):
@@ -180,19 +183,8 @@ class RiskAgent:
         if not url.startswith('https://'):
             score -= 30
         
-        # Check for suspicious TLDs
-        suspicious_tlds = ['.xyz', '.tk', '.ml', '.ga', '.cf', '.gq']
-        if any(tld in url for tld in suspicious_tlds):
-            score -= 40
-        
-        # Check for IP address instead of domain
-        if re.search(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', url):
-            score -= 50
-        
-        # Check for excessive subdomains
-        domain_parts = url.replace('https://', '').replace('http://', '').split('/')[0].split('.')
-        if len(domain_parts) > 4:
-            score -= 20
+        # Suspicious TLD, IP address instead of domain, excessive subdomains
+        score -= self.domains.get(url).url_penalty
         
         return max(0, score)
     
@@ -214,6 +206,11 @@ class RiskAgent:
             if eco_website and eco_website.replace('https://', '').replace('www.', '') in opp_url:
                 return 95.0  # Strong match
         
+        # Same domain judged recently
+        cached = self.domains.legitimacy(opportunity.get('url', ''))
+        if cached is not None:
+            return cached
+        
         # AI verification
         prompt = f"""Is this a legitimate Web3 opportunity or potentially fraudulent?
 
@@ -255,9 +252,11 @@ Respond with JSON only:
                     content = json.loads(data["choices"][0]["message"]["content"])
                     
                     if content.get("is_legitimate"):
-                        return float(content.get("confidence", 70))
+                        verdict = float(content.get("confidence", 70))
                     else:
-                        return max(0, 100 - float(content.get("confidence", 70)))
+                        verdict = max(0, 100 - float(content.get("confidence", 70)))
+                    self.domains.remember_legitimacy(opportunity.get('url', ''), verdict)
+                    return verdict
             
             return 60.0
             
@@ -267,17 +266,11 @@ Respond with JSON only:
     
     def _assess_reward_realism(self, opportunity: Dict[str, Any]) -> float:
         """Check if reward amount is realistic."""
-        reward_str = str(opportunity.get('reward_pool', '')).lower()
-        
-        # Extract numbers
-        numbers = re.findall(r'[\d,]+', reward_str.replace('$', '').replace('k', '000').replace('m', '000000'))
-        
-        if not numbers:
+        value = reward_value_usd(opportunity)
+        if value is None:
             return 60.0  # Unknown = neutral
         
         try:
-            value = int(numbers[0].replace(',', ''))
-            
             # Realistic ranges for different categories
             category = opportunity.get('category', '').lower()
             
@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional
 import logging
 
 from config import GROQ_API_KEY, GROQ_MODEL, GROQ_API_URL, SCORER_TEMPERATURE, MAX_TOKENS, TIMEOUT
+from agents.rewards import reward_value_usd
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -160,35 +161,24 @@ Respond with JSON only:
     
     def _calculate_reward_score(self, opportunity: Dict[str, Any]) -> float:
         """Calculate score based on reward value."""
-        reward_str = str(opportunity.get('reward_pool', '')).lower()
-        
-        # Extract numeric value from reward string
-        import re
-        numbers = re.findall(r'[\d,]+', reward_str.replace('$', '').replace('k', '000'))
-        
-        if not numbers:
+        value = reward_value_usd(opportunity)
+        if value is None:
             return 40.0  # Unknown reward
         
-        try:
-            value = int(numbers[0].replace(',', ''))
-            
-            # Score tiers
-            if value >= 100000:
-                return 100.0
-            elif value >= 50000:
-                return 90.0
-            elif value >= 20000:
-                return 80.0
-            elif value >= 10000:
-                return 70.0
-            elif value >= 5000:
-                return 60.0
-            elif value >= 1000:
-                return 50.0
-            else:
-                return 40.0
-                
-        except:
+        # Score tiers
+        if value >= 100000:
+            return 100.0
+        elif value >= 50000:
+            return 90.0
+        elif value >= 20000:
+            return 80.0
+        elif value >= 10000:
+            return 70.0
+        elif value >= 5000:
+            return 60.0
+        elif value >= 1000:
+            return 50.0
+        else:
             return 40.0
     
     def _calculate_urgency_score(self, opportunity: Dict[str, Any]) -> float:
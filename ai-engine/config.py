@@ -51,6 +51,12 @@ RISK_TEMPERATURE = 0.2        # Very deterministic
 MAX_TOKENS = 500
 TIMEOUT = 30  # seconds
 
+# Red-flag phrases for the Risk Agent (JSON: {"scam_keywords": [...]})
+SCAM_VOCABULARY_PATH = os.getenv("SCAM_VOCABULARY_PATH", str(Path(__file__).parent / "resources" / "scam_vocabulary.json"))
+
+# Seconds a domain's reputation (URL heuristics, legitimacy verdict) is reused
+DOMAIN_REPUTATION_TTL = float(os.getenv("DOMAIN_REPUTATION_TTL", str(24 * 3600)))
+
 # Feature Flags
 ENABLE_CHROMADB = True
 ENABLE_LANGCHAIN = True
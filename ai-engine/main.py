@@ -59,6 +59,8 @@ class OpportunityData(BaseModel):
     category: Optional[str] = None
     chain: Optional[str] = None
     reward_pool: Optional[str] = None
+    reward_token: Optional[str] = None
+    estimated_value_usd: Optional[float] = None  # normalized by the backend at ingest
     deadline: Optional[datetime] = None
     source: Optional[str] = None
     tags: Optional[List[str]] = []
@@ -21,7 +21,9 @@ celery_app = Celery(
     include=[
         "app.tasks.scraping_tasks",
         "app.tasks.ai_tasks",
-        "app.tasks.notification_tasks"
+        "app.tasks.notification_tasks",
+        "app.tasks.trending_tasks",
+        "app.tasks.stats_tasks"
     ]
 )
 
@@ -69,6 +71,12 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(minute=0, hour="*/3"),
     },
 
+    # Reddit - Every 3 hours (incremental per subreddit, see RedditScraper)
+    "scrape-reddit": {
+        "task": "app.tasks.scraping_tasks.scrape_reddit",
+        "schedule": crontab(minute=20, hour="*/3"),
+    },
+
     # Platforms - Every 4 hours
     "scrape-platforms": {
         "task": "app.tasks.scraping_tasks.scrape_grant_platforms",
@@ -87,6 +95,18 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(minute=45, hour="*/2"),
     },
 
+    # Trending score decay - Every hour (trending_tasks.DECAY_INTERVAL_HOURS)
+    "decay-trending-scores": {
+        "task": "app.tasks.trending_tasks.decay_trending_scores",
+        "schedule": crontab(minute=5),
+    },
+
+    # Dashboard stats snapshot - Every 5 minutes
+    "refresh-dashboard-stats": {
+        "task": "app.tasks.stats_tasks.refresh_dashboard_stats",
+        "schedule": crontab(minute="*/5"),
+    },
+
     # Cleanup - Daily at 3 AM
     "cleanup-old-data": {
         "task": "app.tasks.scraping_tasks.cleanup_old_opportunities",
@@ -117,6 +137,8 @@ celery_app.conf.task_routes = {
     "app.tasks.scraping_tasks.*": {"queue": "scraping"},
     "app.tasks.ai_tasks.*": {"queue": "ai_processing"},
     "app.tasks.notification_tasks.*": {"queue": "notifications"},
+    "app.tasks.trending_tasks.*": {"queue": "maintenance"},
+    "app.tasks.stats_tasks.*": {"queue": "maintenance"},
 }
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+"""
+Response cache for the public read endpoints (opportunity feeds, detail pages,
+dashboard stats).
+
+Responses are cached by route + normalized query string + the current version
+of the data they read. Write paths (ingestion, admin edits, the cleanup task)
+call ResponseCache.bump("opportunities"), which moves every key to a new
+version, so readers never see a response older than the last write.
+
+Tiers:
+  - in-process LRU (always), entries live RESPONSE_CACHE_TTL seconds
+  - Redis (when CACHE_REDIS_URL is set): shared by all API workers, and holds
+    the version counters so a bump from a Celery worker reaches every API
+    process. Without Redis, a bump only reaches the process it ran in and
+    other processes catch up when their entries expire.
+
+Every cached response carries an ETag; a matching If-None-Match gets an empty
+304. Redis errors are logged and the tier is skipped for a while, never
+raised to the request.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "60"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "")
+REDIS_RETRY_AFTER = 30  # seconds to skip Redis after an error
+
+# Response headers replayed from the cache (besides ETag)
+_KEPT_HEADERS = ("content-type", "x-next-cursor")
+_VERSION_KEY = "oppforge:cache:version:"
+_ENTRY_KEY = "oppforge:cache:entry:"
+
+
+class CachedRoute(NamedTuple):
+    pattern: "re.Pattern"
+    namespaces: Tuple[str, ...]   # data the route reads; a bump of any of them invalidates it
+    anonymous_only: bool = False  # response depends on the user when authenticated
+
+
+CACHED_ROUTES = [
+    CachedRoute(re.compile(r"^/opportunities/?$"), ("opportunities",)),
+    CachedRoute(re.compile(r"^/opportunities/trending$"), ("opportunities",)),
+    CachedRoute(re.compile(r"^/opportunities/testnets$"), ("opportunities",)),
+    CachedRoute(re.compile(r"^/opportunities/facets$"), ("opportunities",)),
+    CachedRoute(re.compile(r"^/opportunities/[0-9a-fA-F-]{32,36}$"), ("opportunities",)),
+    CachedRoute(re.compile(r"^/stats/dashboard$"), ("opportunities",), anonymous_only=True),
+]
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+    etag: str
+    expires_at: float  # epoch seconds
+
+    def to_json(self) -> str:
+        return json.dumps({"body": self.body.decode("utf-8"), "headers": self.headers,
+                           "etag": self.etag, "expires_at": self.expires_at})
+
+    @classmethod
+    def from_json(cls, raw) -> "CachedResponse":
+        data = json.loads(raw)
+        return cls(data["body"].encode("utf-8"), data["headers"], data["etag"], data["expires_at"])
+
+
+class RedisTier:
+    """Optional Redis client shared by the read-path caches; every call degrades to None."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.client = None
+        self.down_until = 0.0
+
+    def _get_client(self):
+        if not self.url or time.monotonic() < self.down_until:
+            return None
+        if self.client is None:
+            try:
+                import redis
+                self.client = redis.Redis.from_url(self.url, socket_timeout=0.25, socket_connect_timeout=0.25)
+            except Exception as e:
+                self._failed(e)
+        return self.client
+
+    def _failed(self, error: Exception):
+        logger.warning(f"[Cache] Redis unavailable, using the in-process cache only: {error}")
+        self.down_until = time.monotonic() + REDIS_RETRY_AFTER
+
+    def call(self, method: str, *args):
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            return getattr(client, method)(*args)
+        except Exception as e:
+            from redis.exceptions import ResponseError
+            # A rejected command (e.g. RENAME of a missing key) leaves Redis usable
+            if not isinstance(e, ResponseError):
+                self._failed(e)
+            return None
+
+
+class ResponseCache:
+    _entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+    _versions: Dict[str, int] = {}
+    _lock = threading.Lock()
+    redis = RedisTier(CACHE_REDIS_URL)
+
+    @classmethod
+    def versions(cls, namespaces: Iterable[str]) -> Tuple[int, ...]:
+        namespaces = tuple(namespaces)
+        shared = cls.redis.call("mget", [_VERSION_KEY + ns for ns in namespaces])
+        if shared is not None:
+            return tuple(int(v or 0) for v in shared)
+        return tuple(cls._versions.get(ns, 0) for ns in namespaces)
+
+    @classmethod
+    def bump(cls, *namespaces: str):
+        """Invalidate every cached response that reads any of these namespaces."""
+        with cls._lock:
+            for ns in namespaces:
+                cls._versions[ns] = cls._versions.get(ns, 0) + 1
+        for ns in namespaces:
+            cls.redis.call("incr", _VERSION_KEY + ns)
+
+    @classmethod
+    def get(cls, key: str) -> Optional[CachedResponse]:
+        now = time.time()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    cls._entries.move_to_end(key)
+                    return entry
+                del cls._entries[key]
+        raw = cls.redis.call("get", _ENTRY_KEY + key)
+        if raw:
+            entry = CachedResponse.from_json(raw)
+            if entry.expires_at > now:
+                cls._remember(key, entry)
+                return entry
+        return None
+
+    @classmethod
+    def store(cls, key: str, body: bytes, headers: Dict[str, str]) -> CachedResponse:
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        entry = CachedResponse(body, headers, etag, time.time() + RESPONSE_CACHE_TTL)
+        cls._remember(key, entry)
+        cls.redis.call("set", _ENTRY_KEY + key, entry.to_json(), RESPONSE_CACHE_TTL)
+        return entry
+
+    @classmethod
+    def _remember(cls, key: str, entry: CachedResponse):
+        with cls._lock:
+            cls._entries[key] = entry
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > RESPONSE_CACHE_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls):
+        """Drop the in-process tier (tests, admin tools)."""
+        with cls._lock:
+            cls._entries.clear()
+
+
+def cache_key(route: CachedRoute, request: Request) -> str:
+    versions = ResponseCache.versions(route.namespaces)
+    query = urlencode(sorted(request.query_params.multi_items()))
+    version = ".".join(f"{ns}{v}" for ns, v in zip(route.namespaces, versions))
+    return f"{version}:{request.url.path.rstrip('/')}?{query}"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET":
+            return await call_next(request)
+        route = next((r for r in CACHED_ROUTES if r.pattern.match(request.url.path)), None)
+        if route is None or (route.anonymous_only and request.headers.get("authorization")):
+            return await call_next(request)
+
+        key = cache_key(route, request)
+        entry = ResponseCache.get(key)
+        status = "HIT"
+        if entry is None:
+            response = await call_next(request)
+            if response.status_code != 200:
+                return response
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            headers = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+            entry = ResponseCache.store(key, body, headers)
+            status = "MISS"
+
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache", "X-Cache": status}
+        if _etag_matches(request, entry.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, headers={**entry.headers, **headers})
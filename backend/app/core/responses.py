@@ -0,0 +1,51 @@
+"""
+JSON responses for large, pre-shaped payloads (opportunity lists).
+
+Endpoints that build plain dicts themselves (services/projection.py) return
+FastJSONResponse instead of a response_model, which skips FastAPI's
+validate-then-serialize pass. orjson is used when installed (it writes
+datetimes, UUIDs and floats natively, several times faster than json);
+otherwise the stdlib encoder produces the same output, just slower.
+"""
+
+import json
+import logging
+import uuid
+from datetime import date, datetime
+from typing import Any
+
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug("[Responses] orjson not available. Using the stdlib json encoder.")
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """UTF-8 JSON; UTC datetimes end in Z, as pydantic writes them."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
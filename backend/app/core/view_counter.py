@@ -0,0 +1,204 @@
+"""
+Write-behind view counter for opportunity detail pages.
+
+GET /opportunities/{id} is the hottest read (and mostly served from the
+response cache), so views are not written per request. ViewCounterMiddleware
+counts successful detail reads (cache hits and 304s included) into a buffer,
+and ViewCounter.flush() applies the aggregated counts every
+VIEW_FLUSH_INTERVAL seconds as one batched UPDATE:
+
+    views_count += n, trending_score += n * EVENT_WEIGHTS["view"]
+
+Buffers:
+  - Redis (VIEW_COUNTER_REDIS_URL, defaults to CACHE_REDIS_URL): one hash
+    shared by every API worker. A flush renames it to a timestamped
+    "flushing" key and deletes that only after the database commit, so a
+    failed or killed flush is picked up again later (at-least-once: a crash
+    between commit and delete can count a batch twice, never zero times).
+  - in-process (no Redis, or Redis unreachable): a Counter; a failed flush
+    puts its counts back. Lost on a hard kill; a graceful shutdown flushes.
+
+The flusher runs as a background task of the API process (see the lifespan
+in main.py), which also flushes once more on shutdown.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List
+
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.orm import Session
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from ..database import SessionLocal
+from ..models.opportunity import Opportunity
+from ..services.trending import EVENT_WEIGHTS
+from .cache import CACHE_REDIS_URL, RedisTier
+
+logger = logging.getLogger(__name__)
+
+VIEW_FLUSH_INTERVAL = float(os.getenv("VIEW_FLUSH_INTERVAL", "10"))
+VIEW_COUNTER_REDIS_URL = os.getenv("VIEW_COUNTER_REDIS_URL", CACHE_REDIS_URL)
+# A "flushing" key older than this belongs to a flush that died; take it over
+VIEW_FLUSH_ORPHAN_AFTER = 300
+
+_PENDING_KEY = "oppforge:views:pending"
+_FLUSHING_PREFIX = "oppforge:views:flushing:"
+
+DETAIL_PATH = re.compile(r"^/opportunities/([0-9a-fA-F-]{32,36})$")
+
+
+class ViewCounter:
+    _pending: Counter = Counter()
+    _lock = threading.Lock()
+    _flush_lock = threading.Lock()
+    redis = RedisTier(VIEW_COUNTER_REDIS_URL)
+
+    @classmethod
+    def hit(cls, opportunity_id: uuid.UUID, count: int = 1):
+        """Count a view. Never touches the database."""
+        if cls.redis.call("hincrby", _PENDING_KEY, str(opportunity_id), count) is not None:
+            return
+        with cls._lock:
+            cls._pending[opportunity_id] += count
+
+    @classmethod
+    def pending(cls) -> Dict[uuid.UUID, int]:
+        """Unflushed in-process counts (tests, admin tools)."""
+        with cls._lock:
+            return dict(cls._pending)
+
+    @classmethod
+    def flush(cls, db: Session) -> int:
+        """Apply buffered counts in one batched UPDATE. Returns the number of opportunities updated."""
+        with cls._flush_lock:
+            with cls._lock:
+                local, cls._pending = cls._pending, Counter()
+            counts = Counter(local)
+            read = []  # claimed keys whose counts are in `counts`
+            for key in cls._claim_redis():
+                values = cls.redis.call("hgetall", key)
+                if values is None:
+                    continue  # unreadable now: left for a later flush
+                read.append(key)
+                for opp_id, n in values.items():
+                    try:
+                        counts[uuid.UUID(_text(opp_id))] += int(n)
+                    except ValueError:
+                        logger.warning(f"[Views] Dropping malformed counter {opp_id!r}")
+            if not counts:
+                if read:
+                    cls.redis.call("delete", *read)
+                return 0
+
+            try:
+                _apply(db, counts)
+                db.commit()
+            except Exception:
+                db.rollback()
+                with cls._lock:
+                    cls._pending.update(local)
+                # Redis counts stay in their flushing keys and are retried as orphans
+                raise
+
+            if read:
+                cls.redis.call("delete", *read)
+            return len(counts)
+
+    @classmethod
+    def _claim_redis(cls) -> List[str]:
+        """Move the shared pending hash (and any orphaned flushing keys) under keys this flush owns."""
+        now = int(time.time())
+        claimed = []
+        own = f"{_FLUSHING_PREFIX}{now}:{uuid.uuid4().hex}"
+        # Fails (None) when nothing is pending
+        if cls.redis.call("rename", _PENDING_KEY, own):
+            claimed.append(own)
+
+        cursor = 0
+        while True:
+            page = cls.redis.call("scan", cursor, _FLUSHING_PREFIX + "*", 500)
+            if not page:
+                break
+            cursor, keys = page
+            for key in map(_text, keys):
+                if key in claimed:
+                    continue
+                try:
+                    started = int(key[len(_FLUSHING_PREFIX):].split(":", 1)[0])
+                except ValueError:
+                    continue
+                if now - started >= VIEW_FLUSH_ORPHAN_AFTER:
+                    takeover = f"{_FLUSHING_PREFIX}{now}:{uuid.uuid4().hex}"
+                    # Only one flusher wins the rename
+                    if cls.redis.call("rename", key, takeover):
+                        claimed.append(takeover)
+            if not cursor:
+                break
+        return claimed
+
+    @classmethod
+    def flush_now(cls) -> int:
+        """Flush with a session of its own (background flusher, shutdown)."""
+        db = SessionLocal()
+        try:
+            return cls.flush(db)
+        finally:
+            db.close()
+
+    @classmethod
+    async def run_flusher(cls, interval: float = VIEW_FLUSH_INTERVAL):
+        """Flush every `interval` seconds until cancelled; errors are logged and retried next round."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                flushed = await asyncio.to_thread(cls.flush_now)
+                if flushed:
+                    logger.debug(f"[Views] Flushed views for {flushed} opportunities")
+            except Exception as e:
+                logger.warning(f"[Views] Flush failed, counts kept for the next one: {e}")
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._pending.clear()
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _apply(db: Session, counts: Counter):
+    table = Opportunity.__table__
+    # Sorted by id so concurrent flushers lock rows in the same order
+    rows = [{"_id": opp_id, "_views": n} for opp_id, n in sorted(counts.items(), key=lambda kv: str(kv[0]))]
+    db.execute(
+        update(table)
+        .where(table.c.id == bindparam("_id"))
+        .values(
+            views_count=func.coalesce(table.c.views_count, 0) + bindparam("_views"),
+            trending_score=table.c.trending_score + bindparam("_views") * EVENT_WEIGHTS["view"],
+            updated_at=table.c.updated_at,  # a view is not an edit
+        ),
+        rows,
+    )
+
+
+class ViewCounterMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method == "GET" and response.status_code in (200, 304):
+            match = DETAIL_PATH.match(request.url.path)
+            if match:
+                try:
+                    ViewCounter.hit(uuid.UUID(match.group(1)))
+                except ValueError:
+                    pass
+        return response
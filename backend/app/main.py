@@ -3,12 +3,22 @@ from .core.sockets import manager
 from .models.feedback import Feedback  # Ensures table creation
 from .models.audit import AuditLog  # Ensures table creation
 from .models.ecosystem import Ecosystem  # Ensures table creation
-from .database import engine, Base
+from .models.triage_cache import TriageCacheEntry  # Ensures table creation
+from .models.near_duplicate import OpportunityFingerprint, OpportunityLSHBucket  # Ensures table creation
+from .models.scraper_watermark import ScraperWatermark  # Ensures table creation
+from .models.ingestion_run import IngestionRun, IngestionSourceStats  # Ensures table creation
+from .models.stats_snapshot import StatsSnapshot  # Ensures table creation
+from .database import engine, Base, SessionLocal
+from .services.full_text import FullTextIndex
+from .core.cache import ResponseCacheMiddleware
+from .core.view_counter import ViewCounter, ViewCounterMiddleware
 from .routers import auth, opportunities, stats, tracker, notifications, chat, search, admin_audit, billing, admin as admin_router, feedback, workspace
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
+from contextlib import asynccontextmanager
+import asyncio
 import os
 import logging
 
@@ -21,12 +31,41 @@ load_dotenv()
 # Create Tables
 Base.metadata.create_all(bind=engine)
 
+# Full-text search index (tsvector + GIN on Postgres, FTS5 on SQLite). Created and backfilled
+# by app/scripts/add_fulltext_index.py, not here: every worker would run the DDL and backfill.
+try:
+    with SessionLocal() as db:
+        if not FullTextIndex.available(db):
+            logger.warning("Full-text index not installed (run app/scripts/add_fulltext_index.py); "
+                           "search falls back to ILIKE")
+except Exception as e:
+    logger.warning(f"Full-text index unavailable, search falls back to ILIKE: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Write-behind view counter: flush periodically, and once more on shutdown
+    flusher = asyncio.create_task(ViewCounter.run_flusher())
+    yield
+    flusher.cancel()
+    try:
+        await asyncio.to_thread(ViewCounter.flush_now)
+    except Exception as e:
+        logger.warning(f"Final view count flush failed: {e}")
+
+
 app = FastAPI(
     title="OppForge API",
     version="0.1.0",
     redirect_slashes=False,  # Prevent 307 redirects that cause mixed-content errors
+    lifespan=lifespan,
 )
 
+# Public feed response cache (added before CORS so cached responses get CORS headers too)
+app.add_middleware(ResponseCacheMiddleware)
+# Outside the response cache so cached detail reads are counted too
+app.add_middleware(ViewCounterMiddleware)
+
 # CORS
 origins = [
     "http://localhost:3000",
@@ -44,6 +83,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Global exception handler — ensures CORS headers on 500s
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, Float, Text, Enum
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, Float, Text, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from ..database import Base
@@ -13,6 +13,9 @@ class PaymentStatus(enum.Enum):
 
 class SubscriptionPayment(Base):
     __tablename__ = "subscription_payments"
+    __table_args__ = (
+        Index("ix_subscription_payments_created_at_id", "created_at", "id"),  # admin payment history
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
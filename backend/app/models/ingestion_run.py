@@ -0,0 +1,58 @@
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, JSON, ForeignKey, Text
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from ..database import Base
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+
+class IngestionRun(Base):
+    """One pass of the ingestion pipeline: totals, per-stage timings and per-source breakdown."""
+    __tablename__ = "ingestion_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    trigger = Column(String, nullable=True) # e.g. "scrape_grant_platforms", "run_pipeline"
+    status = Column(String, default="running") # running, success, partial, failed
+
+    # Item counts
+    found = Column(Integer, default=0)
+    duplicate = Column(Integer, default=0) # exact id / url / content / title match
+    near_duplicate = Column(Integer, default=0)
+    stale = Column(Integer, default=0)
+    noise = Column(Integer, default=0)
+    saved = Column(Integer, default=0)
+    errors = Column(Integer, default=0)
+
+    # AI engine usage
+    llm_calls = Column(Integer, default=0) # items sent to the AI engine (classify + risk each)
+    triage_cache_hits = Column(Integer, default=0)
+
+    stages = Column(JSON, nullable=True) # StageStats.as_dict() per pipeline stage
+    error = Column(Text, nullable=True)
+
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+
+    sources = relationship("IngestionSourceStats", back_populates="run", cascade="all, delete-orphan")
+
+
+class IngestionSourceStats(Base):
+    __tablename__ = "ingestion_source_stats"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    run_id = Column(UUID(as_uuid=True), ForeignKey("ingestion_runs.id", ondelete="CASCADE"), index=True)
+    source = Column(String, index=True)
+
+    fetch_seconds = Column(Float, nullable=True) # network
+    parse_seconds = Column(Float, nullable=True)
+    timed_out = Column(Boolean, default=False)
+
+    found = Column(Integer, default=0)
+    duplicate = Column(Integer, default=0)
+    near_duplicate = Column(Integer, default=0)
+    stale = Column(Integer, default=0)
+    noise = Column(Integer, default=0)
+    saved = Column(Integer, default=0)
+    errors = Column(Integer, default=0)
+
+    run = relationship("IngestionRun", back_populates="sources")
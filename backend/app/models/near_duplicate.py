@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, DateTime, JSON, ForeignKey
+from sqlalchemy.sql import func
+from ..database import Base
+from sqlalchemy.dialects.postgresql import UUID
+
+class OpportunityFingerprint(Base):
+    """MinHash signature of an opportunity's normalized title + description."""
+    __tablename__ = "opportunity_fingerprints"
+
+    opportunity_id = Column(UUID(as_uuid=True), ForeignKey("opportunities.id", ondelete="CASCADE"), primary_key=True)
+    signature = Column(JSON, nullable=False) # list of NUM_PERM 32-bit minimums
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class OpportunityLSHBucket(Base):
+    """One LSH band of a fingerprint. Near-duplicate lookups are `band_key IN (...)` on the PK."""
+    __tablename__ = "opportunity_lsh_buckets"
+
+    band_key = Column(String, primary_key=True) # "<band>:<hash of the band's rows>"
+    opportunity_id = Column(UUID(as_uuid=True), ForeignKey("opportunities.id", ondelete="CASCADE"), primary_key=True, index=True)
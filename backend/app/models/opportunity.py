@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, JSON, Float, ForeignKey, Enum
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, JSON, Float, ForeignKey, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -8,6 +8,12 @@ import uuid
 
 class Opportunity(Base):
     __tablename__ = "opportunities"
+    __table_args__ = (
+        # Ingestion relies on these for INSERT ... ON CONFLICT DO NOTHING
+        Index("uq_opportunities_source_source_id", "source", "source_id", unique=True),
+        Index("uq_opportunities_url", "url", unique=True,
+              postgresql_where=text("url <> ''"), sqlite_where=text("url <> ''")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     
@@ -23,6 +29,7 @@ class Opportunity(Base):
     source_id = Column(String, index=True, nullable=True) # External ID (e.g. Tweet ID)
     source_url = Column(String, nullable=True)
     posted_at = Column(DateTime(timezone=True), nullable=True)
+    content_hash = Column(String, index=True, nullable=True) # SHA256 of raw title + description + source
     
     # Classification
     category = Column(String, index=True) # Grant, Airdrop, Hackathon, Bounty
@@ -61,6 +68,9 @@ class Opportunity(Base):
     # Meta
     is_verified = Column(Boolean, default=False)
     views_count = Column(Integer, default=0)
+    # Time-decayed engagement (services/trending.py); new rows start with the
+    # NEW_OPPORTUNITY_BOOST so fresh opportunities surface before anyone reacts
+    trending_score = Column(Float, default=10.0, server_default=text("0"), nullable=False)
     
     # Aliases/Computed helpers for the user request
     @property
@@ -86,6 +96,8 @@ class Opportunity(Base):
             "category": self.category,
             "chain": self.chain,
             "reward_pool": self.reward_pool,
+            "reward_token": self.reward_token,
+            "estimated_value_usd": self.estimated_value_usd,
             "deadline": self.deadline.isoformat() if self.deadline else None,
             "start_date": self.start_date.isoformat() if self.start_date else None,
             "source": self.source,
@@ -96,3 +108,35 @@ class Opportunity(Base):
             "url": self.url,
             "is_verified": self.is_verified,
         }
+
+
+# Listing order: most recently added or updated first
+recently_active = func.coalesce(Opportunity.updated_at, Opportunity.created_at)
+
+# Keyset pagination (app/utils/pagination.py) walks these
+Index("ix_opportunities_recently_active_id", recently_active, Opportunity.id)
+Index("ix_opportunities_created_at_id", Opportunity.created_at, Opportunity.id)
+
+# Feed hot path: every public read filters is_open AND (deadline IS NULL OR
+# deadline >= now) and orders by recency. The open flag goes in the index
+# predicate (the deadline can't: now() is not immutable); queries must say
+# `is_open == True` (not `!= False`) for the planner to match it. Category and
+# chain filters compare lower(column) so they can use the expression indexes.
+_open_only = dict(postgresql_where=text("is_open = true"), sqlite_where=text("is_open = 1"))
+Index("ix_opportunities_open_recent", recently_active, Opportunity.id, **_open_only)
+Index("ix_opportunities_open_category_recent",
+      func.lower(Opportunity.category), recently_active, Opportunity.id, **_open_only)
+Index("ix_opportunities_open_chain_recent",
+      func.lower(Opportunity.chain), recently_active, Opportunity.id, **_open_only)
+# Closing-soon counts and the expiry sweep (open rows by deadline)
+Index("ix_opportunities_open_deadline", Opportunity.deadline, **_open_only)
+
+# /opportunities/trending: open rows by trending score
+Index("ix_opportunities_open_trending", Opportunity.trending_score, Opportunity.id, **_open_only)
+
+FEED_INDEXES = (
+    "ix_opportunities_open_recent",
+    "ix_opportunities_open_category_recent",
+    "ix_opportunities_open_chain_recent",
+    "ix_opportunities_open_deadline",
+)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy.sql import func
+from ..database import Base
+
+class ScraperWatermark(Base):
+    """Newest item a source has delivered to a successful ingestion run."""
+    __tablename__ = "scraper_watermarks"
+
+    source = Column(String, primary_key=True) # BaseScraper.source_name
+    last_source_id = Column(String, nullable=True)
+    last_posted_at = Column(DateTime(timezone=True), nullable=True) # naive UTC
+    cursor = Column(JSON, nullable=True) # scraper-specific paging state (e.g. Reddit fullnames per subreddit)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Integer, Float, DateTime
+from ..database import Base
+
+class StatsSnapshot(Base):
+    """Precomputed catalog-wide figures (services/dashboard_stats.py), one row per snapshot name."""
+    __tablename__ = "stats_snapshots"
+
+    name = Column(String, primary_key=True) # "dashboard"
+    active_count = Column(Integer, nullable=False, default=0) # open and not expired
+    closing_soon = Column(Integer, nullable=False, default=0) # deadline within CLOSING_SOON_WINDOW
+    total_pool_usd = Column(Float, nullable=False, default=0.0) # sum of estimated_value_usd over active rows
+
+    refreshed_at = Column(DateTime, nullable=False) # naive UTC, the `now` the figures were computed for
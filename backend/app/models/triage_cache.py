@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy.sql import func
+from ..database import Base
+
+class TriageCacheEntry(Base):
+    """AI triage verdict for a piece of raw scraped content, keyed by its content hash."""
+    __tablename__ = "triage_cache"
+
+    content_hash = Column(String, primary_key=True) # Opportunity.content_hash of the raw item
+    version = Column(String, nullable=False) # classifier model + prompt version that produced it
+    verdict = Column(String, nullable=False) # "refined" or "noise"
+    fields = Column(JSON, nullable=True) # AI fields merged into the item when refined
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -6,8 +6,8 @@ Permission levels:
   - SUB_ADMIN: Read-only analytics dashboard, audit logs, opp view. No user management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func, desc, case, extract
 from typing import List, Optional
 from pydantic import BaseModel, EmailStr
@@ -21,6 +21,14 @@ from ..models.opportunity import Opportunity
 from ..models.tracking import TrackedApplication
 from ..models.notification import Notification
 from ..models.audit import AuditLog
+from ..models.ingestion_run import IngestionRun
+from ..models.billing import SubscriptionPayment
+from ..core.cache import ResponseCache
+from ..services.facets import count_facets
+from ..services.ingestion import ingest_opportunities
+from ..services.telemetry import serialize_run
+from ..utils.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursor, Keyset
+from ..utils.rewards import apply_reward
 from ..models.enums import UserRole, STAFF_ROLES, MANAGEMENT_ROLES
 from .auth import get_current_user
 
@@ -28,6 +36,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+USERS_KEYSET = Keyset(User.created_at, User.id)
+OPPORTUNITIES_KEYSET = Keyset(Opportunity.created_at, Opportunity.id)
+PAYMENTS_KEYSET = Keyset(SubscriptionPayment.created_at, SubscriptionPayment.id)
+
+
+def _paginate(keyset: Keyset, query, response: Response, limit: int, cursor: Optional[str], offset: int) -> list:
+    try:
+        page = keyset.paginate(query, limit, cursor=cursor, offset=offset)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
 # ========================
 # Permission dependencies
 # ========================
@@ -257,14 +279,8 @@ def get_category_breakdown(
     current_user=Depends(require_staff)
 ):
     """Opportunity count by category."""
-    rows = (
-        db.query(Opportunity.category, func.count(
-            Opportunity.id).label("count"))
-        .group_by(Opportunity.category)
-        .order_by(desc("count"))
-        .all()
-    )
-    return [CategoryBreakdown(category=r.category or "Unknown", count=r.count) for r in rows]
+    by_category = count_facets(db, ("category",))["category"]
+    return [CategoryBreakdown(category=category, count=count) for category, count in by_category.items()]
 
 
 @router.get("/dashboard/top-opportunities")
@@ -302,21 +318,15 @@ def get_top_opportunities(
 
 @router.get("/dashboard/payments")
 def get_payment_history(
-    limit: int = 50,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     offset: int = 0,
+    cursor: Optional[str] = None,
     db: Session = Depends(database.get_db),
     current_user=Depends(require_staff)
 ):
     """Payment history for admin dashboard. ADMIN and SUB_ADMIN can view."""
-    from ..models.billing import SubscriptionPayment
-
-    payments = (
-        db.query(SubscriptionPayment)
-        .order_by(desc(SubscriptionPayment.created_at))
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    payments = _paginate(PAYMENTS_KEYSET, db.query(SubscriptionPayment), response, limit, cursor, offset)
 
     return [
         {
@@ -339,8 +349,10 @@ def get_payment_history(
 
 @router.get("/users", response_model=List[AdminUserResponse])
 def list_users(
+    response: Response,
     skip: int = 0,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     role: Optional[str] = None,
     db: Session = Depends(database.get_db),
@@ -363,8 +375,7 @@ def list_users(
     if role:
         query = query.filter(User.role == role)
 
-    users = query.order_by(desc(User.created_at)).offset(
-        skip).limit(limit).all()
+    users = _paginate(USERS_KEYSET, query, response, limit, cursor, skip)
 
     result = []
     for u in users:
@@ -520,6 +531,13 @@ def update_opportunity(
             old_val = getattr(opp, field)
             setattr(opp, field, value)
             changed_fields.append(field)
+    if {"reward_pool", "reward_token"} & update_data.keys():
+        # Re-derive the USD value, or a stale one stays in the pool total and scoring
+        reward = {"reward_pool": opp.reward_pool, "reward_token": opp.reward_token}
+        if "estimated_value_usd" in update_data:
+            reward["estimated_value_usd"] = update_data["estimated_value_usd"]
+        for field, value in apply_reward(reward).items():
+            setattr(opp, field, value)
 
     db.add(AuditLog(
         action="opportunity_edited",
@@ -532,6 +550,7 @@ def update_opportunity(
 
     db.commit()
     db.refresh(opp)
+    ResponseCache.bump("opportunities")
     return opp
 
 
@@ -573,13 +592,16 @@ def flag_opportunity(
     ))
 
     db.commit()
+    ResponseCache.bump("opportunities")
     return {"status": "flagged", "total_flags": len(existing_flags)}
 
 
 @router.get("/opportunities", response_model=List[schemas.OpportunityResponse])
 def list_all_opportunities(
+    response: Response,
     skip: int = 0,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     category: Optional[str] = None,
     verified_only: bool = False,
@@ -604,7 +626,7 @@ def list_all_opportunities(
     if flagged_only:
         query = query.filter(Opportunity.risk_level != None)
 
-    return query.order_by(desc(Opportunity.created_at)).offset(skip).limit(limit).all()
+    return _paginate(OPPORTUNITIES_KEYSET, query, response, limit, cursor, skip)
 
 
 # ========================
@@ -745,67 +767,9 @@ def trigger_scrape(
             scraper = scraper_cls()
             raw = scraper.run()
 
-            saved = 0
-            skipped = 0
-            for opp_data in raw:
-                source = opp_data.get("source", "Unknown")
-                source_id = opp_data.get("source_id")
-                title = opp_data.get("title", "")
-                url = opp_data.get("url", "")
-
-                # Dedup
-                exists = False
-                if source_id:
-                    exists = db.query(Opportunity).filter(
-                        Opportunity.source_id == str(
-                            source_id), Opportunity.source == source
-                    ).first()
-                if not exists and url:
-                    exists = db.query(Opportunity).filter(
-                        Opportunity.url == url).first()
-                if not exists and title:
-                    exists = db.query(Opportunity).filter(
-                        Opportunity.title == title).first()
-
-                if exists:
-                    skipped += 1
-                    continue
-
-                slug = title.lower().replace(
-                    " ", "-").replace("'", "")[:80] if title else None
-                if slug:
-                    slug_exists = db.query(Opportunity).filter(
-                        Opportunity.slug == slug).first()
-                    if slug_exists:
-                        slug = f"{slug}-{source.lower()}"
-
-                opp = Opportunity(
-                    title=title,
-                    slug=slug,
-                    description=opp_data.get("description", ""),
-                    url=url,
-                    logo_url=opp_data.get("logo_url"),
-                    source=source,
-                    source_id=str(source_id) if source_id else None,
-                    source_url=opp_data.get("source_url", url),
-                    category=opp_data.get("category", "Hackathon"),
-                    chain=opp_data.get("chain", "Multi-chain"),
-                    tags=opp_data.get("tags", []),
-                    reward_pool=opp_data.get("reward_pool"),
-                    deadline=opp_data.get("deadline"),
-                    start_date=opp_data.get("start_date"),
-                    is_open=True,
-                    ai_score=70,
-                    trust_score=80,
-                    required_skills=opp_data.get("required_skills", []),
-                    is_verified=opp_data.get("is_verified", False),
-                )
-                db.add(opp)
-                try:
-                    db.commit()
-                    saved += 1
-                except Exception:
-                    db.rollback()
+            # Same path as the Celery scrapers: dedup, enrichment, snapshot refresh, cache bump, telemetry
+            saved = len(ingest_opportunities(db, raw, trigger="admin"))
+            skipped = len(raw) - saved
 
             results[name] = {"found": len(
                 raw), "saved": saved, "skipped": skipped}
@@ -819,9 +783,10 @@ def trigger_scrape(
     audit = AuditLog(
         user_id=current_user.id,
         action="trigger_scrape",
-        entity_type="scraper",
-        entity_id=body.source or "all",
-        details={"results": results, "total_saved": total_saved}
+        target_id=body.source or "all",
+        details=f"Admin {current_user.email} ran scrapers ({body.source or 'all'}): {total_saved} new",
+        type="data",
+        payload={"results": results, "total_saved": total_saved},
     )
     db.add(audit)
     db.commit()
@@ -836,30 +801,25 @@ def trigger_scrape(
 
 @router.get("/scraper/status")
 def scraper_status(
+    runs: int = Query(10, ge=0, le=100),
     db: Session = Depends(database.get_db),
     current_user=Depends(require_staff)
 ):
-    """Get scraper status and DB statistics."""
-    total = db.query(Opportunity).count()
-    by_source = db.query(
-        Opportunity.source, func.count(Opportunity.id)
-    ).group_by(Opportunity.source).all()
-
-    by_category = db.query(
-        Opportunity.category, func.count(Opportunity.id)
-    ).group_by(Opportunity.category).all()
+    """Get scraper status, DB statistics and the most recent ingestion runs."""
+    # Totals and breakdowns in one grouped query
+    counts = count_facets(db, ("source", "category", "verified", "open"))
 
-    verified = db.query(Opportunity).filter(
-        Opportunity.is_verified == True).count()
-    open_count = db.query(Opportunity).filter(
-        Opportunity.is_open == True).count()
+    recent_runs = db.query(IngestionRun).options(
+        selectinload(IngestionRun.sources)
+    ).order_by(desc(IngestionRun.started_at)).limit(runs).all()
 
     return {
-        "total_opportunities": total,
-        "verified": verified,
-        "open": open_count,
-        "by_source": {s: c for s, c in by_source},
-        "by_category": {c: cnt for c, cnt in by_category},
+        "total_opportunities": counts["total"],
+        "verified": counts["verified"].get("true", 0),
+        "open": counts["open"].get("true", 0),
+        "by_source": counts["source"],
+        "by_category": counts["category"],
+        "recent_runs": [serialize_run(run) for run in recent_runs],
         "available_scrapers": [
             "superteam", "dorahacks", "code4rena", "curated",
             "hackquest", "questbook"
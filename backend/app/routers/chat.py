@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from .. import database, schemas
 from ..models.chat import ChatMessage
 from ..models.opportunity import Opportunity
+from ..services import trending
 from .auth import get_current_user, check_subscription_clearance
 import os
 import httpx
@@ -314,6 +315,9 @@ async def send_message(
         related_opportunity_id=req.opportunity_id
     )
     db.add(ai_msg)
+    if req.opportunity_id:
+        # Here rather than next to user_msg: keeps the row lock out of the AI call
+        trending.record(db, req.opportunity_id, "chat")
     db.commit()
 
     return ChatResponse(role="ai", content=ai_content, session_id=session_id)
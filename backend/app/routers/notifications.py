@@ -1,19 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 import uuid
-from typing import List
+from typing import List, Optional
 from .. import database, schemas
 from ..models.notification import Notification
+from ..utils.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursor, Keyset
 from .auth import get_current_user
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+NOTIFICATIONS_KEYSET = Keyset(Notification.created_at, Notification.id)
+
 @router.get("", response_model=List[schemas.NotificationResponse])
-def get_notifications(db: Session = Depends(database.get_db), current_user = Depends(get_current_user)):
-    """List all notifications for current user, newest first."""
-    return db.query(Notification).filter(
-        Notification.user_id == current_user.id
-    ).order_by(Notification.created_at.desc()).limit(50).all()
+def get_notifications(
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(database.get_db),
+    current_user = Depends(get_current_user)
+):
+    """List notifications for current user, newest first (X-Next-Cursor for the next page)."""
+    query = db.query(Notification).filter(Notification.user_id == current_user.id)
+    try:
+        page = NOTIFICATIONS_KEYSET.paginate(query, limit, cursor=cursor)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 @router.get("/unread-count")
 def unread_count(db: Session = Depends(database.get_db), current_user = Depends(get_current_user)):
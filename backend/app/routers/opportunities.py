@@ -5,13 +5,34 @@ import os
 from sqlalchemy import or_, desc, func
 from typing import List, Optional
 from .. import database, schemas
-from ..models.opportunity import Opportunity
+from ..models.opportunity import Opportunity, recently_active
+from ..core.cache import ResponseCache
+from ..core.responses import FastJSONResponse
+from ..services import facets, full_text, projection
+from ..services.ranking import RankingService
+from ..utils.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursor, Keyset
+from ..utils.rewards import apply_reward
 from .auth import get_current_user, get_optional_user
 
 from ..models.enums import UserRole
 
 router = APIRouter(prefix="/opportunities", tags=["opportunities"])
 
+PRIORITY_PAGE_SIZE = int(os.getenv("PRIORITY_PAGE_SIZE", "100"))
+PRIORITY_MAX_PAGE_SIZE = 500
+
+LISTING_KEYSET = Keyset(recently_active, Opportunity.id, value=lambda opp: opp.updated_at or opp.created_at)
+
+VIEW_QUERY = Query("full", description="full, or summary for card views (no description / AI text)")
+FIELDS_QUERY = Query(None, description="Comma-separated fields to return instead of a view, e.g. title,deadline,reward")
+
+
+def _fieldset(view: str, fields: Optional[str]) -> tuple:
+    try:
+        return projection.resolve_fields(view, fields)
+    except projection.InvalidFields as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
 @router.post("", response_model=schemas.OpportunityResponse)
 def create_opportunity(
@@ -36,7 +57,7 @@ def create_opportunity(
         raise HTTPException(
             status_code=400, detail="Opportunity with this URL already exists.")
 
-    new_opp = Opportunity(**payload.model_dump())
+    new_opp = Opportunity(**apply_reward(payload.model_dump()))
     new_opp.source = "manual"
     new_opp.is_verified = True  # Admin uploads are pre-verified
 
@@ -56,6 +77,7 @@ def create_opportunity(
 
     db.commit()
     db.refresh(new_opp)
+    ResponseCache.bump("opportunities")  # also rebuilds the /priority ranking snapshot
     return new_opp
 
 
@@ -63,15 +85,19 @@ def create_opportunity(
 def read_opportunities(
     page: int = 1,
     skip: int = 0,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     category: Optional[str] = None,
     chain: Optional[str] = None,
+    view: str = VIEW_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
     db: Session = Depends(database.get_db)
 ):
     from datetime import datetime
-    # Open and not expired
-    query = db.query(Opportunity).filter(
-        Opportunity.is_open != False,
+    fieldset = _fieldset(view, fields)
+    # Open and not expired; only the columns behind the requested fields
+    query = db.query(*projection.columns_for(fieldset)).filter(
+        Opportunity.is_open == True,
         or_(
             Opportunity.deadline == None,
             Opportunity.deadline >= datetime.now()
@@ -79,7 +105,7 @@ def read_opportunities(
     )
 
     if category and category.lower() not in ("all", ""):
-        query = query.filter(Opportunity.category.ilike(category))
+        query = query.filter(func.lower(Opportunity.category) == category.lower())
 
     if chain and chain.lower() not in ("all", ""):
         if chain.lower() == "others":
@@ -87,12 +113,16 @@ def read_opportunities(
             query = query.filter(or_(Opportunity.chain == None, Opportunity.chain.in_(
                 ["", "Other", "Multi-chain"])))
         else:
-            query = query.filter(Opportunity.chain.ilike(chain))
+            query = query.filter(func.lower(Opportunity.chain) == chain.lower())
 
-    # Support both page-based and skip-based pagination
+    # Cursor pagination; page/skip offsets still work for older clients
     offset = max(0, (page - 1) * limit) if page > 1 else skip
-    recently_active = func.coalesce(Opportunity.updated_at, Opportunity.created_at)
-    return query.order_by(desc(recently_active)).offset(offset).limit(limit).all()
+    try:
+        result = LISTING_KEYSET.paginate(query, limit, cursor=cursor, offset=offset)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    headers = {NEXT_CURSOR_HEADER: result.next_cursor} if result.next_cursor else None
+    return FastJSONResponse(projection.project(result.items, fieldset), headers=headers)
 
 
 @router.get("/search", response_model=List[schemas.OpportunityResponse])
@@ -100,93 +130,110 @@ def search_opportunities(
     q: str = Query(..., min_length=3),
     page: int = 1,
     limit: int = 50,
+    view: str = VIEW_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
     db: Session = Depends(database.get_db)
 ):
     """
-    Full-text search on title, description, and tags.
+    Full-text search on title, description, and tags, best match first
+    (see services/full_text.py).
     """
     from datetime import datetime
-    search_term = f"%{q}%"
+    fieldset = _fieldset(view, fields)
     offset = max(0, (page - 1) * limit)
-    recently_active = func.coalesce(Opportunity.updated_at, Opportunity.created_at)
-    return db.query(Opportunity).filter(
-        Opportunity.is_open != False,
+    query = db.query(Opportunity).filter(
+        Opportunity.is_open == True,
         or_(
             Opportunity.deadline == None,
             Opportunity.deadline >= datetime.now()
         ),
-        or_(
-            Opportunity.title.ilike(search_term),
-            Opportunity.description.ilike(search_term),
-        )
-    ).order_by(desc(recently_active)).offset(offset).limit(limit).all()
+    )
+    rows = [opp for opp, _ in full_text.search(db, q, query=query, limit=limit, offset=offset)]
+    return FastJSONResponse(projection.project(rows, fieldset))
 
 
 @router.get("/trending", response_model=List[schemas.OpportunityResponse])
-def get_trending(db: Session = Depends(database.get_db)):
+def get_trending(
+    view: str = VIEW_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    db: Session = Depends(database.get_db)
+):
     """
-    Top 10 opportunities by AI Score.
+    Top 10 open opportunities by trending score: time-decayed tracker adds,
+    chat mentions, views and recency (see services/trending.py).
     """
-    return db.query(Opportunity).order_by(desc(Opportunity.ai_score)).limit(10).all()
+    from datetime import datetime
+    fieldset = _fieldset(view, fields)
+    rows = db.query(*projection.columns_for(fieldset)).filter(
+        Opportunity.is_open == True,
+        or_(Opportunity.deadline == None, Opportunity.deadline >= datetime.now()),
+    ).order_by(desc(Opportunity.trending_score), desc(Opportunity.id)).limit(10).all()
+    return FastJSONResponse(projection.project(rows, fieldset))
 
 
 @router.get("/priority", response_model=List[schemas.OpportunityResponse])
 def get_priority_stream(
+    cursor: Optional[str] = None,
+    limit: int = Query(PRIORITY_PAGE_SIZE, ge=1, le=PRIORITY_MAX_PAGE_SIZE),
+    view: str = VIEW_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
     db: Session = Depends(database.get_db),
     current_user=Depends(get_optional_user)
 ):
     """
     Personalized priority stream.
-    Returns ALL open/future opportunities sorted by AI score + user match bonus.
-    Fast: no per-item AI engine calls — uses pre-computed scores from DB.
+    Open/future opportunities sorted by AI score + user match bonus (see
+    services/ranking.py), one page at a time. When more remain, the
+    X-Next-Cursor header holds the `cursor` for the next page.
     """
-    from datetime import datetime
-
-    # Base query: open and not expired
-    query = db.query(Opportunity).filter(
-        Opportunity.is_open == True,
-        or_(
-            Opportunity.deadline == None,
-            Opportunity.deadline >= datetime.now()
+    fieldset = _fieldset(view, fields)
+    try:
+        page = RankingService.rank(
+            db,
+            skills=current_user.skills if current_user else None,
+            chains=current_user.preferred_chains if current_user else None,
+            cursor=cursor,
+            limit=limit,
         )
-    )
-
-    # Get ALL opportunities sorted by most recently added/updated
-    recently_active = func.coalesce(Opportunity.updated_at, Opportunity.created_at)
-    all_opps = query.order_by(desc(recently_active)).all()
-
-    if current_user:
-        user_skills = set(s.lower() for s in (current_user.skills or []))
-        user_chains = set(c.lower()
-                          for c in (current_user.preferred_chains or []))
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-        for opp in all_opps:
-            base_score = opp.ai_score or 0
-            # Ensure base_score is int
-            if isinstance(base_score, float):
-                base_score = int(round(base_score * 100)
-                                 ) if base_score < 1.0 else int(round(base_score))
-            match_bonus = 0
-            opp_tags = set(t.lower() for t in (opp.tags or []))
-            opp_reqs = set(r.lower() for r in (opp.required_skills or []))
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    if not page.items:
+        return FastJSONResponse([], headers=headers)
 
-            skill_matches = user_skills.intersection(opp_tags.union(opp_reqs))
-            match_bonus += len(skill_matches) * 5
-            if opp.chain and opp.chain.lower() in user_chains:
-                match_bonus += 10
-
-            opp.ai_score = min(base_score + match_bonus, 100)
-
-    return all_opps
+    rows = {row.id: row for row in db.query(*projection.columns_for(fieldset)).filter(
+        Opportunity.id.in_([item.id for item in page.items])).all()}
+    items = [item for item in page.items if item.id in rows]  # deleted since the snapshot was built
+    # Personalized score replaces the stored one in the response
+    content = projection.project([rows[item.id] for item in items], fieldset,
+                                 updates=[{"ai_score": item.score} for item in items])
+    return FastJSONResponse(content, headers=headers)
 
 
 @router.get("/testnets", response_model=List[schemas.OpportunityResponse])
-def get_testnets(db: Session = Depends(database.get_db)):
+def get_testnets(
+    view: str = VIEW_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    db: Session = Depends(database.get_db)
+):
     """
     Returns only testnet opportunities for the side widget.
     """
-    recently_active = func.coalesce(Opportunity.updated_at, Opportunity.created_at)
-    return db.query(Opportunity).filter(Opportunity.category == "Testnet").order_by(desc(recently_active)).limit(5).all()
+    fieldset = _fieldset(view, fields)
+    rows = db.query(*projection.columns_for(fieldset)).filter(
+        Opportunity.category == "Testnet").order_by(desc(recently_active)).limit(5).all()
+    return FastJSONResponse(projection.project(rows, fieldset))
+
+
+@router.get("/facets")
+def get_facets(db: Session = Depends(database.get_db)):
+    """
+    Open-opportunity counts by category, chain, source, difficulty and
+    deadline bucket (none / week / month / later), for filter badges. One
+    grouped query (services/facets.py); cached until opportunities change.
+    """
+    return facets.feed_facets(db)
 
 
 @router.get("/{id}", response_model=schemas.OpportunityResponse)
@@ -223,6 +270,7 @@ def delete_opportunity(
     ))
 
     db.commit()
+    ResponseCache.bump("opportunities")  # also rebuilds the /priority ranking snapshot
     return {"status": "success"}
 
 
@@ -253,4 +301,5 @@ def verify_opportunity(
     ))
 
     db.commit()
+    ResponseCache.bump("opportunities")
     return {"status": "success"}
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from ..database import get_db
 from ..models.opportunity import Opportunity
+from ..services import full_text
 from ..services.vector_db import VectorDBService
 
 router = APIRouter(
@@ -33,12 +34,13 @@ class SearchResponse(BaseModel):
 def search_ops(q: str, limit: int = 10, category: Optional[str] = None, chain: Optional[str] = None, db: Session = Depends(get_db)):
     """
     Search opportunities using semantic vector search powered by ChromaDB.
-    Falls back to SQL ILIKE search if VectorDB is unavailable or returns no results.
+    Falls back to full-text search if VectorDB is unavailable or returns no results.
     """
     if not q:
         return {"results": [], "total_found": 0, "query": ""}
 
     found_ids = []
+    similarity = {}
     vector_results = None
 
     # 1. Try Vector Search
@@ -58,7 +60,9 @@ def search_ops(q: str, limit: int = 10, category: Optional[str] = None, chain: O
     if vector_results and vector_results.get('ids') and vector_results['ids'][0]:
         # Chroma returns list of lists
         found_ids = vector_results['ids'][0]
-        # relevance_scores = vector_results['distances'][0] if 'distances' in vector_results else []
+        distances = (vector_results.get('distances') or [[]])[0]
+        # Cosine distance (0 = same direction) -> similarity
+        similarity = {oid: round(max(0.0, 1.0 - d), 4) for oid, d in zip(found_ids, distances)}
 
     results = []
 
@@ -79,17 +83,14 @@ def search_ops(q: str, limit: int = 10, category: Optional[str] = None, chain: O
                     description=o.description,
                     category=o.category,
                     chain=o.chain,
-                    relevance_score=0.9,  # Placeholder
+                    relevance_score=similarity.get(oid),
                     url=o.url
                 ))
 
-    # 3. Fallback to SQL Search if vector search yielded nothing or very few results
+    # 3. Fallback to full-text search if vector search yielded nothing or very few results
     if len(results) < 2:
-        print(f"[Search] Falling back to SQL search for '{q}'")
-        sql_query = db.query(Opportunity).filter(
-            Opportunity.title.ilike(
-                f"%{q}%") | Opportunity.description.ilike(f"%{q}%")
-        )
+        print(f"[Search] Falling back to full-text search for '{q}'")
+        sql_query = db.query(Opportunity)
         if category:
             sql_query = sql_query.filter(Opportunity.category == category)
         if chain:
@@ -100,10 +101,10 @@ def search_ops(q: str, limit: int = 10, category: Optional[str] = None, chain: O
             else:
                 sql_query = sql_query.filter(Opportunity.chain == chain)
 
-        sql_opps = sql_query.limit(limit).all()
+        sql_opps = full_text.search(db, q, query=sql_query, limit=limit)
 
         existing_ids = set(r.id for r in results)
-        for o in sql_opps:
+        for o, relevance in sql_opps:
             if str(o.id) not in existing_ids:
                 results.append(SearchResult(
                     id=str(o.id),
@@ -111,7 +112,7 @@ def search_ops(q: str, limit: int = 10, category: Optional[str] = None, chain: O
                     description=o.description,
                     category=o.category,
                     chain=o.chain,
-                    relevance_score=0.5,  # Lower score for keyword match
+                    relevance_score=relevance,
                     url=o.url
                 ))
 
@@ -6,6 +6,7 @@ import httpx
 import logging
 from typing import List
 from .. import database, models, schemas
+from ..services import trending
 from .auth import get_current_user
 
 logger = logging.getLogger(__name__)
@@ -90,6 +91,8 @@ def track_opportunity(
         if updated_profile:
             db.add(current_user)
 
+        trending.record(db, opp.id, "track")
+
     db.commit()
     db.refresh(tracking)
     return tracking
@@ -1,5 +1,5 @@
 from .user import UserResponse, UserCreate, UserUpdate
-from .opportunity import OpportunityResponse, OpportunityCreate
+from .opportunity import OpportunityResponse, OpportunityCreate, OpportunitySummary
 from .tracking import TrackedAppResponse, TrackedAppCreate, TrackedAppUpdate
 from .chat import ChatMessageResponse, ChatMessageCreate, ChatSessionResponse
 from .notification import NotificationResponse, NotificationCreate
@@ -3,6 +3,20 @@ from typing import List, Optional
 from datetime import datetime
 import uuid
 
+def coerce_ai_score(v) -> int:
+    """Coerce float ai_score from AI engine to int (0-100)."""
+    if v is None:
+        return 0
+    try:
+        v = float(v)
+    except (TypeError, ValueError):
+        return 0
+    # Handle raw similarity scores (0.0-1.0 range)
+    if 0 < v < 1.0:
+        return int(round(v * 100))
+    return int(round(max(0, min(v, 100))))
+
+
 class OpportunityBase(BaseModel):
     title: str
     url: str
@@ -42,17 +56,7 @@ class OpportunityResponse(OpportunityBase):
     @field_validator('ai_score', mode='before')
     @classmethod
     def coerce_ai_score_to_int(cls, v):
-        """Coerce float ai_score from AI engine to int (0-100)."""
-        if v is None:
-            return 0
-        try:
-            v = float(v)
-        except (TypeError, ValueError):
-            return 0
-        # Handle raw similarity scores (0.0-1.0 range)
-        if 0 < v < 1.0:
-            return int(round(v * 100))
-        return int(round(max(0, min(v, 100))))
+        return coerce_ai_score(v)
 
     ai_summary: Optional[str] = None
     ai_strategy: Optional[str] = None
@@ -114,3 +118,58 @@ class OpportunityResponse(OpportunityBase):
 
     class Config:
         from_attributes = True
+
+
+class OpportunitySummary(BaseModel):
+    """
+    Card view of an opportunity (`?view=summary` on the list endpoints): no
+    description / AI text. Built from a column projection, see
+    services/projection.py.
+    """
+    id: uuid.UUID
+    slug: Optional[str] = None
+    title: str
+    url: str
+    logo_url: Optional[str] = None
+
+    source: str
+    category: str
+    chain: str
+    tags: List[str] = []
+
+    reward_pool: Optional[str] = None
+    reward_token: Optional[str] = None
+    estimated_value_usd: Optional[float] = None
+    start_date: Optional[datetime] = None
+    deadline: Optional[datetime] = None
+    is_open: bool = True
+
+    ai_score: int = 0
+    win_probability: str = "Medium"
+    difficulty: str = "Intermediate"
+    trust_score: int = 70
+    is_verified: bool = False
+    created_at: Optional[datetime] = None
+
+    @field_validator('ai_score', mode='before')
+    @classmethod
+    def coerce_ai_score_to_int(cls, v):
+        return coerce_ai_score(v)
+
+    @computed_field
+    @property
+    def type(self) -> str:
+        return self.category
+
+    @computed_field
+    @property
+    def reward(self) -> Optional[str]:
+        return self.reward_pool
+
+    @computed_field
+    @property
+    def score(self) -> int:
+        return self.ai_score
+
+    class Config:
+        from_attributes = True
@@ -1,11 +1,51 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import os
+import time
+
+# Seconds a single source may take (fetch + parse) when run concurrently
+SCRAPER_TIMEOUT = float(os.getenv("SCRAPER_TIMEOUT", "90"))
+# Seconds the whole concurrent fetch phase may take
+SCRAPE_RUN_DEADLINE = float(os.getenv("SCRAPE_RUN_DEADLINE", "300"))
+
+
+def as_utc(value) -> Optional[datetime]:
+    """Naive-UTC datetime from a datetime or ISO string (scrapers mix aware and naive)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
 class BaseScraper(ABC):
+    # Per-source budget for run_concurrently; override for known-slow sources
+    timeout: float = SCRAPER_TIMEOUT
+    # Item fields (first present wins) that date an item for the watermark
+    watermark_fields: Tuple[str, ...] = ("posted_at", "start_date")
+
     def __init__(self, source_name: str):
         self.source_name = source_name
         self.results: List[Dict[str, Any]] = []
+        # Persisted watermark from the last successful ingest, set before run():
+        # {"source_id": str, "posted_at": datetime (naive UTC), "cursor": dict} or None
+        self.watermark: Optional[Dict[str, Any]] = None
+        # Scraper-specific paging state to persist with the next watermark
+        self.cursor: Dict[str, Any] = {}
+        # Computed by run(); saved only once the items are safely ingested
+        self.next_watermark: Optional[Dict[str, Any]] = None
+        # Seconds spent in fetch / parse during the last run(), for run telemetry
+        self.timings: Dict[str, float] = {}
+        self.finished = False
+        # Set by run_concurrently when it gave up on this run (its items were never delivered)
+        self.timed_out = False
 
     @abstractmethod
     def fetch(self) -> List[Dict[str, Any]]:
@@ -47,13 +87,91 @@ class BaseScraper(ABC):
     def run(self) -> List[Dict[str, Any]]:
         """
         orchestrates the scrape: fetch -> parse -> deduplicate -> return
+        fetch/parse may consult self.watermark to skip items already delivered.
         """
         print(f"[{self.source_name}] Starting scrape...")
+        self.next_watermark = None
+        self.cursor = dict((self.watermark or {}).get("cursor") or {})
+        self.timings = {}
+        self.finished = False
+        self.timed_out = False
+        started = time.monotonic()
         try:
             raw = self.fetch()
+            self.timings["fetch"] = time.monotonic() - started
             parsed = self.parse(raw)
+            self.timings["parse"] = time.monotonic() - started - self.timings["fetch"]
             print(f"[{self.source_name}] Found {len(parsed)} items.")
+            self.next_watermark = self.advance_watermark(parsed)
             return parsed
         except Exception as e:
             print(f"[{self.source_name}] Error: {str(e)}")
             return []
+        finally:
+            self.finished = True
+
+    def is_known(self, posted_at) -> bool:
+        """True if an item posted at `posted_at` is not newer than the watermark."""
+        mark = (self.watermark or {}).get("posted_at")
+        posted_at = as_utc(posted_at)
+        return bool(mark and posted_at and posted_at <= as_utc(mark))
+
+    def advance_watermark(self, items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Watermark covering the current one plus `items`: the newest item date
+        (see watermark_fields) that is not in the future, and the current cursor.
+        """
+        current = self.watermark or {}
+        newest, newest_id = as_utc(current.get("posted_at")), current.get("source_id")
+        now = datetime.utcnow()
+        for item in items:
+            posted_at = as_utc(next((item[f] for f in self.watermark_fields if item.get(f)), None))
+            if posted_at and posted_at <= now and (newest is None or posted_at > newest):
+                newest, newest_id = posted_at, item.get("source_id")
+        if newest is None and not self.cursor:
+            return None
+        return {"source_id": newest_id, "posted_at": newest, "cursor": self.cursor or None}
+
+
+def run_concurrently(
+    scrapers: List[BaseScraper],
+    deadline: float = SCRAPE_RUN_DEADLINE,
+) -> Iterator[Tuple[BaseScraper, List[Dict[str, Any]]]]:
+    """
+    Run every scraper's fetch -> parse in a thread pool and yield (scraper, items)
+    as each one finishes, so the caller can ingest a source while the others are
+    still fetching. A source that exceeds its own `timeout` or the overall
+    `deadline` is given up on and yields no items (its thread is left to finish
+    in the background, bounded by the scraper's own HTTP timeouts).
+    """
+    if not scrapers:
+        return
+
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(scrapers), thread_name_prefix="scraper")
+    futures = {executor.submit(scraper.run): scraper for scraper in scrapers}
+    cutoffs = {f: started + min(s.timeout, deadline) for f, s in futures.items()}
+    pending = set(futures)
+    try:
+        while pending:
+            wait_for = max(0.0, min(cutoffs[f] for f in pending) - time.monotonic())
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                scraper = futures[future]
+                try:
+                    yield scraper, future.result()
+                except Exception as e:
+                    # run() already catches fetch/parse errors; this is a last resort
+                    print(f"[{scraper.source_name}] Error: {e}")
+                    yield scraper, []
+
+            now = time.monotonic()
+            for future in [f for f in pending if cutoffs[f] <= now]:
+                pending.discard(future)
+                scraper = futures[future]
+                scraper.timed_out = True
+                print(f"[{scraper.source_name}] Timed out after {now - started:.0f}s, skipping.")
+                yield scraper, []
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
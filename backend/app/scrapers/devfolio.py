@@ -7,11 +7,11 @@ Falls back to curated verified hackathon data if live fetch fails.
 
 import httpx
 import json
-import re
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.scrapers.base import BaseScraper
+from app.utils.rewards import reward_usd
 
 logger = logging.getLogger(__name__)
 
@@ -187,12 +187,4 @@ class DevfolioScraper(BaseScraper):
             return None
 
     def _estimate_value(self, prize_str: str) -> Optional[float]:
-        if not prize_str:
-            return None
-        try:
-            nums = re.findall(r'[\d,]+', str(prize_str).replace("$", ""))
-            if nums:
-                return float(nums[0].replace(",", ""))
-        except Exception:
-            pass
-        return None
+        return reward_usd(prize_str)
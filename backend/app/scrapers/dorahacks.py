@@ -7,10 +7,10 @@ then falls back to verified curated hackathon data.
 import httpx
 import json
 import logging
-import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.scrapers.base import BaseScraper
+from app.utils.rewards import reward_usd
 
 logger = logging.getLogger(__name__)
 
@@ -243,12 +243,4 @@ class DoraHacksScraper(BaseScraper):
         return "Multi-chain"
 
     def _estimate_value(self, prize_str: str) -> Optional[float]:
-        if not prize_str:
-            return None
-        try:
-            nums = re.findall(r'[\d,]+', prize_str.replace("$", ""))
-            if nums:
-                return float(nums[0].replace(",", ""))
-        except Exception:
-            pass
-        return None
+        return reward_usd(prize_str)
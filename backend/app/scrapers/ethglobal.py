@@ -12,6 +12,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from dateutil.parser import parse as dateparse
 from app.scrapers.base import BaseScraper
+from app.utils.rewards import reward_usd
 
 logger = logging.getLogger(__name__)
 
@@ -248,12 +249,4 @@ class ETHGlobalScraper(BaseScraper):
             return None
 
     def _estimate_value(self, prize_str: str) -> Optional[float]:
-        if not prize_str:
-            return None
-        try:
-            nums = re.findall(r'[\d,]+', prize_str.replace("$", ""))
-            if nums:
-                return float(nums[0].replace(",", ""))
-        except Exception:
-            pass
-        return None
+        return reward_usd(prize_str)
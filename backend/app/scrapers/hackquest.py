@@ -6,11 +6,11 @@ Falls back to curated verified hackathon data if live sources fail.
 
 import httpx
 import json
-import re
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.scrapers.base import BaseScraper
+from app.utils.rewards import reward_usd
 
 logger = logging.getLogger(__name__)
 
@@ -252,12 +252,4 @@ class HackQuestScraper(BaseScraper):
             return None
 
     def _estimate_value(self, prize_str: str) -> Optional[float]:
-        if not prize_str:
-            return None
-        try:
-            nums = re.findall(r'[\d,]+', str(prize_str).replace("$", ""))
-            if nums:
-                return float(nums[0].replace(",", ""))
-        except Exception:
-            pass
-        return None
+        return reward_usd(prize_str)
@@ -2,6 +2,11 @@ import httpx
 from typing import List, Dict, Any
 from datetime import datetime
 from .base import BaseScraper
+from ..utils.text_processing import load_vocabulary, vocabulary_matcher
+import time
+
+# Seconds after which an empty `before=` page is re-checked without the anchor
+ANCHOR_MAX_AGE = 3 * 24 * 3600
 
 class RedditScraper(BaseScraper):
     def __init__(self):
@@ -19,12 +24,29 @@ class RedditScraper(BaseScraper):
         with httpx.Client(timeout=10.0, headers=headers) as client:
             for sub in self.subreddits:
                 try:
-                    url = f"{self.base_url}/{sub}/new.json?limit=25"
-                    response = client.get(url)
-                    
+                    # Only posts newer than the newest one already ingested from this sub
+                    anchor = self.cursor.get(sub) or {}
+                    params = {"limit": 25}
+                    if anchor.get("before"):
+                        params["before"] = anchor["before"]
+                    url = f"{self.base_url}/{sub}/new.json"
+                    response = client.get(url, params=params)
+
                     if response.status_code == 200:
                         data = response.json()
                         posts = data.get("data", {}).get("children", [])
+                        if not posts and anchor.get("before") and self._anchor_expired(anchor):
+                            # A deleted anchor post makes `before` return nothing forever;
+                            # fall back to the plain listing (parse drops what we have seen)
+                            response = client.get(url, params={"limit": 25})
+                            if response.status_code == 200:
+                                posts = response.json().get("data", {}).get("children", [])
+                        if posts:
+                            newest = posts[0].get("data", {})
+                            self.cursor[sub] = {
+                                "before": newest.get("name"),
+                                "created_utc": max(newest.get("created_utc", 0), anchor.get("created_utc", 0)),
+                            }
                         for post in posts:
                             # Attach subreddit context
                             post_data = post.get("data", {})
@@ -37,18 +59,20 @@ class RedditScraper(BaseScraper):
                     
         return raw_results
 
+    @staticmethod
+    def _anchor_expired(anchor: Dict[str, Any]) -> bool:
+        """Anchor post older than ANCHOR_MAX_AGE: treat an empty `before` page as suspect."""
+        return time.time() - anchor.get("created_utc", 0) > ANCHOR_MAX_AGE
+
     def parse(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         parsed_items = []
         unique_ids = set()
+        known = (self.watermark or {}).get("cursor") or {}
         
-        # Keywords to identify opportunities vs just discussion
-        opportunity_patterns = {
-            "Grant": ["grants", "funding", "program", "apply for", "developer grant"],
-            "Hackathon": ["hackathon", "buidl", "code challenge", "prize pool"],
-            "Bounty": ["bounty", "bug bounty", "issue", "reward for"],
-            "Airdrop": ["airdrop", "alpha", "eligible", "snapshot"],
-            "Testnet": ["testnet", "incentivized", "node operator", "validator program"]
-        }
+        # Keywords to identify opportunities vs just discussion (substring match, in priority order)
+        categories = list(load_vocabulary()["opportunity_categories"])
+        category_matcher = vocabulary_matcher("opportunity_categories", word_boundaries=False)
+        action_matcher = vocabulary_matcher("action_phrases", word_boundaries=False)
         
         for post in raw_data:
             pid = post.get("id")
@@ -58,22 +82,23 @@ class RedditScraper(BaseScraper):
             title = post.get("title", "")
             selftext = post.get("selftext", "")
             subreddit = post.get("_subreddit", "")
+
+            # Not newer than the newest post already ingested from this sub
+            if post.get("created_utc", 0) <= known.get(subreddit, {}).get("created_utc", 0):
+                continue
             
             combined_text = (title + " " + selftext).lower()
             
             # Identify category and verify it's a real opportunity
-            found_category = None
-            for cat, keywords in opportunity_patterns.items():
-                if any(k in combined_text for k in keywords):
-                    found_category = cat
-                    break
+            found = category_matcher.label_set(combined_text)
+            found_category = next((cat for cat in categories if cat in found), None)
             
             if not found_category:
                 continue
 
             # Bonus score for specific actionable phrases
             action_bonus = 0
-            if any(x in combined_text for x in ["apply now", "register", "deadline", "prize", "submit"]):
+            if action_matcher.terms_in(combined_text):
                 action_bonus = 15
             
             unique_ids.add(pid)
@@ -23,6 +23,9 @@ HEADERS = {
 
 
 class SuperteamScraper(BaseScraper):
+    # startDate can be later than publication; only publishedAt orders listings
+    watermark_fields = ("posted_at",)
+
     def __init__(self):
         super().__init__("Superteam")
         self.base_url = "https://earn.superteam.fun"
@@ -137,8 +140,14 @@ class SuperteamScraper(BaseScraper):
 
     def parse(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         opportunities = []
+        skipped = 0
         for listing in raw_data:
             try:
+                # Published before the last ingested listing: already seen
+                if self.is_known(self._parse_date(listing.get("publishedAt"))):
+                    skipped += 1
+                    continue
+
                 listing_type = (listing.get("type") or "bounty").lower()
                 category_map = {
                     "bounty": "Bounty",
@@ -184,6 +193,7 @@ class SuperteamScraper(BaseScraper):
                     "source_id": f"superteam-{listing.get('id', slug)}",
                     "reward_pool": self._format_reward(listing),
                     "estimated_value_usd": self._estimate_value(listing),
+                    "posted_at": self._parse_date(listing.get("publishedAt")),
                     "start_date": self._parse_date(listing.get("publishedAt") or listing.get("startDate")),
                     "deadline": self._parse_date(listing.get("deadline")),
                     "chain": "Solana",
@@ -201,7 +211,7 @@ class SuperteamScraper(BaseScraper):
                 logger.error(f"Superteam parse error: {e}")
                 continue
 
-        logger.info(f"Superteam: parsed {len(opportunities)} opportunities")
+        logger.info(f"Superteam: parsed {len(opportunities)} opportunities ({skipped} already seen)")
         return opportunities
 
     def _format_reward(self, listing: dict) -> str:
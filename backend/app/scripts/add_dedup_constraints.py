@@ -0,0 +1,88 @@
+"""
+Add content_hash and the ingestion unique indexes to the opportunities table.
+Run this ONCE before deploying the set-based dedup index.
+
+Existing duplicates block the unique indexes; they are listed so they can be
+merged or deleted by hand, then re-run the script.
+"""
+
+from app.database import engine
+from app.utils.text_processing import generate_content_hash
+from sqlalchemy import text
+
+BACKFILL_CHUNK = 1000
+
+
+def _report_duplicates(conn):
+    dupes = conn.execute(text("""
+        SELECT source, source_id, COUNT(*) FROM opportunities
+        WHERE source_id IS NOT NULL
+        GROUP BY source, source_id HAVING COUNT(*) > 1
+    """)).fetchall()
+    for source, source_id, count in dupes:
+        print(f"   duplicate (source, source_id): ({source}, {source_id}) x{count}")
+    dupes = conn.execute(text("""
+        SELECT url, COUNT(*) FROM opportunities
+        WHERE url <> ''
+        GROUP BY url HAVING COUNT(*) > 1
+    """)).fetchall()
+    for url, count in dupes:
+        print(f"   duplicate url: {url} x{count}")
+
+
+def migrate():
+    with engine.connect() as conn:
+        print("Adding content_hash column...")
+        if engine.dialect.name == "sqlite":
+            columns = [row[1] for row in conn.execute(text("PRAGMA table_info(opportunities)"))]
+            if "content_hash" not in columns:
+                conn.execute(text("ALTER TABLE opportunities ADD COLUMN content_hash VARCHAR"))
+        else:
+            conn.execute(text("ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS content_hash VARCHAR;"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_opportunities_content_hash ON opportunities (content_hash);"))
+        conn.commit()
+
+        # Backfill from the stored fields (best effort: stored titles may be AI-refined)
+        print("Backfilling content_hash...")
+        filled = 0
+        while True:
+            rows = conn.execute(text(
+                "SELECT id, title, description, source FROM opportunities "
+                "WHERE content_hash IS NULL LIMIT :n"
+            ), {"n": BACKFILL_CHUNK}).fetchall()
+            if not rows:
+                break
+            conn.execute(
+                text("UPDATE opportunities SET content_hash = :h WHERE id = :id"),
+                [
+                    {"id": r.id, "h": generate_content_hash(f"{r.title or ''}{r.description or ''}{r.source or ''}")}
+                    for r in rows
+                ],
+            )
+            conn.commit()
+            filled += len(rows)
+        print(f"   {filled} rows backfilled.")
+
+        print("Creating unique indexes...")
+        try:
+            conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_opportunities_source_source_id "
+                "ON opportunities (source, source_id);"
+            ))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_opportunities_url "
+                "ON opportunities (url) WHERE url <> '';"
+            ))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"❌ Unique index creation failed: {e}")
+            print("Resolve these duplicates, then re-run:")
+            _report_duplicates(conn)
+            return
+
+        print("Schema migration complete.")
+
+
+if __name__ == "__main__":
+    migrate()
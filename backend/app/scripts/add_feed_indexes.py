@@ -0,0 +1,52 @@
+"""
+Create the partial / expression indexes behind the public opportunity feed
+(see the end of app/models/opportunity.py) on an existing database. Safe to
+re-run. On a large Postgres table prefer running the DDL by hand with
+CREATE INDEX CONCURRENTLY (print it with --sql).
+
+    python -m app.scripts.add_feed_indexes
+    python -m app.scripts.add_feed_indexes --sql
+"""
+
+import argparse
+
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from app.database import engine
+from app.models.opportunity import FEED_INDEXES, Opportunity
+
+
+def feed_indexes():
+    indexes = {index.name: index for index in Opportunity.__table__.indexes}
+    return [indexes[name] for name in FEED_INDEXES]
+
+
+def migrate(bind=None, verbose: bool = True):
+    bind = bind or engine
+    with bind.connect() as conn:
+        for index in feed_indexes():
+            if verbose:
+                print(f"Creating {index.name}...")
+            conn.execute(CreateIndex(index, if_not_exists=True))
+        conn.commit()
+    if verbose:
+        print("Feed indexes in place.")
+
+
+def drop(bind=None):
+    """Remove them again (benchmarks compare plans with and without)."""
+    with (bind or engine).connect() as conn:
+        for index in feed_indexes():
+            conn.execute(DropIndex(index, if_exists=True))
+        conn.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sql", action="store_true", help="print the DDL instead of running it")
+    args = parser.parse_args()
+    if args.sql:
+        for index in feed_indexes():
+            print(str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect)).strip() + ";")
+    else:
+        migrate()
@@ -0,0 +1,27 @@
+"""
+Create the full-text search index on opportunities and index existing rows.
+Run this ONCE per database (the API does not create it at startup): the
+backfill rewrites every row's search_vector. Safe to re-run. Running API
+workers start using it within FULL_TEXT_RECHECK_SECONDS, no restart needed.
+
+    python -m app.scripts.add_fulltext_index
+"""
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.services.full_text import FullTextIndex
+
+
+def migrate():
+    print(f"Installing full-text index on {engine.dialect.name}...")
+    if not FullTextIndex.install(engine):
+        print(f"❌ No full-text support for {engine.dialect.name}; search keeps using ILIKE.")
+        return
+    with engine.connect() as conn:
+        total = conn.execute(text("SELECT COUNT(*) FROM opportunities")).scalar()
+    print(f"Full-text index ready ({total} opportunities indexed).")
+
+
+if __name__ == "__main__":
+    migrate()
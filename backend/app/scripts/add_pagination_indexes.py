@@ -0,0 +1,37 @@
+"""
+Create the (sort key, id) indexes behind keyset pagination on existing tables
+(create_all only adds indexes when it creates the table). Safe to re-run.
+
+    python -m app.scripts.add_pagination_indexes
+"""
+
+from sqlalchemy.schema import CreateIndex
+
+from app.database import engine
+from app.models.billing import SubscriptionPayment
+from app.models.notification import Notification
+from app.models.opportunity import Opportunity
+from app.models.user import User
+
+INDEXES = {
+    Opportunity: ("ix_opportunities_recently_active_id", "ix_opportunities_created_at_id"),
+    User: ("ix_users_created_at_id",),
+    SubscriptionPayment: ("ix_subscription_payments_created_at_id",),
+    Notification: ("ix_notifications_user_created_at_id",),
+}
+
+
+def migrate():
+    with engine.connect() as conn:
+        for model, names in INDEXES.items():
+            indexes = {index.name: index for index in model.__table__.indexes}
+            for name in names:
+                print(f"Creating {name}...")
+                # IF NOT EXISTS rather than checkfirst: expression indexes are not reflected
+                conn.execute(CreateIndex(indexes[name], if_not_exists=True))
+        conn.commit()
+    print("Pagination indexes in place.")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,38 @@
+"""
+Add opportunities.trending_score and its index to an existing database, then
+score every opportunity from its history (services/trending.py). Safe to
+re-run; re-running recomputes the scores.
+
+    python -m app.scripts.add_trending_score
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+from app.database import SessionLocal, engine
+from app.models.opportunity import Opportunity
+from app.services import trending
+
+INDEX = "ix_opportunities_open_trending"
+
+
+def migrate():
+    columns = {column["name"] for column in inspect(engine).get_columns("opportunities")}
+    with engine.connect() as conn:
+        if "trending_score" not in columns:
+            print("Adding trending_score column...")
+            conn.execute(text("ALTER TABLE opportunities ADD COLUMN trending_score FLOAT NOT NULL DEFAULT 0"))
+        print(f"Creating {INDEX}...")
+        index = next(index for index in Opportunity.__table__.indexes if index.name == INDEX)
+        conn.execute(CreateIndex(index, if_not_exists=True))
+        conn.commit()
+
+    db = SessionLocal()
+    try:
+        print(f"Scored {trending.rebuild(db)} opportunities.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,70 @@
+"""
+Backfill estimated_value_usd / reward_token from reward_pool for opportunities
+stored before rewards were normalized at ingest. Processes the table in keyset
+chunks, one bulk UPDATE + commit per chunk. Safe to re-run.
+
+    python -m app.scripts.backfill_reward_values          # rows without a value
+    python -m app.scripts.backfill_reward_values --all    # recompute every row (e.g. new price table)
+"""
+
+import argparse
+
+from sqlalchemy import bindparam, or_
+
+from app.database import SessionLocal
+from app.models.opportunity import Opportunity
+from app.utils.rewards import normalize_reward
+
+CHUNK = 1000
+
+
+def backfill(recompute_all: bool = False, chunk_size: int = CHUNK, db=None):
+    own_session = db is None
+    db = db or SessionLocal()
+    table = Opportunity.__table__
+    update = (
+        table.update()
+        .where(table.c.id == bindparam("_id"))
+        .values(estimated_value_usd=bindparam("_usd"), reward_token=bindparam("_token"))
+    )
+    try:
+        scanned = updated = 0
+        last_id = None
+        while True:
+            query = db.query(
+                Opportunity.id, Opportunity.reward_pool, Opportunity.reward_token, Opportunity.estimated_value_usd
+            ).order_by(Opportunity.id)
+            if not recompute_all:
+                query = query.filter(or_(Opportunity.estimated_value_usd == None, Opportunity.estimated_value_usd == 0))
+            if last_id is not None:
+                query = query.filter(Opportunity.id > last_id)
+            rows = query.limit(chunk_size).all()
+            if not rows:
+                break
+
+            changes = []
+            for row in rows:
+                usd, token = normalize_reward(row.reward_pool, row.reward_token)
+                usd = usd if usd is not None else row.estimated_value_usd
+                token = row.reward_token or token
+                if usd != row.estimated_value_usd or token != row.reward_token:
+                    changes.append({"_id": row.id, "_usd": usd, "_token": token})
+            if changes:
+                db.execute(update, changes)
+                db.commit()
+
+            scanned += len(rows)
+            updated += len(changes)
+            last_id = rows[-1].id
+            print(f"   {scanned} scanned, {updated} updated...")
+        print(f"Reward backfill complete: {updated} of {scanned} rows updated.")
+    finally:
+        if own_session:
+            db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--all", action="store_true", help="recompute rows that already have a value")
+    args = parser.parse_args()
+    backfill(recompute_all=args.all)
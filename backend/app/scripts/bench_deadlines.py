@@ -0,0 +1,116 @@
+"""
+Micro-benchmarks for deadline extraction (app/utils/deadlines.py).
+
+    python -m app.scripts.bench_deadlines                  # synthetic corpus
+    python -m app.scripts.bench_deadlines --fixtures fixtures/scrapes/sample --repeat 50
+    python -m app.scripts.bench_deadlines --from-db        # descriptions of stored opportunities
+
+Reports texts/s for the previous implementation (patterns compiled and
+dateutil imported per call), the current one with a cold and a warm parse
+cache, and the batch API.
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import datetime
+
+from app.utils import deadlines
+
+
+def legacy_extract_deadline(text: str):
+    """extract_deadline as it was before app/utils/deadlines.py, kept as the baseline."""
+    if not text: return None
+    patterns = [
+        r"(?:deadline|closing|apply by|ends|until):?\s*([a-zA-Z]{3,9}\s\d{1,2},?\s?\d{4})",
+        r"(?:deadline|closing|apply by|ends|until):?\s*(\d{1,2}/\d{1,2}/\d{4})",
+        r"(?:deadline|closing|apply by|ends|until):?\s*(\d{4}-\d{2}-\d{2})",
+        r"due:?\s*([a-zA-Z]{3,9}\s\d{1,2})",
+    ]
+    for pat in patterns:
+        match = re.search(pat, text, re.IGNORECASE)
+        if match:
+            try:
+                from dateutil import parser
+                return parser.parse(match.group(1)).date().isoformat()
+            except Exception:
+                pass
+    return None
+
+
+def synthetic_corpus(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    months = ["January", "February", "March", "April", "May", "June", "July", "August", "September"]
+    shapes = [
+        lambda: f"Deadline: {rng.choice(months)} {rng.randint(1, 28)}, 2026",
+        lambda: f"Apply by {rng.randint(1, 12)}/{rng.randint(1, 28)}/2026",
+        lambda: f"Ends: 2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        lambda: f"Submissions close soon, ends in {rng.randint(1, 20)} days",
+        lambda: "No date mentioned in this one at all",
+    ]
+    filler = "Build on Solana or Ethereum, ship an open-source tool and win prizes from the pool. " * 4
+    return [f"{filler}{rng.choice(shapes)()}. Starts {rng.choice(months)} 1, 2026." for _ in range(n)]
+
+
+def _texts_from_fixtures(directory) -> list:
+    from app.scrapers.replay import load_replay_scrapers
+
+    return [
+        f"{item.get('description') or ''} {item.get('title') or ''}"
+        for scraper in load_replay_scrapers(directory)
+        for item in scraper.recorded
+    ]
+
+
+def _texts_from_db(limit: int) -> list:
+    from app.database import SessionLocal
+    from app.models.opportunity import Opportunity
+
+    db = SessionLocal()
+    try:
+        rows = db.query(Opportunity.description, Opportunity.title).limit(limit).all()
+        return [f"{d or ''} {t or ''}" for d, t in rows]
+    finally:
+        db.close()
+
+
+def _rate(fn, texts) -> float:
+    started = time.perf_counter()
+    fn(texts)
+    return len(texts) / (time.perf_counter() - started)
+
+
+def run(texts: list) -> dict:
+    now = datetime.utcnow()
+    results = {"texts": len(texts)}
+    results["legacy"] = _rate(lambda ts: [legacy_extract_deadline(t) for t in ts], texts)
+    deadlines.parse_date.cache_clear()
+    results["cold_cache"] = _rate(lambda ts: [deadlines.extract_deadline(t, now) for t in ts], texts)
+    results["warm_cache"] = _rate(lambda ts: [deadlines.extract_deadline(t, now) for t in ts], texts)
+    results["batch_dates"] = _rate(lambda ts: deadlines.extract_dates(ts, now), texts)
+    info = deadlines.parse_date.cache_info()
+    results["cache"] = f"{info.hits} hits / {info.misses} misses, {info.currsize} distinct date strings"
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=20000, help="size of the synthetic corpus")
+    parser.add_argument("--fixtures", help="use descriptions from a scrape fixture directory")
+    parser.add_argument("--from-db", action="store_true", help="use descriptions of stored opportunities")
+    parser.add_argument("--repeat", type=int, default=1, help="repeat the corpus this many times")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        corpus = _texts_from_fixtures(args.fixtures)
+    elif args.from_db:
+        corpus = _texts_from_db(args.texts)
+    else:
+        corpus = synthetic_corpus(args.texts)
+    results = run(corpus * max(1, args.repeat))
+
+    print(f"{results['texts']} texts")
+    for name in ("legacy", "cold_cache", "warm_cache", "batch_dates"):
+        print(f"  {name:<12}{results[name]:>12,.0f} texts/s  ({results[name] / results['legacy']:.1f}x legacy)")
+    print(f"  parse cache: {results['cache']}")
@@ -0,0 +1,167 @@
+"""
+EXPLAIN plans and timings for the feed queries with and without the feed
+indexes (app/scripts/add_feed_indexes.py).
+
+    python -m app.scripts.bench_feed_indexes                        # temporary SQLite, 100k seeded rows
+    python -m app.scripts.bench_feed_indexes --rows 20000 --repeat 20
+    python -m app.scripts.bench_feed_indexes --database-url postgresql://... --seed
+
+Without --database-url the rows are seeded into a throwaway SQLite file. With
+one, rows are only inserted when --seed is given (do not point it at
+production: the indexes are dropped and recreated).
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, insert, or_, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app import models  # noqa: F401  (registers all tables)
+from app.models.opportunity import Opportunity, recently_active
+from app.scripts.add_feed_indexes import drop, migrate
+
+# The last category / chain is rare (~1%), like the long tail of real filters
+CATEGORIES = ["Grant", "Airdrop", "Hackathon", "Bounty", "Testnet", "Ambassador"]
+CHAINS = ["Ethereum", "Solana", "Base", "Arbitrum", "Polygon", "Multi-chain", "Sui"]
+
+
+def _pick(rng: random.Random, values: list) -> str:
+    return values[-1] if rng.random() < 0.01 else rng.choice(values[:-1])
+
+
+def seed(engine, n: int, seed: int = 0, batch: int = 5000):
+    """n opportunities: ~80% open, a third with a deadline (some already passed)."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    table = Opportunity.__table__
+    with engine.begin() as conn:
+        for start in range(0, n, batch):
+            rows = []
+            for i in range(start, min(start + batch, n)):
+                created = now - timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+                deadline = None
+                if rng.random() < 0.35:
+                    deadline = now + timedelta(days=rng.randint(-60, 120))
+                rows.append({
+                    "id": uuid.UUID(int=rng.getrandbits(128)),
+                    "title": f"Opportunity {i}",
+                    "slug": f"opportunity-{i}",
+                    "description": "Build something useful and win prizes.",
+                    "url": f"https://example.com/{i}",
+                    "source": "bench",
+                    "source_id": str(i),
+                    "category": _pick(rng, CATEGORIES),
+                    "chain": _pick(rng, CHAINS),
+                    "tags": [],
+                    "required_skills": [],
+                    "deadline": deadline,
+                    "is_open": rng.random() < 0.8,
+                    "ai_score": rng.randint(0, 100),
+                    "created_at": created,
+                    "updated_at": created + timedelta(days=1) if rng.random() < 0.3 else None,
+                })
+            conn.execute(insert(table), rows)
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+        conn.commit()
+
+
+def feed_queries(db: Session, now: datetime, legacy: bool = False) -> dict:
+    """
+    The hot read queries, built the way the routers build them. legacy: as they
+    were before the feed indexes (`is_open != False`, ilike filters).
+    """
+    is_open = Opportunity.is_open != False if legacy else Opportunity.is_open == True
+    live = [is_open, or_(Opportunity.deadline == None, Opportunity.deadline >= now)]
+    if legacy:
+        same = lambda column, value: column.ilike(value)
+    else:
+        same = lambda column, value: func.lower(column) == value.lower()
+    page = lambda q: q.order_by(recently_active.desc(), Opportunity.id.desc()).limit(51)
+    return {
+        "feed page": page(db.query(Opportunity).filter(*live)),
+        "category feed": page(db.query(Opportunity).filter(*live, same(Opportunity.category, "Ambassador"))),
+        "chain feed": page(db.query(Opportunity).filter(*live, same(Opportunity.chain, "Sui"))),
+        "closing soon count": db.query(func.count(Opportunity.id)).filter(
+            is_open, Opportunity.deadline >= now, Opportunity.deadline <= now + timedelta(days=7)),
+    }
+
+
+def explain(db: Session, query) -> str:
+    dialect = db.get_bind().dialect
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    if dialect.name == "sqlite":
+        rows = db.execute(text("EXPLAIN QUERY PLAN " + sql)).all()
+        return "\n".join(row[-1] for row in rows)
+    rows = db.execute(text("EXPLAIN (ANALYZE, BUFFERS) " + sql)).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def timed(query, repeat: int) -> float:
+    """Median ms per execution."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        query.all()
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)[len(samples) // 2]
+
+
+def run(engine, repeat: int) -> dict:
+    now = datetime.now()
+    results = {}
+    for label, legacy in (("before", True), ("after", False)):
+        if legacy:
+            drop(engine)
+        else:
+            migrate(engine, verbose=False)
+        with Session(engine) as db:
+            if engine.dialect.name == "sqlite":
+                db.execute(text("ANALYZE"))
+            for name, query in feed_queries(db, now, legacy).items():
+                print(f"--- {name} ({label}) ---")
+                print(explain(db, query))
+                results.setdefault(name, {})[label] = timed(query, repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--database-url", help="benchmark this database instead of a temporary SQLite file")
+    parser.add_argument("--seed", action="store_true", help="insert --rows rows into --database-url first")
+    args = parser.parse_args()
+
+    path = None
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        engine = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(bind=engine)
+        if not args.database_url or args.seed:
+            print(f"Seeding {args.rows} opportunities...")
+            seed(engine, args.rows)
+
+        results = run(engine, args.repeat)
+        print(f"\n{'query':<22}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+        for name, r in results.items():
+            print(f"{name:<22}{r['before']:>12.2f}{r['after']:>12.2f}{r['before'] / max(r['after'], 1e-6):>9.1f}x")
+    finally:
+        engine.dispose()
+        if path:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
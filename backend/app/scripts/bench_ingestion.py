@@ -0,0 +1,146 @@
+"""
+Offline ingestion benchmark: replays recorded scrapes (see record_scrapes.py)
+through IngestionPipeline against a local database and a fake AI engine, and
+reports throughput, per-stage latency percentiles and SQL query counts.
+
+    python -m app.scripts.bench_ingestion --fixtures fixtures/scrapes/sample
+    python -m app.scripts.bench_ingestion --latency-ms 800 --jitter-ms 400 --error-rate 0.02
+    python -m app.scripts.bench_ingestion --database-url postgresql://localhost/oppforge_bench --reset
+    python -m app.scripts.bench_ingestion --json out.json --baseline baseline.json --tolerance 0.2
+
+The default database is a throwaway SQLite file. Against Postgres, use an empty
+database (or --reset, which DROPS every table first): rows already stored are
+deduplicated away and would not be re-ingested. DNS is not queried; every
+fixture domain counts as resolving. Exits with status 1 when --baseline is given
+and throughput dropped, or query count grew, by more than --tolerance.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app import models  # noqa: F401  (registers all tables)
+from app.scrapers.replay import FIXTURE_ROOT, load_replay_scrapers
+from app.scripts.fake_ai_engine import FakeAIEngine, add_engine_arguments, engine_settings
+from app.services import curator, vector_db
+from app.services.domain_reputation import DomainReputationCache, domain_of
+from app.services.ingestion import IngestionPipeline, INGEST_BATCH_SIZE
+from app.utils.query_counter import QueryCounter
+
+PERCENTILES = (50, 95, 99)
+
+
+def benchmark(fixtures, database_url: str, engine_url: str, batch_size: int = INGEST_BATCH_SIZE, reset: bool = False) -> dict:
+    """Replay `fixtures` once; the fake AI engine must already be serving at `engine_url`."""
+    scrapers = load_replay_scrapers(fixtures)
+    items = sum(len(s.recorded) for s in scrapers)
+
+    engine = create_engine(database_url)
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    # Point the curator at the fake engine (it bypasses the AI entirely without a key)
+    curator.AI_ENGINE_URL = engine_url
+    curator.GROQ_API_KEY = curator.GROQ_API_KEY or "offline-benchmark"
+    for scraper in scrapers:
+        for item in scraper.recorded:
+            DomainReputationCache.store(domain_of(item.get("url", "")), True)
+
+    pipeline = IngestionPipeline(db=db, batch_size=batch_size, scrapers=scrapers, trigger="benchmark")
+    with QueryCounter(engine) as queries:
+        started = time.monotonic()
+        summary = pipeline.run(notify=False)
+        wall = time.monotonic() - started
+    engine.dispose()
+
+    return {
+        "fixtures": str(fixtures),
+        "database": engine.dialect.name,
+        "batch_size": batch_size,
+        "items": items,
+        "saved": summary["new"],
+        "failed_items": pipeline.failed_items,
+        "wall_s": round(wall, 3),
+        "items_per_s": round(items / wall, 2) if wall else 0.0,
+        "stages": [
+            {
+                **stage.as_dict(),
+                **{f"p{p}_ms": round(stage.percentile(p) * 1000, 1) for p in PERCENTILES},
+                "queries": queries.by_stage.get(stage.name, 0),
+            }
+            for stage in pipeline.stats
+        ],
+        "queries": {"total": queries.total, "by_kind": dict(queries.by_kind), "by_stage": dict(queries.by_stage)},
+    }
+
+
+def print_report(report: dict):
+    print(f"\n{report['items']} items from {report['fixtures']} on {report['database']}: "
+          f"{report['saved']} saved, {report['failed_items']} failed, "
+          f"{report['wall_s']:.2f}s wall, {report['items_per_s']:.1f} items/s")
+    print(f"{'stage':<10}{'in':>7}{'out':>7}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>9}")
+    for s in report["stages"]:
+        print(f"{s['stage']:<10}{s['in']:>7}{s['out']:>7}{s['errors']:>5}"
+              f"{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['p99_ms']:>10.1f}{s['queries']:>9}")
+    kinds = ", ".join(f"{kind} {n}" for kind, n in sorted(report["queries"]["by_kind"].items()))
+    print(f"SQL: {report['queries']['total']} statements ({kinds})")
+    if report.get("ai_engine_calls"):
+        print(f"AI engine calls: {report['ai_engine_calls']}")
+
+
+def regressions(report: dict, baseline: dict, tolerance: float) -> list:
+    problems = []
+    if report["items_per_s"] < baseline["items_per_s"] * (1 - tolerance):
+        problems.append(f"throughput {report['items_per_s']} items/s < baseline {baseline['items_per_s']}")
+    if report["queries"]["total"] > baseline["queries"]["total"] * (1 + tolerance):
+        problems.append(f"{report['queries']['total']} SQL statements > baseline {baseline['queries']['total']}")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", default=str(FIXTURE_ROOT / "sample"), help="directory of *.jsonl scrape fixtures")
+    parser.add_argument("--database-url", help="defaults to a temporary SQLite file")
+    parser.add_argument("--reset", action="store_true", help="drop and recreate every table first")
+    parser.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE)
+    parser.add_argument("--port", type=int, default=8765, help="port for the fake AI engine")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="earlier --json report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression vs the baseline")
+    add_engine_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="oppforge-bench-") as scratch:
+        # Embeddings (when chromadb is installed) go to a scratch store, not ./chroma_db
+        vector_db.PERSIST_DIRECTORY = str(Path(scratch) / "chroma")
+        database_url = args.database_url or f"sqlite:///{Path(scratch) / 'bench.db'}"
+        with FakeAIEngine(port=args.port, **engine_settings(args)) as fake:
+            report = benchmark(args.fixtures, database_url, fake.url, batch_size=args.batch_size, reset=args.reset)
+            report["ai_engine_calls"] = fake.calls
+        report["ai_engine"] = engine_settings(args)
+
+    print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.json}")
+    if args.baseline:
+        problems = regressions(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION: {problem}")
+        if problems:
+            return 1
+        print("No regression against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
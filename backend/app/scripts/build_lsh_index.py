@@ -0,0 +1,46 @@
+"""
+Backfill MinHash fingerprints and LSH buckets for opportunities stored before
+near-duplicate detection existed. Safe to re-run: only rows without a
+fingerprint are processed. New rows are indexed by the ingestion pipeline.
+"""
+
+from app.database import SessionLocal, engine, Base
+from app.models.opportunity import Opportunity
+from app.models.near_duplicate import OpportunityFingerprint, OpportunityLSHBucket
+from app.services.near_duplicates import NearDuplicateIndex
+
+CHUNK = 1000
+
+
+def backfill():
+    Base.metadata.create_all(bind=engine, tables=[OpportunityFingerprint.__table__, OpportunityLSHBucket.__table__])
+    db = SessionLocal()
+    try:
+        indexed = skipped = 0
+        last_id = None
+        while True:
+            # Keyset over id so each chunk is one indexed range scan
+            query = (
+                db.query(Opportunity)
+                .outerjoin(OpportunityFingerprint, OpportunityFingerprint.opportunity_id == Opportunity.id)
+                .filter(OpportunityFingerprint.opportunity_id == None)
+                .order_by(Opportunity.id)
+            )
+            if last_id is not None:
+                query = query.filter(Opportunity.id > last_id)
+            chunk = query.limit(CHUNK).all()
+            if not chunk:
+                break
+            count = NearDuplicateIndex.index_saved(db, chunk)
+            db.commit()
+            indexed += count
+            skipped += len(chunk) - count  # too little text to fingerprint
+            last_id = chunk[-1].id
+            print(f"   {indexed} indexed, {skipped} skipped...")
+        print(f"LSH index backfill complete: {indexed} fingerprints, {skipped} rows without enough text.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill()
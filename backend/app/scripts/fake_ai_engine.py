@@ -0,0 +1,157 @@
+"""
+Local stand-in for the AI engine's /ai/classify and /ai/risk-assess, for
+offline ingestion benchmarks (see bench_ingestion.py).
+
+Answers are deterministic per input text (rule-based like the real engine's
+fallback classifier); latency and failure behaviour are configurable so runs
+can model a slow or flaky engine:
+
+    python -m app.scripts.fake_ai_engine --port 8001 --latency-ms 800 --jitter-ms 400 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import threading
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+CATEGORIES = (("hackathon", "Hackathon"), ("bounty", "Bounty"), ("airdrop", "Airdrop"), ("testnet", "Testnet"))
+CHAINS = ("ethereum", "solana", "arbitrum", "optimism", "polygon", "base", "sui", "aptos")
+SKILLS = ("solidity", "rust", "react", "typescript", "python", "move", "design", "content writing")
+
+
+def _unit(text: str, salt: str) -> float:
+    """Stable pseudo-random number in [0, 1) for a text."""
+    digest = hashlib.sha256(f"{salt}:{text}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+def classify(raw_text: str, noise_rate: float) -> dict:
+    text = raw_text.lower()
+    if _unit(raw_text, "noise") < noise_rate:
+        return {"is_opportunity": False}
+    category = next((name for keyword, name in CATEGORIES if keyword in text), "Grant")
+    chain = next((c.capitalize() for c in CHAINS if c in text), "Multi-chain")
+    title = raw_text.split(". ")[0][:80].strip() or f"{category} Opportunity"
+    return {
+        "is_opportunity": True,
+        "category": category,
+        "title": title,
+        "chain": chain,
+        "required_skills": [s.title() for s in SKILLS if s in text][:5],
+        "reward_pool": None,
+        "deadline": None,
+        "difficulty": "Intermediate",
+        "win_probability": "High" if _unit(raw_text, "win") > 0.7 else "Medium",
+        "ai_summary": raw_text[:160],
+        "strategy_tip": "Ship early and document the build.",
+        "confidence": 80,
+    }
+
+
+def assess_risk(opportunity: dict) -> dict:
+    score = round(50 + 50 * _unit(opportunity.get("url") or opportunity.get("title") or "", "risk"), 1)
+    level = "LOW" if score >= 75 else "MEDIUM" if score >= 50 else "HIGH"
+    return {"risk_score": score, "risk_level": level, "flags": [], "verified_source": score >= 75, "details": {}}
+
+
+def create_app(latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0.0,
+               noise_rate: float = 0.1, seed: int = 0) -> FastAPI:
+    app = FastAPI(title="Fake AI Engine")
+    rng = random.Random(seed)
+    app.state.calls = {"classify": 0, "risk-assess": 0, "errors": 0}
+
+    async def simulate(endpoint: str):
+        """Sleep for the configured latency; returns an error response if this call should fail."""
+        app.state.calls[endpoint] += 1
+        delay = max(0.0, latency_ms + rng.uniform(-jitter_ms, jitter_ms)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+        if rng.random() < error_rate:
+            app.state.calls["errors"] += 1
+            return JSONResponse({"detail": "simulated AI engine failure"}, status_code=500)
+        return None
+
+    @app.post("/ai/classify")
+    async def classify_endpoint(request: Request):
+        body = await request.json()
+        failure = await simulate("classify")
+        if failure:
+            return failure
+        return {"success": True, "data": classify(body.get("raw_text", ""), noise_rate)}
+
+    @app.post("/ai/risk-assess")
+    async def risk_endpoint(request: Request):
+        body = await request.json()
+        failure = await simulate("risk-assess")
+        if failure:
+            return failure
+        return {"success": True, "data": assess_risk(body.get("opportunity") or {})}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok", "calls": app.state.calls}
+
+    return app
+
+
+class FakeAIEngine:
+    """Runs the fake engine with uvicorn in a background thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, **settings):
+        import uvicorn
+
+        self.app = create_app(**settings)
+        self.url = f"http://{host}:{port}"
+        self.server = uvicorn.Server(uvicorn.Config(self.app, host=host, port=port, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, name="fake-ai-engine", daemon=True)
+
+    @property
+    def calls(self) -> dict:
+        return dict(self.app.state.calls)
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError(f"Fake AI engine did not start on {self.url}")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+def add_engine_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency-ms", type=float, default=0, help="mean delay per AI call")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="uniform +/- spread around the mean")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered with HTTP 500")
+    parser.add_argument("--noise-rate", type=float, default=0.1, help="fraction of texts classified as not an opportunity")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def engine_settings(args) -> dict:
+    return {
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+        "noise_rate": args.noise_rate,
+        "seed": args.seed,
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_app(**engine_settings(args)), host=args.host, port=args.port)
@@ -0,0 +1,47 @@
+"""
+Record what each scraper's parse() returns as JSONL fixtures, for offline
+ingestion benchmarks (see bench_ingestion.py and app/scrapers/replay.py).
+
+    python -m app.scripts.record_scrapes                       # fixtures/scrapes/<today>/
+    python -m app.scripts.record_scrapes --out fixtures/scrapes/baseline --sources superteam curated
+
+Scrapers run without watermarks, so a fixture holds a source's full listing.
+"""
+
+import argparse
+from datetime import datetime
+
+from app.scrapers.base import run_concurrently
+from app.scrapers.code4rena import Code4renaScraper
+from app.scrapers.curated import CuratedScraper
+from app.scrapers.dorahacks import DoraHacksScraper
+from app.scrapers.replay import FIXTURE_ROOT, write_fixture
+from app.scrapers.superteam import SuperteamScraper
+
+SCRAPERS = {
+    "superteam": SuperteamScraper,
+    "dorahacks": DoraHacksScraper,
+    "code4rena": Code4renaScraper,
+    "curated": CuratedScraper,
+}
+
+
+def record(out_dir, sources=None):
+    scrapers = [SCRAPERS[name]() for name in (sources or SCRAPERS)]
+    recorded = 0
+    for scraper, items in run_concurrently(scrapers):
+        if not items:
+            print(f"   {scraper.source_name}: nothing fetched, no fixture written.")
+            continue
+        path = write_fixture(out_dir, scraper, items)
+        recorded += len(items)
+        print(f"   {scraper.source_name}: {len(items)} items -> {path}")
+    print(f"Recorded {recorded} items into {out_dir}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=str(FIXTURE_ROOT / datetime.utcnow().strftime("%Y-%m-%d")))
+    parser.add_argument("--sources", nargs="*", choices=sorted(SCRAPERS))
+    args = parser.parse_args()
+    record(args.out, args.sources)
@@ -1,11 +1,14 @@
 import os
-import requests
+import asyncio
+import httpx
 import json
-import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 
+from .stages import run_sync
+from ..utils.rewards import reward_usd
+
 load_dotenv()
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
@@ -14,7 +17,7 @@ AI_ENGINE_URL = os.getenv("AI_ENGINE_URL", "http://localhost:8001")
 
 def parse_reward_to_usd(reward_str: str) -> float:
     """
-    Parse reward_pool string to USD float.
+    Parse reward_pool string to USD float (0.0 when it is not an amount).
     Examples:
       "$50,000" -> 50000.0
       "$1M" -> 1000000.0
@@ -22,35 +25,7 @@ def parse_reward_to_usd(reward_str: str) -> float:
       "Alpha" -> 0.0
       "TBD" -> 0.0
     """
-    if not reward_str or not isinstance(reward_str, str):
-        return 0.0
-    
-    # Remove common noise
-    reward_str = reward_str.upper().strip()
-    
-    # Non-monetary keywords
-    if any(x in reward_str for x in ["ALPHA", "TBD", "VARIES", "SEE DETAILS", "TOKEN ALLOCATION", "FUTURE"]):
-        return 0.0
-    
-    # Extract number pattern
-    # Match patterns like: $1,000,000 or 50K or 1.5M
-    match = re.search(r'[\$]?\s*([0-9]+[,\.]?[0-9]*)\s*([KMB])?', reward_str)
-    if not match:
-        return 0.0
-    
-    num_str = match.group(1).replace(',', '')
-    multiplier_str = match.group(2) or ''
-    
-    try:
-        base_value = float(num_str)
-    except ValueError:
-        return 0.0
-    
-    # Apply multiplier
-    multipliers = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
-    multiplier = multipliers.get(multiplier_str, 1)
-    
-    return base_value * multiplier
+    return reward_usd(reward_str) or 0.0
 
 # Platforms whose listings are pre-verified as real opportunities.
 # Items from these sources bypass the is_opportunity gate and are only enriched.
@@ -61,10 +36,23 @@ TRUSTED_SOURCES = {
 }
 
 
+# LLM calls in flight at once during batch triage (each item = classify + risk)
+TRIAGE_CONCURRENCY = int(os.getenv("TRIAGE_CONCURRENCY", "8"))
+CLASSIFY_TIMEOUT = 45
+CLASSIFY_MODEL = "llama-3.3-70b-versatile"
+RISK_TIMEOUT = 30
+
+
 class AgentCurator:
     """
     Automated curator that triages and refines raw scrapes.
     Items from trusted platforms are enriched without the is_opportunity gate.
+
+    Verdicts from assess_batch:
+      "refined" - AI fields to merge into the item
+      "noise"   - not an opportunity, discard
+      "error"   - AI engine answered with an error, discard
+      "bypass"  - AI engine unreachable/unconfigured, keep the raw item
     """
 
     @staticmethod
@@ -73,111 +61,172 @@ class AgentCurator:
         Input: Raw scrape dict.
         Output: Refined dict or None (if noise).
         """
+        return AgentCurator.triage_and_refine_many([raw_item])[0]
+
+    @staticmethod
+    def triage_and_refine_many(raw_items: List[Dict], concurrency: int = None) -> List[Optional[Dict]]:
+        """Blocking wrapper around triage_batch for synchronous callers."""
+        return run_sync(AgentCurator.triage_batch(raw_items, concurrency))
+
+    @staticmethod
+    def assess_many(raw_items: List[Dict], concurrency: int = None) -> List[Tuple[str, Optional[Dict]]]:
+        """Blocking wrapper around assess_batch, for callers that cache verdicts."""
+        return run_sync(AgentCurator.assess_batch(raw_items, concurrency))
+
+    @staticmethod
+    async def triage_batch(raw_items: List[Dict], concurrency: int = None, client: httpx.AsyncClient = None) -> List[Optional[Dict]]:
+        """
+        Triage a batch concurrently. Returns one refined dict (or None for noise)
+        per input item, in input order.
+        """
+        verdicts = await AgentCurator.assess_batch(raw_items, concurrency, client)
+        return [
+            AgentCurator.apply_verdict(item, status, fields)
+            for item, (status, fields) in zip(raw_items, verdicts)
+        ]
+
+    @staticmethod
+    def apply_verdict(raw_item: Dict, status: str, fields: Optional[Dict]) -> Optional[Dict]:
+        if status == "refined":
+            raw_item.update(fields)
+            return raw_item
+        if status == "bypass":
+            return raw_item
+        return None
+
+    @staticmethod
+    async def assess_batch(raw_items: List[Dict], concurrency: int = None, client: httpx.AsyncClient = None) -> List[Tuple[str, Optional[Dict]]]:
+        """
+        Classify + risk-assess every item with at most `concurrency` items in flight,
+        sharing one pooled HTTP client. Returns (verdict, ai_fields) per item.
+        """
+        if not raw_items:
+            return []
         if not GROQ_API_KEY:
             print("[Curator] Warning: GROQ_API_KEY not found.")
-            return raw_item
+            return [("bypass", None)] * len(raw_items)
+
+        concurrency = max(1, concurrency or TRIAGE_CONCURRENCY)
+        semaphore = asyncio.Semaphore(concurrency)
+        own_client = client is None
+        if own_client:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency * 2),
+            )
+        try:
+            return await asyncio.gather(*(
+                AgentCurator._assess_one(client, semaphore, item) for item in raw_items
+            ))
+        finally:
+            if own_client:
+                await client.aclose()
 
-        text = raw_item.get("description", "")
-        title = raw_item.get("title", "")
+    @staticmethod
+    async def _assess_one(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, raw_item: Dict) -> Tuple[str, Optional[Dict]]:
+        text = raw_item.get("description", "") or ""
+        title = raw_item.get("title", "") or ""
         full_text = f"{title}. {text}"
 
         if len(full_text) < 15:
-            return None
+            return "noise", None
 
         source = (raw_item.get("source") or "Unknown").lower()
         from_trusted_source = source in TRUSTED_SOURCES
 
-        # Call AI Engine Classifier Agent
+        async with semaphore:
+            # Classification and risk assessment run side by side; risk is
+            # cancelled if the classifier rejects the item first.
+            print(f"[Curator] Calling AI-Engine Classify + Risk-Assess for: {title[:30]}...")
+            risk_task = asyncio.create_task(AgentCurator._risk_assess(client, raw_item))
+            try:
+                response = await client.post(
+                    f"{AI_ENGINE_URL}/ai/classify",
+                    json={
+                        "raw_text": full_text,
+                        "source": raw_item.get("source", "Unknown"),
+                        "model": CLASSIFY_MODEL,
+                    },
+                    timeout=CLASSIFY_TIMEOUT,
+                )
+                if response.status_code == 200:
+                    refined = response.json().get("data", {})
+            except Exception as e:
+                risk_task.cancel()
+                print(f"  [Curator] Exception: {e}")
+                print("  [Curator] Falling back to raw item (Bypassing AI)...")
+                # Fallback: Return raw item without AI enrichment
+                return "bypass", None
+
+            if response.status_code != 200:
+                risk_task.cancel()
+                print(f"  [Curator] API Error {response.status_code}: {response.text}")
+                return "error", None
+
+            # Trusted platform items are pre-validated — only reject true noise
+            # (very low confidence with no reward) not just missing CTA keywords
+            is_opp = refined.get("is_opportunity", False)
+            if not is_opp and not from_trusted_source:
+                risk_task.cancel()
+                print(f"  [Curator] Skipped: {title[:30]} (Not an opportunity)")
+                return "noise", None
+            if not is_opp and from_trusted_source:
+                print(f"  [Curator] Trusted source ({source}) — overriding classifier, keeping item")
+                # Preserve category from raw_item since classifier was uncertain
+                refined["is_opportunity"] = True
+                if not refined.get("category"):
+                    refined["category"] = raw_item.get("category", "Bounty")
+
+            print(f"  [Curator] Success: {refined.get('title')}")
+            risk_score, risk_level, risk_flags = await risk_task
+
+        deadline_dt = None
+        if refined.get("deadline"):
+            try:
+                deadline_dt = datetime.strptime(refined["deadline"], "%Y-%m-%d")
+            except: pass
+
+        return "refined", {
+            "title": refined.get("title", title),
+            "category": refined.get("category", "Uncategorized"),
+            "reward_pool": refined.get("reward_pool"),
+            "estimated_value_usd": parse_reward_to_usd(refined.get("reward_pool", "")),
+            "deadline": deadline_dt,
+            "chain": refined.get("chain", "Multi-chain"),
+            "required_skills": refined.get("required_skills", []),
+            "win_probability": refined.get("win_probability", "Medium"),
+            "difficulty": refined.get("difficulty", "Intermediate"),
+            "ai_summary": refined.get("ai_summary"),
+            "ai_strategy": refined.get("strategy_tip"),
+            "ai_score": (90 if refined.get("win_probability") == "High" else 70) + (len(refined.get("required_skills", [])) * 2),
+            "risk_score": risk_score,
+            "risk_level": risk_level,
+            "risk_flags": risk_flags
+        }
+
+    @staticmethod
+    async def _risk_assess(client: httpx.AsyncClient, raw_item: Dict) -> Tuple[Optional[int], Optional[str], List]:
+        """Risk assessment on the raw fields (runs before the classifier has refined them)."""
         try:
-            print(f"[Curator] Calling AI-Engine Classify for: {title[:30]}...")
-            response = requests.post(
-                f"{AI_ENGINE_URL}/ai/classify",
+            opp_data_for_risk = {
+                "title": raw_item.get("title", ""),
+                "description": raw_item.get("description", "") or "", # Raw text gives better context for scams
+                "category": raw_item.get("category") or "Uncategorized",
+                "source": raw_item.get("source", "Unknown"),
+                "url": raw_item.get("url", ""),
+                "reward_pool": raw_item.get("reward_pool") or "",
+                "estimated_value_usd": raw_item.get("estimated_value_usd") or reward_usd(raw_item.get("reward_pool"), raw_item.get("reward_token")),
+            }
+            risk_resp = await client.post(
+                f"{AI_ENGINE_URL}/ai/risk-assess",
                 json={
-                    "raw_text": full_text,
-                    "source": raw_item.get("source", "Unknown"),
-                    "model": "llama-3.3-70b-versatile",
+                    "opportunity": opp_data_for_risk,
+                    "ecosystem": None
                 },
-                timeout=45,
+                timeout=RISK_TIMEOUT
             )
-
-            if response.status_code == 200:
-                refined = response.json().get("data", {})
-
-                # Trusted platform items are pre-validated — only reject true noise
-                # (very low confidence with no reward) not just missing CTA keywords
-                is_opp = refined.get("is_opportunity", False)
-                if not is_opp and not from_trusted_source:
-                    print(f"  [Curator] Skipped: {title[:30]} (Not an opportunity)")
-                    return None
-                if not is_opp and from_trusted_source:
-                    print(f"  [Curator] Trusted source ({source}) — overriding classifier, keeping item")
-                    # Preserve category from raw_item since classifier was uncertain
-                    refined["is_opportunity"] = True
-                    if not refined.get("category"):
-                        refined["category"] = raw_item.get("category", "Bounty")
-                
-                print(f"  [Curator] Success: {refined.get('title')}")
-                
-                deadline_dt = None
-                if refined.get("deadline"):
-                    try:
-                        deadline_dt = datetime.strptime(refined["deadline"], "%Y-%m-%d")
-                    except: pass
-
-                # --- Execute AI Risk Assessment ---
-                risk_score = None
-                risk_level = None
-                risk_flags = []
-                try:
-                    print(f"[Curator] Calling AI-Engine Risk-Assess for: {title[:30]}...")
-                    opp_data_for_risk = {
-                        "title": refined.get("title", title),
-                        "description": text, # Raw text gives better context for scams
-                        "category": refined.get("category", "Uncategorized"),
-                        "source": raw_item.get("source", "Unknown"),
-                        "url": raw_item.get("url", ""),
-                        "reward_pool": refined.get("reward_pool", "")
-                    }
-                    risk_resp = requests.post(
-                        f"{AI_ENGINE_URL}/ai/risk-assess",
-                        json={
-                            "opportunity": opp_data_for_risk,
-                            "ecosystem": None
-                        },
-                        timeout=30
-                    )
-                    if risk_resp.status_code == 200:
-                        risk_data = risk_resp.json().get("data", {})
-                        risk_score = risk_data.get("risk_score")
-                        risk_level = risk_data.get("risk_level")
-                        risk_flags = risk_data.get("flags", [])
-                except Exception as risk_e:
-                    print(f"  [Curator] Risk Assess Error: {risk_e}")
-
-                raw_item.update({
-                    "title": refined.get("title", title),
-                    "category": refined.get("category", "Uncategorized"),
-                    "reward_pool": refined.get("reward_pool"),
-                    "estimated_value_usd": parse_reward_to_usd(refined.get("reward_pool", "")),
-                    "deadline": deadline_dt,
-                    "chain": refined.get("chain", "Multi-chain"),
-                    "required_skills": refined.get("required_skills", []),
-                    "win_probability": refined.get("win_probability", "Medium"),
-                    "difficulty": refined.get("difficulty", "Intermediate"),
-                    "ai_summary": refined.get("ai_summary"),
-                    "ai_strategy": refined.get("strategy_tip"),
-                    "ai_score": (90 if refined.get("win_probability") == "High" else 70) + (len(refined.get("required_skills", [])) * 2),
-                    "risk_score": risk_score,
-                    "risk_level": risk_level,
-                    "risk_flags": risk_flags
-                })
-                return raw_item
-            else:
-                print(f"  [Curator] API Error {response.status_code}: {response.text}")
-                return None
-
-        except Exception as e:
-            print(f"  [Curator] Exception: {e}")
-            print("  [Curator] Falling back to raw item (Bypassing AI)...")
-            # Fallback: Return raw item without AI enrichment
-            return raw_item
+            if risk_resp.status_code == 200:
+                risk_data = risk_resp.json().get("data", {})
+                return risk_data.get("risk_score"), risk_data.get("risk_level"), risk_data.get("flags", [])
+        except Exception as risk_e:
+            print(f"  [Curator] Risk Assess Error: {risk_e}")
+        return None, None, []
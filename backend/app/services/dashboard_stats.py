@@ -0,0 +1,75 @@
+"""
+Catalog-wide figures for /stats/dashboard, kept in a snapshot row.
+
+The dashboard shows the same three numbers to every user:
+
+    active_count     open and not expired (matches /opportunities/priority)
+    closing_soon     active, deadline within CLOSING_SOON_WINDOW
+    total_pool_usd   sum of estimated_value_usd over active rows
+
+They are computed together in one aggregate query by refresh() and stored
+in StatsSnapshot("dashboard"), so serving the dashboard is a primary-key
+read whatever the catalog size. refresh() runs:
+
+  - every few minutes from Celery (tasks/stats_tasks.py), which also moves
+    rows into / out of "closing soon" as time passes,
+  - after ingestion saved rows (any entry point: IngestionPipeline._after_save),
+    and after cleanup archived or purged rows,
+  - from snapshot() when the row is missing or older than
+    STATS_SNAPSHOT_MAX_AGE seconds (fresh database, beat not running).
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.opportunity import Opportunity
+from ..models.stats_snapshot import StatsSnapshot
+
+DASHBOARD = "dashboard"
+CLOSING_SOON_WINDOW = timedelta(days=7)
+STATS_SNAPSHOT_MAX_AGE = int(os.getenv("STATS_SNAPSHOT_MAX_AGE", "900"))
+
+
+def compute(db: Session, now: Optional[datetime] = None) -> dict:
+    """The dashboard figures straight from the opportunities table, in one query."""
+    now = now or datetime.utcnow()
+    closing = case((Opportunity.deadline <= now + CLOSING_SOON_WINDOW, 1), else_=0)
+    active, closing_soon, pool = db.execute(
+        select(func.count(), func.sum(closing), func.sum(Opportunity.estimated_value_usd)).where(
+            Opportunity.is_open == True,
+            or_(Opportunity.deadline == None, Opportunity.deadline >= now),
+        )
+    ).one()
+    return {
+        "active_count": active or 0,
+        "closing_soon": closing_soon or 0,
+        "total_pool_usd": float(pool or 0.0),
+    }
+
+
+def refresh(db: Session, now: Optional[datetime] = None) -> StatsSnapshot:
+    """Recompute and store the dashboard snapshot."""
+    now = now or datetime.utcnow()
+    figures = compute(db, now)
+    try:
+        snapshot = db.merge(StatsSnapshot(name=DASHBOARD, refreshed_at=now, **figures))
+        db.commit()
+    except IntegrityError:
+        # A concurrent refresh inserted the row first; update it instead
+        db.rollback()
+        snapshot = db.merge(StatsSnapshot(name=DASHBOARD, refreshed_at=now, **figures))
+        db.commit()
+    return snapshot
+
+
+def snapshot(db: Session, max_age: int = STATS_SNAPSHOT_MAX_AGE) -> StatsSnapshot:
+    """The stored dashboard snapshot, refreshed first if missing or older than `max_age` seconds."""
+    row = db.get(StatsSnapshot, DASHBOARD)
+    if row is None or row.refreshed_at < datetime.utcnow() - timedelta(seconds=max_age):
+        row = refresh(db)
+    return row
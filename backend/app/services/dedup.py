@@ -0,0 +1,87 @@
+"""
+Per-run deduplication index for the ingestion pipeline.
+
+The identity keys of every stored opportunity are loaded in one query, after
+which each scraped item is checked in O(1) instead of firing a SELECT per key.
+The unique indexes on (source, source_id) and url stay the final arbiter for
+races between workers (see IngestionPipeline._insert_opportunities).
+"""
+
+from typing import Dict, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+
+from ..models.opportunity import Opportunity
+from ..utils.text_processing import normalize_url, generate_content_hash
+
+
+def content_signature(opp_data: Dict) -> str:
+    """Hash of title + description + source, as stored in Opportunity.content_hash."""
+    return generate_content_hash(
+        f"{opp_data.get('title') or ''}{opp_data.get('description') or ''}{opp_data.get('source') or ''}"
+    )
+
+
+class DedupIndex:
+    """In-memory sets of (source, source_id), normalized URLs, titles and content hashes."""
+
+    def __init__(self):
+        self.source_ids: Set[Tuple[str, str]] = set()
+        self.urls: Set[str] = set()
+        self.titles: Set[str] = set()
+        self.hashes: Set[str] = set()
+
+    @classmethod
+    def load(cls, db: Session) -> "DedupIndex":
+        index = cls()
+        rows = db.query(
+            Opportunity.source,
+            Opportunity.source_id,
+            Opportunity.url,
+            Opportunity.title,
+            Opportunity.content_hash,
+        ).all()
+        for source, source_id, url, title, content_hash in rows:
+            index._add(source, source_id, normalize_url(url), title, content_hash)
+        print(f"[Dedup] Index loaded with {len(rows)} stored opportunities.")
+        return index
+
+    def _add(self, source, source_id, url, title, content_hash):
+        if source_id:
+            self.source_ids.add((source or "", str(source_id)))
+        if url:
+            self.urls.add(url)
+        if title:
+            self.titles.add(title)
+        if content_hash:
+            self.hashes.add(content_hash)
+
+    def match(self, opp_data: Dict) -> Optional[str]:
+        """
+        Returns the reason an item is already known ("id", "url", "hash"), or None.
+        Expects opp_data["url"] to be normalized already.
+        """
+        source_id = opp_data.get("source_id")
+        if source_id and (opp_data.get("source") or "", str(source_id)) in self.source_ids:
+            return "id"
+        if opp_data.get("url") and opp_data["url"] in self.urls:
+            return "url"
+        if opp_data.get("content_hash") and opp_data["content_hash"] in self.hashes:
+            return "hash"
+        return None
+
+    def has_title(self, title: Optional[str]) -> bool:
+        return bool(title) and title in self.titles
+
+    def add(self, opp_data: Dict, title: bool = True):
+        """
+        Register a newly saved (or conflicting) item so later items in the run see it.
+        title=False claims only the identity keys, for items still awaiting triage
+        whose own (possibly refined) title must not match itself later.
+        """
+        self._add(
+            opp_data.get("source"),
+            opp_data.get("source_id"),
+            opp_data.get("url"),
+            opp_data.get("title") if title else None,
+            opp_data.get("content_hash"),
+        )
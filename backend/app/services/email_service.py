@@ -1,9 +1,12 @@
+import asyncio
 import httpx
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 PLUNK_API_KEY = os.getenv("PLUNK_SECRET_KEY")
 API_URL = "https://api.useplunk.com/v1/send"
+# Emails in flight at once when fanning out alerts (send_emails)
+EMAIL_CONCURRENCY = int(os.getenv("EMAIL_CONCURRENCY", "10"))
 
 def get_email_template(title: str, body: str, cta_link: str = None, cta_text: str = "View Opportunity"):
     """
@@ -110,36 +113,59 @@ def get_email_template(title: str, body: str, cta_link: str = None, cta_text: st
     </html>
     """
 
-async def send_email(to_email: str, subject: str, html_body: str, name: str = "OppForge"):
+async def send_email(to_email: str, subject: str, html_body: str, name: str = "OppForge", client: Optional[httpx.AsyncClient] = None):
     """
     Send an email via Plunk API.
+    Pass `client` to reuse one connection pool across many sends (see send_emails).
     """
     if not PLUNK_API_KEY:
         print(f"[Email] No API Key. Would have sent to {to_email}: {subject}")
         return False
 
-    async with httpx.AsyncClient() as client:
-        try:
-            payload = {
-                "to": to_email,
-                "subject": subject,
-                "body": html_body, # Plunk accepts HTML in body
-                "name": name,
-                "from": "hello@oppforge.xyz" 
-            }
-            
-            response = await client.post(
-                API_URL,
-                headers={"Authorization": f"Bearer {PLUNK_API_KEY}"},
-                json=payload
-            )
-            
-            if response.status_code == 200:
-                print(f"[Email] Sent to {to_email}")
-                return True
-            else:
-                print(f"[Email] Error {response.status_code}: {response.text}")
-                return False
-        except Exception as e:
-            print(f"[Email] Exception: {e}")
+    if client is None:
+        async with httpx.AsyncClient() as own_client:
+            return await send_email(to_email, subject, html_body, name, client=own_client)
+
+    try:
+        payload = {
+            "to": to_email,
+            "subject": subject,
+            "body": html_body, # Plunk accepts HTML in body
+            "name": name,
+            "from": "hello@oppforge.xyz" 
+        }
+        
+        response = await client.post(
+            API_URL,
+            headers={"Authorization": f"Bearer {PLUNK_API_KEY}"},
+            json=payload
+        )
+        
+        if response.status_code == 200:
+            print(f"[Email] Sent to {to_email}")
+            return True
+        else:
+            print(f"[Email] Error {response.status_code}: {response.text}")
             return False
+    except Exception as e:
+        print(f"[Email] Exception: {e}")
+        return False
+
+
+async def send_emails(messages: List[Tuple[str, str, str]], concurrency: int = None) -> int:
+    """
+    Send (to_email, subject, html_body) messages over one pooled client with at
+    most `concurrency` requests in flight. Returns how many were accepted.
+    """
+    if not messages:
+        return 0
+    concurrency = max(1, concurrency or EMAIL_CONCURRENCY)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(limits=httpx.Limits(max_connections=concurrency)) as client:
+        async def send_one(to_email, subject, html_body):
+            async with semaphore:
+                return await send_email(to_email, subject, html_body, client=client)
+
+        results = await asyncio.gather(*(send_one(*message) for message in messages))
+    return sum(1 for ok in results if ok)
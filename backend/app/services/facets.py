@@ -0,0 +1,105 @@
+"""
+Faceted counts: how many opportunities fall under each value of several
+dimensions at once (filter badges, admin breakdowns).
+
+All requested facets come from a single statement (one round trip):
+
+    Postgres   GROUP BY GROUPING SETS ((category), (chain), ...) over one
+               scan, with GROUPING() telling which set produced each row
+    others     one GROUP BY per facet, combined with UNION ALL
+
+    count_facets(db, ("category", "chain"), Opportunity.is_open == True)
+    -> {"total": 42, "category": {"Grant": 30, ...}, "chain": {...}}
+
+Values are strings (NULL becomes "Unknown"), most common first.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy import String, case, cast, func, literal, or_, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from ..models.opportunity import Opportunity
+
+FEED_FACETS = ("category", "chain", "source", "difficulty", "deadline")
+UNKNOWN = "Unknown"
+
+# deadline facet buckets, by time left
+DEADLINE_BUCKETS = (("week", timedelta(days=7)), ("month", timedelta(days=30)))
+
+
+def _dimensions(now: datetime) -> dict:
+    deadline = case(
+        (Opportunity.deadline == None, "none"),
+        *[(Opportunity.deadline <= now + within, name) for name, within in DEADLINE_BUCKETS],
+        else_="later",
+    )
+    return {
+        "category": Opportunity.category,
+        "chain": Opportunity.chain,
+        "source": Opportunity.source,
+        "difficulty": Opportunity.difficulty,
+        "deadline": deadline,
+        "verified": case((Opportunity.is_verified == True, "true"), else_="false"),
+        "open": case((Opportunity.is_open == True, "true"), else_="false"),
+    }
+
+
+def count_facets(db: Session, facets: Sequence[str], *filters, now: Optional[datetime] = None) -> Dict[str, object]:
+    """Counts per value for each facet over opportunities matching `filters`, plus the total."""
+    facets = tuple(facets)
+    dimensions = _dimensions(now or datetime.now())
+    unknown = sorted(set(facets) - set(dimensions))
+    if not facets or unknown:
+        raise ValueError(f"Unknown facet(s): {', '.join(unknown) or '(none)'}")
+
+    # Dimensions computed once per row; the grouping reads this derived table
+    rows = select(*[dimensions[name].label(name) for name in facets]).where(*filters).subquery("facet_rows")
+
+    if db.get_bind().dialect.name == "postgresql" and len(facets) > 1:
+        n = len(facets)
+        grouped = []
+        for row in db.execute(grouping_sets_statement(rows, facets)):
+            position = list(row[n:2 * n]).index(0)  # GROUPING() is 0 for the set's own column
+            grouped.append((facets[position], row[position], row[-1]))
+    else:
+        grouped = db.execute(union_statement(rows, facets)).all()
+
+    counts: Dict[str, Dict[str, int]] = {name: {} for name in facets}
+    for name, value, count in grouped:
+        key = UNKNOWN if value is None else str(value)
+        counts[name][key] = counts[name].get(key, 0) + count
+
+    result: Dict[str, object] = {"total": sum(counts[facets[0]].values())}
+    for name in facets:
+        result[name] = dict(sorted(counts[name].items(), key=lambda kv: (-kv[1], kv[0])))
+    return result
+
+
+def grouping_sets_statement(rows, facets: Sequence[str]):
+    """(value per facet..., GROUPING() per facet..., count), one row per facet value."""
+    columns = [rows.c[name] for name in facets]
+    return select(*columns, *[func.grouping(c) for c in columns], func.count()).group_by(
+        func.grouping_sets(*[tuple_(c) for c in columns]))
+
+
+def union_statement(rows, facets: Sequence[str]):
+    """(facet, value, count) rows: one GROUP BY per facet, UNION ALL."""
+    selects = [
+        select(literal(name).label("facet"), cast(rows.c[name], String).label("value"), func.count())
+        .group_by(rows.c[name])
+        for name in facets
+    ]
+    return selects[0] if len(selects) == 1 else union_all(*selects)
+
+
+def feed_facets(db: Session, now: Optional[datetime] = None) -> Dict[str, object]:
+    """Facets of the public feed: open opportunities that have not expired."""
+    now = now or datetime.now()
+    return count_facets(
+        db, FEED_FACETS,
+        Opportunity.is_open == True,
+        or_(Opportunity.deadline == None, Opportunity.deadline >= now),
+        now=now,
+    )
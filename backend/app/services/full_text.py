@@ -0,0 +1,218 @@
+"""
+Full-text search over opportunities.
+
+Postgres: a `search_vector` tsvector column on opportunities, weighted
+title (A) > tags (B) > description (C), maintained by a BEFORE INSERT/UPDATE
+trigger and indexed with GIN. Queries use websearch_to_tsquery and rank with
+ts_rank_cd (normalized to 0-1).
+
+SQLite (local dev): an external-content FTS5 table `opportunities_fts` kept in
+sync by triggers, ranked with bm25() using the same column weights.
+
+FullTextIndex.install() is idempotent. Run it once per database through
+app/scripts/add_fulltext_index.py (the backfill rewrites every row, which can
+take a while and locks a large table). The API never creates it: search uses
+ILIKE until the index exists, re-checking at most every
+FULL_TEXT_RECHECK_SECONDS, so running workers switch over without a restart.
+
+The column / virtual table are not part of the ORM model, so normal queries do
+not load them.
+"""
+
+import os
+import re
+import time
+import weakref
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Float, Integer, case, desc, func, literal_column, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+
+from ..models.opportunity import Opportunity, recently_active
+
+TEXT_SEARCH_CONFIG = "english"
+
+# Column weights: title > tags > description
+BM25_WEIGHTS = (10.0, 5.0, 1.0)
+# SQLite: matches ranked by FTS5 before joining the (filtered) opportunities query
+FTS_CANDIDATES = 200
+# While the index is missing, how often available() looks for it again
+FULL_TEXT_RECHECK_SECONDS = float(os.getenv("FULL_TEXT_RECHECK_SECONDS", "60"))
+
+_POSTGRES_DDL = [
+    "ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    f"""
+    CREATE OR REPLACE FUNCTION opportunities_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(NEW.tags::text, '')), 'B') ||
+            setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(NEW.description, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'opportunities_search_vector_trg') THEN
+            CREATE TRIGGER opportunities_search_vector_trg
+            BEFORE INSERT OR UPDATE OF title, tags, description ON opportunities
+            FOR EACH ROW EXECUTE FUNCTION opportunities_search_vector_update();
+        END IF;
+    END
+    $$
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_opportunities_search_vector ON opportunities USING GIN (search_vector)",
+]
+
+_SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS opportunities_fts USING fts5(
+        title, tags, description, content='opportunities', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_insert AFTER INSERT ON opportunities BEGIN
+        INSERT INTO opportunities_fts(rowid, title, tags, description)
+        VALUES (new.rowid, new.title, new.tags, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_delete AFTER DELETE ON opportunities BEGIN
+        INSERT INTO opportunities_fts(opportunities_fts, rowid, title, tags, description)
+        VALUES ('delete', old.rowid, old.title, old.tags, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_update AFTER UPDATE OF title, tags, description ON opportunities BEGIN
+        INSERT INTO opportunities_fts(opportunities_fts, rowid, title, tags, description)
+        VALUES ('delete', old.rowid, old.title, old.tags, old.description);
+        INSERT INTO opportunities_fts(rowid, title, tags, description)
+        VALUES (new.rowid, new.title, new.tags, new.description);
+    END
+    """,
+]
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+class FullTextIndex:
+    _installed = weakref.WeakKeyDictionary()  # engine -> True once the index was found
+    _missing_since = weakref.WeakKeyDictionary()  # engine -> monotonic time of the last failed check
+
+    @classmethod
+    def install(cls, engine: Engine, backfill: bool = True) -> bool:
+        """Create the index structures if missing. Returns False on dialects without support."""
+        dialect = engine.dialect.name
+        if dialect not in ("postgresql", "sqlite"):
+            return False
+        with engine.connect() as conn:
+            if dialect == "postgresql":
+                for statement in _POSTGRES_DDL:
+                    conn.execute(text(statement))
+                if backfill:
+                    # Touching title fires the trigger for rows written before it existed
+                    conn.execute(text("UPDATE opportunities SET title = title WHERE search_vector IS NULL"))
+            else:
+                existed = conn.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'opportunities_fts'")).first() is not None
+                for statement in _SQLITE_DDL:
+                    conn.execute(text(statement))
+                if backfill and not existed:
+                    conn.execute(text("INSERT INTO opportunities_fts(opportunities_fts) VALUES ('rebuild')"))
+            conn.commit()
+        cls._installed[engine] = True
+        cls._missing_since.pop(engine, None)
+        return True
+
+    @classmethod
+    def available(cls, db: Session) -> bool:
+        """
+        Whether the index exists. A positive answer is kept for good; a negative
+        one only for FULL_TEXT_RECHECK_SECONDS, so an index installed by the
+        script is picked up by workers that are already running.
+        """
+        engine = db.get_bind()
+        if cls._installed.get(engine):
+            return True
+        checked = cls._missing_since.get(engine)
+        if checked is not None and time.monotonic() - checked < FULL_TEXT_RECHECK_SECONDS:
+            return False
+        if engine.dialect.name == "postgresql":
+            found = db.execute(text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'opportunities' AND column_name = 'search_vector'")).first()
+        elif engine.dialect.name == "sqlite":
+            found = db.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'opportunities_fts'")).first()
+        else:
+            found = None
+        if found is None:
+            cls._missing_since[engine] = time.monotonic()
+            return False
+        cls._installed[engine] = True
+        return True
+
+
+def fts5_match(q: str) -> Optional[str]:
+    """FTS5 MATCH expression for user input: every word, the last one as a prefix (`"sol"*`)."""
+    tokens = [f'"{token}"' for token in _TOKEN.findall(q.lower())]
+    if not tokens:
+        return None
+    tokens[-1] += "*"
+    return " ".join(tokens)
+
+
+def search(db: Session, q: str, query: Query = None, limit: int = 20, offset: int = 0) -> List[Tuple[Opportunity, float]]:
+    """
+    (opportunity, relevance 0-1) for the best matches of `q`, best first.
+    `query` is an optional pre-filtered db.query(Opportunity).
+    """
+    query = query if query is not None else db.query(Opportunity)
+    dialect = db.get_bind().dialect.name if FullTextIndex.available(db) else None
+
+    if dialect == "sqlite":
+        match = fts5_match(q)
+        if not match:
+            return []
+        # Rank inside FTS5 and join only the best candidates. The caller's filters
+        # rarely reject many; if they leave too few, rank every match instead
+        # (cheap then: a short result usually means few matches).
+        rows = _ranked(*_fts5_relevance(query, match, FTS_CANDIDATES + 4 * (offset + limit)), limit, offset)
+        if len(rows) < limit:
+            rows = _ranked(*_fts5_relevance(query, match, None), limit, offset)
+    elif dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, q)
+        vector = literal_column("opportunities.search_vector")
+        # Normalization 32: rank / (rank + 1), i.e. 0-1
+        relevance = func.ts_rank_cd(vector, tsquery, 32).label("relevance")
+        rows = _ranked(query.filter(vector.op("@@")(tsquery)), relevance, limit, offset)
+    else:
+        # No index on this database: substring match, title hits first
+        term = f"%{q}%"
+        relevance = case((Opportunity.title.ilike(term), 0.6), else_=0.3).label("relevance")
+        rows = _ranked(query.filter(or_(Opportunity.title.ilike(term), Opportunity.description.ilike(term))),
+                       relevance, limit, offset)
+    return [(opp, round(float(score or 0.0), 4)) for opp, score in rows]
+
+
+def _fts5_relevance(query: Query, match: str, cap: Optional[int]):
+    """(query joined to the FTS5 hits, relevance column)."""
+    weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+    sql = (
+        f"SELECT rowid AS fts_rowid, -bm25(opportunities_fts, {weights}) AS score "
+        "FROM opportunities_fts WHERE opportunities_fts MATCH :match"
+    )
+    params = {"match": match}
+    if cap:
+        sql += " ORDER BY score DESC LIMIT :cap"
+        params["cap"] = cap
+    hits = text(sql).bindparams(**params).columns(fts_rowid=Integer, score=Float).subquery("fts_hits")
+    # bm25 is unbounded: map it to 0-1 the same way as ts_rank_cd
+    relevance = (hits.c.score / (hits.c.score + 1.0)).label("relevance")
+    return query.join(hits, hits.c.fts_rowid == literal_column("opportunities.rowid")), relevance
+
+
+def _ranked(query: Query, relevance, limit: int, offset: int) -> list:
+    return query.add_columns(relevance).order_by(desc("relevance"), desc(recently_active)).offset(offset).limit(limit).all()
@@ -1,22 +1,132 @@
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from sqlalchemy import DateTime
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from ..database import SessionLocal
 from ..models.opportunity import Opportunity
-from ..models.user import User
 from ..models.notification import Notification
 from ..scrapers.superteam import SuperteamScraper
 from ..scrapers.dorahacks import DoraHacksScraper
 from ..scrapers.code4rena import Code4renaScraper
 from ..scrapers.curated import CuratedScraper
-from .email_service import send_email, get_email_template
+from ..scrapers.base import run_concurrently
+from .email_service import send_emails, get_email_template
+from .notification_matcher import PreferenceIndex
 import asyncio
+import os
+import time
+import uuid
 
 from .curator import AgentCurator
 from .vector_db import VectorDBService
-from ..utils.text_processing import normalize_url, generate_content_hash, extract_deadline, extract_reward_pool, extract_skills, is_opportunity_fresh
+from .dedup import DedupIndex, content_signature
+from .near_duplicates import NearDuplicateIndex
+from .watermarks import load_watermarks, save_watermarks
+from .telemetry import RunTelemetry
+from .triage_cache import TriageCache
+from .domain_reputation import DomainReputationCache
+from . import dashboard_stats
+from ..core.cache import ResponseCache
+from .stages import Stage, StagedPipeline, StageStats, format_stats, run_sync
+from ..utils.rewards import apply_reward
+from ..utils.deadlines import extract_dates
+from ..utils.text_processing import normalize_url, extract_reward_pool, extract_skills, extract_chains, is_opportunity_fresh
+
+# Refined items are written in chunks of this size (one INSERT + one commit per chunk)
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "100"))
+# Items buffered between two pipeline stages before the upstream stage waits
+INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", "200"))
+# Concurrent triage batches (each already runs TRIAGE_CONCURRENCY items in parallel)
+INGEST_TRIAGE_WORKERS = int(os.getenv("INGEST_TRIAGE_WORKERS", "2"))
+# Concurrent enrich workers (trust scoring does a blocking DNS lookup)
+INGEST_ENRICH_WORKERS = int(os.getenv("INGEST_ENRICH_WORKERS", "4"))
+# Seconds a batching stage waits for a partial batch to fill up
+INGEST_LINGER = float(os.getenv("INGEST_LINGER", "0.5"))
+
+_OPPORTUNITY_COLUMNS = {c.key: c for c in Opportunity.__table__.columns}
+
+
+def _row_values(data: dict) -> dict:
+    """
+    Keep only Opportunity columns and coerce ISO date strings to datetimes
+    (scrapers and extract_deadline emit strings; SQLite rejects them).
+    """
+    row = {}
+    for key, value in data.items():
+        column = _OPPORTUNITY_COLUMNS.get(key)
+        if column is None:
+            continue
+        if isinstance(value, str) and isinstance(column.type, DateTime):
+            try:
+                value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                value = None
+        row[key] = value
+    return row
+
+
+_VECTOR_FIELDS = ("id", "title", "description", "tags", "category", "chain", "source", "reward_pool", "deadline")
+
+
+def _snapshot(opp: Opportunity) -> dict:
+    """Plain-dict copy of a saved row for the index/notify stages (no session access there)."""
+    return {
+        "id": str(opp.id),
+        "title": opp.title,
+        "description": opp.description,
+        "tags": opp.tags,
+        "category": opp.category,
+        "chain": opp.chain,
+        "source": opp.source,
+        "reward_pool": opp.reward_pool,
+        "deadline": opp.deadline,
+        "url": opp.url,
+    }
+
+
+def _source_of(opp_data: dict) -> str:
+    """Scraper that produced an item (its `source` field when ingested from a plain list)."""
+    return opp_data.get("_scraper") or opp_data.get("source") or "unknown"
+
+
+async def _iterate(items):
+    for item in items:
+        yield item
+
+
+def _insert_ignoring_conflicts(db: Session):
+    """Dialect-specific INSERT ... ON CONFLICT DO NOTHING for opportunities, or None if unsupported."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert(Opportunity).on_conflict_do_nothing()
+
 
 class IngestionPipeline:
-    def __init__(self):
-        self.scrapers = [
+    """
+    Streaming ingestion engine. Items flow through bounded queues:
+
+        fetch -> prepare -> triage -> enrich -> persist -> index -> notify
+
+    prepare:  normalize URL, content hash, dedup index, freshness (cheap, per item)
+    triage:   triage-cache lookup + concurrent AI classify/risk (batched)
+    enrich:   title dedup, trust score (DNS, off-loop), field extraction
+    persist:  bulk INSERT ... ON CONFLICT DO NOTHING, one commit per batch
+    index:    vector embeddings for the saved batch (off-loop)
+    notify:   user alerts for the saved batch (full runs only)
+
+    All DB work happens on the event-loop thread; only DNS and embedding run in
+    worker threads, on plain dicts. Per-stage counters are kept in self.stats.
+    """
+
+    def __init__(self, db: Session = None, batch_size: int = INGEST_BATCH_SIZE, scrapers: list = None, trigger: str = None):
+        self.scrapers = scrapers if scrapers is not None else [
             SuperteamScraper(),      # Live API — pulls 40+ real bounties
             DoraHacksScraper(),      # Curated real hackathons (API is WAF-protected)
             Code4renaScraper(),      # Security audit bounties
@@ -25,283 +135,450 @@ class IngestionPipeline:
         
         # Async scrapers disabled until Playwright is available in production
         self.async_scrapers = []
-        self.db = SessionLocal()
+        self.db = db or SessionLocal()
+        # Loaded lazily on first save; one index per pipeline run
+        self.dedup = None
+        self.near_dups = None
+        self.batch_size = max(1, batch_size)
+        self.stats: List[StageStats] = []
+        # Items dropped by an AI engine or DB error (they must be retried next run)
+        self.failed_items = 0
+        # Scrapers whose items were all handed to the pipeline
+        self._delivered = []
+        # Recorded as an IngestionRun per _ingest() call
+        self.trigger = trigger
+        self.telemetry: Optional[RunTelemetry] = None
+        self._origin = {}  # content_hash -> scraper, to attribute saved rows
+        self.preferences = None  # PreferenceIndex, built on the first notify batch
 
-    def run(self):
+    def run(self, notify: bool = True) -> dict:
         print("[Ingestion] Starting pipeline (AI Augmented)...")
-        total_new = 0
-        new_opps_list = [] # Store for notification processing
-        
-        # 1. Run Synchronous Scrapers
-        for scraper in self.scrapers:
-            try:
-                opportunities = scraper.run()
-                added_opps = self._save_opportunities(opportunities)
-                new_opps_list.extend(added_opps)
-                total_new += len(added_opps)
-            except Exception as e:
-                print(f"[Ingestion] Error running {scraper.source_name}: {e}")
-                self.db.rollback()
-
-        # 2. Run Asynchronous Scrapers
-        if self.async_scrapers:
-            print("[Ingestion] Running async scrapers (Playwright)...")
-            # Ensure clean state before async
+        try:
+            saved = run_sync(self._ingest(self._scraped_items(), notify=notify))
+            self._save_watermarks()
+        finally:
             self.db.close()
-            self.db = SessionLocal()
-            asyncio.run(self._run_async_scrapers(new_opps_list))
-            total_new += len(new_opps_list) # Note: List extended in place? No, need to return.
+        print(f"[Ingestion] Pipeline complete. {len(saved)} new opportunities.")
+        return self.summary(saved)
+
+    def _save_watermarks(self):
+        """Advance source watermarks, but only after a run in which no item was lost to an error."""
+        if self.failed_items or any(stage.errors for stage in self.stats):
+            print(f"[Ingestion] {self.failed_items} item(s) failed; keeping previous watermarks.")
+            return
+        try:
+            save_watermarks(self.db, self._delivered)
+        except Exception as e:
+            print(f"[Ingestion] Saving watermarks failed: {e}")
+            self.db.rollback()
+
+    def summary(self, saved: list) -> dict:
+        return {"new": len(saved), "stages": [s.as_dict() for s in self.stats]}
+
+    def _save_opportunities(self, opportunities):
+        """Ingest an already-scraped list; returns the newly stored Opportunity rows."""
+        return run_sync(self._ingest(_iterate(opportunities), notify=False))
+
+    async def _ingest(self, items, notify: bool) -> list:
+        if self.dedup is None:
+            self.dedup = DedupIndex.load(self.db)
+            self.near_dups = NearDuplicateIndex(self.db)
+
+        saved = []
+        self.telemetry = RunTelemetry(self.db, self.trigger)
+        self.telemetry.start()
+        self._threads = ThreadPoolExecutor(max_workers=INGEST_ENRICH_WORKERS + 1, thread_name_prefix="ingest")
+
+        async def prepare(opp_data):
+            return [opp_data] if self._prepare(opp_data) else []
+
+        async def triage(chunk):
+            return [refined for refined in await self._triage(chunk) if refined]
+
+        async def persist(rows):
+            batch = self._flush(rows)
+            saved.extend(batch)
+            for opp in batch:
+                self.telemetry.count(self._origin.get(opp.content_hash, opp.source), "saved")
+            return [_snapshot(opp) for opp in batch]
+
+        async def index(snapshots):
+            await self._offload(self._index, snapshots)
+            return snapshots
+
+        async def alert(snapshots):
+            await self._process_notifications(snapshots)
+            return []
+
+        stages = [
+            Stage("prepare", prepare),
+            Stage("triage", triage, workers=INGEST_TRIAGE_WORKERS, batch_size=self.batch_size, linger=INGEST_LINGER),
+            Stage("enrich", self._enrich, workers=INGEST_ENRICH_WORKERS),
+            Stage("persist", persist, batch_size=self.batch_size, linger=INGEST_LINGER),
+            Stage("index", index, batch_size=self.batch_size),
+        ]
+        if notify:
+            stages.append(Stage("notify", alert, batch_size=self.batch_size))
+
+        pipeline = StagedPipeline(stages, queue_size=INGEST_QUEUE_SIZE)
+        fetch_stats = StageStats("fetch", max(1, len(self.scrapers)))
+        self.stats = [fetch_stats] + pipeline.stats
+        fetch_stats.started_at = time.monotonic()
+        error = None
+        try:
+            await pipeline.run(self._timed(items, fetch_stats), fetch_stats)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self._threads.shutdown(wait=False)
+            if saved:
+                # Also after a failed run: the batches persisted so far are committed
+                self._after_save(saved)
+            self.telemetry.finish(
+                [stage.as_dict() for stage in self.stats],
+                error=error,
+                failed_items=self.failed_items + sum(stage.errors for stage in self.stats),
+            )
+
+        print("[Ingestion] Stage stats:\n" + format_stats(self.stats))
+        return saved
+
+    def _after_save(self, saved: list):
+        """Make newly stored rows visible to readers (every entry point saves through _ingest)."""
+        try:
+            dashboard_stats.refresh(self.db)
+        except Exception as e:
+            self.db.rollback()
+            print(f"[Ingestion] Dashboard stats refresh failed: {e}")
+        # Cached feed responses, and the /priority ranking snapshot in every process
+        ResponseCache.bump("opportunities")
+
+    @staticmethod
+    async def _timed(items, fetch_stats: StageStats):
+        async for item in items:
+            fetch_stats.items_in += 1
+            yield item
+        fetch_stats.finished_at = time.monotonic()
+        fetch_stats.busy_seconds = fetch_stats.wall_seconds
 
-        # Process Notifications async
-        if new_opps_list:
-            print(f"[Ingestion] Processing notifications for {len(new_opps_list)} new items...")
-            asyncio.run(self._process_notifications(new_opps_list))
+    async def _offload(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._threads, fn, *args)
 
-        self.db.close()
-        print(f"[Ingestion] Pipeline complete. Opportunities processed.")
+    async def _scraped_items(self):
+        """Items from every scraper, streamed as each source finishes fetching."""
+        loop = asyncio.get_running_loop()
+        inbox = asyncio.Queue(maxsize=INGEST_QUEUE_SIZE)
+        load_watermarks(self.db, self.scrapers)
+
+        def produce():
+            # Blocks on a full queue, so a slow pipeline throttles item hand-off
+            try:
+                for scraper, opportunities in run_concurrently(self.scrapers):
+                    print(f"[Ingestion] {scraper.source_name}: {len(opportunities)} items fetched.")
+                    self.telemetry.record_source(
+                        scraper.source_name,
+                        fetch_seconds=scraper.timings.get("fetch"),
+                        parse_seconds=scraper.timings.get("parse"),
+                        timed_out=scraper.timed_out,
+                    )
+                    self.telemetry.count(scraper.source_name, "found", len(opportunities))
+                    for opp_data in opportunities:
+                        opp_data["_scraper"] = scraper.source_name
+                        asyncio.run_coroutine_threadsafe(inbox.put(opp_data), loop).result()
+                    if scraper.next_watermark and not scraper.timed_out:
+                        # Also when every item was filtered out: the source's cursor still moved
+                        # past what it fetched. Timed-out or failed sources keep their old watermark.
+                        self._delivered.append(scraper)
+            finally:
+                asyncio.run_coroutine_threadsafe(inbox.put(None), loop).result()
+
+        fetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fetch")
+        producer = loop.run_in_executor(fetcher, produce)
+        try:
+            while (opp_data := await inbox.get()) is not None:
+                yield opp_data
+            await producer
+        finally:
+            fetcher.shutdown(wait=False)
 
-    async def _run_async_scrapers(self, new_opps_list):
         for scraper in self.async_scrapers:
             try:
                 print(f"[Ingestion] Running async scraper: {scraper.__class__.__name__}")
-                opportunities = await scraper.run_async()
-                print(f"[Ingestion] Scraper returned {len(opportunities)} items.")
-                
-                added_opps = self._save_opportunities(opportunities)
-                print(f"[Ingestion] Saved {len(added_opps)} new items from async scraper.")
-                
-                new_opps_list.extend(added_opps)
+                for opp_data in await scraper.run_async():
+                    yield opp_data
             except Exception as e:
                 print(f"[Ingestion] Error running async scraper: {e}")
-                self.db.rollback()
 
-    def _save_opportunities(self, opportunities):
-        added = []
-        for opp_data in opportunities:
-            # --- 0. Pre-processing & Deduplication ---
-            
-            # Normalize URL
-            raw_url = opp_data.get("url", "")
-            clean_url = normalize_url(raw_url)
-            opp_data["url"] = clean_url
-            
-            # Generate Hash (Title + Description + Source)
-            content_sig = f"{opp_data.get('title','')}{opp_data.get('description','')}{opp_data.get('source','')}"
-            content_hash = generate_content_hash(content_sig)
-            
-            # Check 1: ID constraint (Legacy check)
-            exists_id = self.db.query(Opportunity).filter(
-                Opportunity.source_id == str(opp_data["source_id"]),
-                Opportunity.source == opp_data["source"]
-            ).first()
-            if exists_id:
-                print(f"  - Exists (ID={exists_id.id}), skipping.")
-                continue
-
-            # Check 2: URL check (if URL exists)
-            if clean_url:
-                exists_url = self.db.query(Opportunity).filter(Opportunity.url == clean_url).first()
-                if exists_url:
-                    print(f"  - Exists (URL Match), skipping.")
-                    continue
-            
-            # Note: We probably want to add a `content_hash` column to DB later for faster lookup.
-            # For now, relying on Title match in step 2 is "good enough" for content dupes if titles are identical.
-
-            # --- 1. AI Triage & Refinement ---
-            # Freshness Check: Skip if deadline or created date is old (Pre-2026)
-            # Use raw data if refined not yet available
-            text_for_date = opp_data.get("description", "") + " " + opp_data.get("title", "")
-            found_deadline = extract_deadline(text_for_date)
-            
-            # If we explicitly find an old date, discard immediately
-            if found_deadline and not is_opportunity_fresh(found_deadline):
-                 print(f"  - Stale (Date: {found_deadline}), skipping.")
-                 continue
-
-            print(f"  ? Triaging: {opp_data['title'][:40]}...")
-            refined_data = AgentCurator.triage_and_refine(opp_data)
-            
+    async def _triage(self, chunk) -> list:
+        """
+        Refined dict (or None for noise) per item. Verdicts cached by content hash
+        are reused; only the rest go to the AI engine.
+        """
+        # Resolve the chunk's unseen domains while the AI engine works, so trust scoring hits the cache
+        dns = asyncio.create_task(DomainReputationCache.resolve_many(
+            opp_data.get("url", "") for opp_data in chunk if opp_data.get("source") != "manual"
+        ))
+        cached = TriageCache.lookup(self.db, [opp_data["content_hash"] for opp_data in chunk])
+        misses = [opp_data for opp_data in chunk if opp_data["content_hash"] not in cached]
+        print(f"  ? Triaging {len(misses)} items ({len(chunk) - len(misses)} cached)...")
+        self.telemetry.triage_cache_hits += len(chunk) - len(misses)
+
+        verdicts = dict(cached)
+        if misses:
+            fresh = await AgentCurator.assess_batch(misses)
+            for opp_data, (status, _) in zip(misses, fresh):
+                if status != "bypass":
+                    self.telemetry.llm_calls += 1
+                if status == "error":
+                    self.failed_items += 1
+            TriageCache.store(self.db, [
+                (opp_data["content_hash"], status, fields)
+                for opp_data, (status, fields) in zip(misses, fresh)
+            ])
+            for opp_data, verdict in zip(misses, fresh):
+                verdicts[opp_data["content_hash"]] = verdict
+
+        refined_chunk = [
+            AgentCurator.apply_verdict(opp_data, *verdicts[opp_data["content_hash"]])
+            for opp_data in chunk
+        ]
+        for opp_data, refined_data in zip(chunk, refined_chunk):
             if not refined_data:
                 print(f"  - Noise discarded.")
-                continue
-
-            # --- 2. Post-Refinement Deduplication ---
-            title_exists = self.db.query(Opportunity).filter(
-                Opportunity.title == refined_data["title"]
-            ).first()
-            if title_exists: 
-                print(f"  - Exists (Title Match), skipping.")
-                continue
-
-            # --- 3. Trust Protocol (Anti-Deception) ---
-            from ..utils.trust_engine import TrustEngine
-            trust_score = TrustEngine.calculate_score(refined_data)
-            refined_data["trust_score"] = trust_score
-            
-            if trust_score < 30:
-                print(f"  [Trust] HIGH RISK detected (Score: {trust_score}). Auto-flagging.")
-                refined_data["is_verified"] = False
-            elif trust_score > 85:
-                refined_data["is_verified"] = True
-
-            # --- 3. Enhanced Field Extraction ---
-            text_blob = (refined_data.get("description", "") or "") + " " + (refined_data.get("title", "") or "")
-            
-            # Deadline
-            current_deadline = refined_data.get("deadline")
-            extracted_deadline = extract_deadline(text_blob)
-            
-            if not current_deadline or "2024-01-01" in str(current_deadline): 
-                if extracted_deadline:
-                    refined_data["deadline"] = extracted_deadline
-                    print(f"    -> Extracted Deadline: {extracted_deadline}")
-            
-            # Reward Pool
-            if not refined_data.get("reward_pool") or refined_data.get("reward_pool") == "See Details":
-                extracted_reward = extract_reward_pool(text_blob)
-                if extracted_reward:
-                    refined_data["reward_pool"] = extracted_reward
-                    print(f"    -> Extracted Reward: {extracted_reward}")
-
-            # Skills & Tags
-            extracted_skills = extract_skills(text_blob)
-            existing_tags = refined_data.get("tags") or []
-            # Ensure List
-            if isinstance(existing_tags, str): existing_tags = [existing_tags]
-            
-            refined_data["required_skills"] = extracted_skills
-            refined_data["tags"] = list(set(existing_tags + extracted_skills))
-            
-            if extracted_skills:
-                 print(f"    -> Extracted Skills: {extracted_skills}")
-
-            print(f"  + Saving Refined: {refined_data['title'][:40]}...")
-            opp = Opportunity(**refined_data)
-            try:
-                self.db.add(opp)
-                self.db.commit() # Commit immediately to get ID
-                self.db.refresh(opp)
-                added.append(opp)
-                
-                # Vector Search Integration
+                status = verdicts[opp_data["content_hash"]][0]
+                self.telemetry.count(_source_of(opp_data), "errors" if status == "error" else "noise")
+        await dns
+        return refined_chunk
+
+    def _prepare(self, opp_data) -> bool:
+        """Normalize, dedup and freshness-check a raw item. True if it should be triaged."""
+        # --- 0. Pre-processing & Deduplication ---
+
+        # Normalize URL
+        raw_url = opp_data.get("url", "")
+        clean_url = normalize_url(raw_url)
+        opp_data["url"] = clean_url
+
+        # Hash of the raw content (Title + Description + Source), stored for O(1) lookups
+        opp_data["content_hash"] = content_signature(opp_data)
+
+        # ID, URL and content hash checks against the preloaded index
+        if "_scraper" not in opp_data:
+            # Lists handed to _save_opportunities have no fetch stage to count them
+            self.telemetry.count(_source_of(opp_data), "found")
+
+        duplicate_of = self.dedup.match(opp_data)
+        if duplicate_of:
+            print(f"  - Exists ({duplicate_of.upper()} match), skipping.")
+            self.telemetry.count(_source_of(opp_data), "duplicate")
+            return False
+
+        # Freshness Check: Skip if deadline or created date is old (Pre-2026)
+        # Use raw data if refined not yet available
+        text_for_date = (opp_data.get("description", "") or "") + " " + (opp_data.get("title", "") or "")
+        dates = extract_dates([text_for_date])[0]
+        found_deadline = dates.deadline
+        # Reused by _enrich when triage leaves the text unchanged
+        opp_data["_dates"] = (text_for_date, dates)
+
+        # If we explicitly find an old date, discard immediately
+        if found_deadline and not is_opportunity_fresh(found_deadline):
+             print(f"  - Stale (Date: {found_deadline}), skipping.")
+             self.telemetry.count(_source_of(opp_data), "stale")
+             return False
+
+        # Same listing from another platform under a slightly different title/URL
+        near_dup = self.near_dups.find(opp_data)
+        if near_dup:
+            source, title, score = near_dup
+            print(f"  - Near-duplicate of '{title[:40]}' from {source} ({score:.2f}), skipping.")
+            self.telemetry.count(_source_of(opp_data), "near_duplicate")
+            return False
+
+        # Claim the identity keys now so a repeat later in the run is not triaged twice
+        self.dedup.add(opp_data, title=False)
+        self.near_dups.remember(opp_data)
+        return True
+
+    async def _enrich(self, refined_data) -> list:
+        """Title dedup, trust scoring and field extraction. Returns [row to insert] or []."""
+        # --- 2. Post-Refinement Deduplication ---
+        if self.dedup.has_title(refined_data.get("title")):
+            print(f"  - Exists (Title Match), skipping.")
+            self.telemetry.count(_source_of(refined_data), "duplicate")
+            return []
+        # Claim the title before yielding to other enrich workers
+        self.dedup.add(refined_data)
+
+        # --- 3. Trust Protocol (Anti-Deception) ---
+        from ..utils.trust_engine import TrustEngine
+        trust_score = await self._offload(TrustEngine.calculate_score, refined_data)
+        refined_data["trust_score"] = trust_score
+
+        if trust_score < 30:
+            print(f"  [Trust] HIGH RISK detected (Score: {trust_score}). Auto-flagging.")
+            refined_data["is_verified"] = False
+        elif trust_score > 85:
+            refined_data["is_verified"] = True
+
+        # --- 3. Enhanced Field Extraction ---
+        text_blob = (refined_data.get("description", "") or "") + " " + (refined_data.get("title", "") or "")
+
+        # Deadline & start date (extracted once in _prepare unless triage rewrote the text)
+        seen_text, dates = refined_data.pop("_dates", (None, None))
+        if seen_text != text_blob:
+            dates = extract_dates([text_blob])[0]
+        current_deadline = refined_data.get("deadline")
+        extracted_deadline = dates.deadline
+
+        if not current_deadline or "2024-01-01" in str(current_deadline):
+            if extracted_deadline:
+                refined_data["deadline"] = extracted_deadline
+                print(f"    -> Extracted Deadline: {extracted_deadline}")
+        if not refined_data.get("start_date") and dates.start_date:
+            refined_data["start_date"] = dates.start_date
+
+        # Reward Pool
+        if not refined_data.get("reward_pool") or refined_data.get("reward_pool") == "See Details":
+            extracted_reward = extract_reward_pool(text_blob)
+            if extracted_reward:
+                refined_data["reward_pool"] = extracted_reward
+                print(f"    -> Extracted Reward: {extracted_reward}")
+
+        # Numeric reward, so readers never re-parse reward_pool strings
+        apply_reward(refined_data)
+
+        # Skills & Tags
+        extracted_skills = extract_skills(text_blob)
+        existing_tags = refined_data.get("tags") or []
+        # Ensure List
+        if isinstance(existing_tags, str): existing_tags = [existing_tags]
+
+        refined_data["required_skills"] = extracted_skills
+        refined_data["tags"] = list(set(existing_tags + extracted_skills))
+
+        if extracted_skills:
+             print(f"    -> Extracted Skills: {extracted_skills}")
+
+        # Chain, when neither the scraper nor the AI engine provided one
+        if not refined_data.get("chain"):
+            chains = extract_chains(text_blob)
+            if chains:
+                refined_data["chain"] = chains[0] if len(chains) == 1 else "Multi-chain"
+
+        print(f"  + Queued Refined: {refined_data['title'][:40]}...")
+        self._origin[refined_data["content_hash"]] = _source_of(refined_data)
+        return [_row_values(refined_data)]
+
+    def _flush(self, rows: list) -> list:
+        """
+        Persist a chunk of refined rows in one round-trip and one commit.
+        """
+        if not rows:
+            return []
+        try:
+            saved = self._insert_opportunities(rows)
+        except Exception as e:
+            # One bad row must not sink the chunk: retry row by row
+            print(f"[Ingestion] Batch insert failed ({e}), retrying {len(rows)} rows individually...")
+            self.db.rollback()
+            saved = []
+            for row in rows:
                 try:
-                    vector_payload = {
-                        "id": str(opp.id),
-                        "title": opp.title,
-                        "description": opp.description,
-                        "tags": opp.tags,
-                        "category": opp.category,
-                        "chain": opp.chain,
-                        "source": opp.source,
-                        "reward_pool": opp.reward_pool,
-                        "deadline": opp.deadline
-                    }
-                    VectorDBService.add_opportunity(vector_payload)
-                except Exception as ve:
-                    print(f"  [VectorDB] Creating embedding failed (skipping): {ve}")
+                    saved.extend(self._insert_opportunities([row]))
+                except Exception as row_e:
+                    print(f"  - Error saving item: {row_e}")
+                    self.failed_items += 1
+                    self.db.rollback()
 
-            except Exception as e:
-                print(f"  - Error saving item: {e}")
-                self.db.rollback()
-        
-        return added
+        print(f"[Ingestion] Saved batch: {len(saved)} new, {len(rows) - len(saved)} already stored.")
+        return saved
+
+    @staticmethod
+    def _index(snapshots: list):
+        """Vector Search Integration (runs in a worker thread; snapshots are plain dicts)."""
+        try:
+            VectorDBService.add_opportunities([
+                {key: snap[key] for key in _VECTOR_FIELDS}
+                for snap in snapshots
+            ])
+        except Exception as ve:
+            print(f"  [VectorDB] Creating embeddings failed (skipping): {ve}")
+
+    def _insert_opportunities(self, rows: list) -> list:
+        """
+        Bulk INSERT ... ON CONFLICT DO NOTHING RETURNING against the (source, source_id)
+        and url unique indexes. Returns only the rows that were actually inserted.
+        """
+        stmt = _insert_ignoring_conflicts(self.db)
+        if stmt is None:
+            # Dialect without ON CONFLICT support: let the unique indexes reject rows
+            saved = []
+            for values in rows:
+                opp = Opportunity(**values)
+                try:
+                    with self.db.begin_nested():
+                        self.db.add(opp)
+                    saved.append(opp)
+                except IntegrityError:
+                    pass
+        else:
+            saved = list(self.db.scalars(stmt.returning(Opportunity), rows))
+
+        ids = [opp.id for opp in saved]
+        # Same transaction, so a saved row is never missing from the LSH buckets
+        NearDuplicateIndex.index_saved(self.db, saved)
+        self.db.commit()
+        if not ids:
+            return []
+        # Objects expire on commit; reload the whole chunk in a single query
+        return self.db.query(Opportunity).filter(Opportunity.id.in_(ids)).all()
 
     async def _process_notifications(self, new_opps):
-        # Fetch users who want email alerts
-        # Use a FRESH session for async notification logic or manual sync loop.
-        # But for best practices, let's keep it simple: sync data read, async send.
-        
+        """
+        Match a batch of new opportunities against user preferences and fan out
+        web notifications (one bulk INSERT) and emails (bounded concurrency).
+        new_opps are plain snapshots (see _snapshot), safe to use across sessions.
+        """
         notify_db = SessionLocal()
         try:
-            users = notify_db.query(User).all()
-            
-            # Since objects from new_opps are from self.db, they might be detached or in another session.
-            # We should re-fetch or use IDs. But simpler: just use dictionary or detached data.
-            # Convert opps to simple dicts to avoid SQLAlchemy detachment issues in async context.
-            opp_dicts = []
+            # Users are indexed once per run, then reused for every saved batch
+            if self.preferences is None:
+                self.preferences = PreferenceIndex.load(notify_db)
+
+            notifications = []
+            emails = []
             for opp in new_opps:
-                opp_dicts.append({
-                    "id": opp.id,
-                    "title": opp.title,
-                    "category": opp.category,
-                    "chain": opp.chain,
-                    "reward_pool": opp.reward_pool,
-                    "description": opp.description,
-                    "url": opp.url
-                })
-
-            for opp in opp_dicts:
-                for user in users:
-                    # Check preferences
-                    prefs = user.notification_settings or {}
-                    if not prefs.get("email_alerts", True): # Default True
-                        continue
-                    
-                    # Respect frequency preference — skip instant if user wants digest only
-                    freq = prefs.get("frequency", "instant")
-                    if freq != "instant":
-                        continue
-                    
-                    # Respect new_opportunities toggle
-                    if not prefs.get("new_opportunities", True):
-                        continue
-                    
-                    # Respect AI score threshold
-                    ai_threshold = prefs.get("ai_score_threshold", 0)
-                    # Note: at ingestion time ai_score may not be set yet, so default pass
-
-                    # Respect category filters
-                    user_pref_cats = prefs.get("categories", [])
-                    if user_pref_cats:
-                        opp_cat = (opp["category"] or "").lower()
-                        # Map plural form from frontend to singular model category
-                        cat_map = {"grants": "grant", "hackathons": "hackathon", "bounties": "bounty", 
-                                   "airdrops": "airdrop", "testnets": "testnet", "ambassador": "ambassador", "jobs": "job"}
-                        allowed_cats = [cat_map.get(c, c) for c in user_pref_cats]
-                        if opp_cat and opp_cat not in allowed_cats:
-                            continue
-
-                    # Match Logic:
-                    # 1. Category Match
-                    user_cats = [c.lower() for c in (user.preferred_categories or [])]
-                    cat_match = not user_cats or (opp["category"] and opp["category"].lower() in user_cats)
-                    
-                    # 2. Chain Match
-                    user_chains = [c.lower() for c in (user.preferred_chains or [])]
-                    chain_match = not user_chains or (opp["chain"] and opp["chain"].lower() in user_chains)
-                    
-                    # 3. Skills Match (Keyword search in description)
-                    user_skills = [s.lower() for s in (user.skills or [])]
-                    text_blob = (opp["description"] or "") + (opp["title"] or "")
-                    skill_match = not user_skills or any(s in text_blob.lower() for s in user_skills)
-                    
-                    # If matches (any of the valid criteria - usually stricter, but flexible for now)
-                    is_relevant = (cat_match and chain_match) or skill_match
-                    
-                    if is_relevant:
-                        # Create Web Notification (Sync DB write)
-                        notif = Notification(
-                            user_id=user.id,
-                            title=f"New Opportunity: {opp['title']}",
-                            message=f"A new {opp['category']} on {opp['chain']} matches your profile.",
-                            type="opportunity",
-                            link=f"/opportunities/{opp['id']}"
-                        )
-                        notify_db.add(notif)
-                        
-                        # Send Email (Async)
-                        if user.email:
-                            body_html = get_email_template(
-                                title=f"New Match: {opp['title']}",
-                                body=f"We found a new opportunity that matches your preferences.<br><br><strong>Category:</strong> {opp['category']}<br><strong>Chain:</strong> {opp['chain']}<br><strong>Reward:</strong> {opp['reward_pool'] or 'Unspecified'}<br><br>{opp['description'][:200]}...",
-                                cta_link=opp["url"],
-                                cta_text="View Details"
-                            )
-                            # Using await here
-                            await send_email(user.email, f"New Opportunity found: {opp['title']}", body_html)
-            
-            notify_db.commit()
+                recipients = self.preferences.match(opp)
+                if not recipients:
+                    continue
+
+                # Same content for every recipient of this opportunity
+                subject = f"New Opportunity found: {opp['title']}"
+                body_html = get_email_template(
+                    title=f"New Match: {opp['title']}",
+                    body=f"We found a new opportunity that matches your preferences.<br><br><strong>Category:</strong> {opp['category']}<br><strong>Chain:</strong> {opp['chain']}<br><strong>Reward:</strong> {opp['reward_pool'] or 'Unspecified'}<br><br>{(opp['description'] or '')[:200]}...",
+                    cta_link=opp["url"],
+                    cta_text="View Details"
+                )
+                for user in recipients:
+                    notifications.append({
+                        "id": uuid.uuid4(),
+                        "user_id": user.id,
+                        "title": f"New Opportunity: {opp['title']}",
+                        "message": f"A new {opp['category']} on {opp['chain']} matches your profile.",
+                        "type": "opportunity",
+                        "link": f"/opportunities/{opp['id']}",
+                    })
+                    if user.email:
+                        emails.append((user.email, subject, body_html))
+
+            if notifications:
+                notify_db.execute(Notification.__table__.insert(), notifications)
+                notify_db.commit()
+            sent = await send_emails(emails)
+            print(f"[Notify] {len(notifications)} notifications, {sent}/{len(emails)} emails for {len(new_opps)} opportunities.")
         except Exception as e:
             print(f"[Ingestion] Notification Error: {e}")
             notify_db.rollback()
@@ -311,18 +588,25 @@ class IngestionPipeline:
 from dotenv import load_dotenv
 
 
+def ingest_opportunities(db: Session, opportunities: list, trigger: str = None):
+    """
+    Ingest a batch of scraped opportunities with a single dedup index.
+    Used by Celery tasks.
+    """
+    pipeline = IngestionPipeline(db=db, trigger=trigger)
+    return pipeline._save_opportunities(opportunities)
+
+
 def ingest_opportunity(db: Session, opp_data: dict):
     """
     Standalone function to ingest a single opportunity.
-    Used by Celery tasks.
+    Prefer ingest_opportunities for scraper batches.
     """
-    pipeline = IngestionPipeline()
-    pipeline.db = db
-    return pipeline._save_opportunities([opp_data])
+    return ingest_opportunities(db, [opp_data])
 
 def run_pipeline():
     load_dotenv()
-    pipeline = IngestionPipeline()
+    pipeline = IngestionPipeline(trigger="run_pipeline")
     pipeline.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+"""
+Near-duplicate detection across sources with MinHash + LSH banding.
+
+The same event is often listed by several platforms with slightly different
+titles and URLs, so exact title/URL/hash checks miss it. Each opportunity's
+normalized title + description is shingled into character 4-grams and reduced
+to a NUM_PERM MinHash signature, then split into BANDS bands. Two items sharing
+any band are candidates; candidates are confirmed by their estimated Jaccard
+similarity.
+
+Bands of stored opportunities live in opportunity_lsh_buckets (primary key
+leads with band_key), so a lookup is one indexed `IN` query regardless of table
+size. The table is maintained incrementally as the pipeline saves rows;
+app/scripts/build_lsh_index.py backfills rows stored before it existed.
+"""
+
+import os
+import random
+import re
+from collections import defaultdict
+from hashlib import blake2b
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..models.opportunity import Opportunity
+from ..models.near_duplicate import OpportunityFingerprint, OpportunityLSHBucket
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS  # 4 rows per band: candidate pairs start around Jaccard 0.5
+SHINGLE_SIZE = 4
+# Text beyond this is ignored; listing boilerplate tends to follow the summary
+MAX_TEXT_CHARS = 1000
+# Below this many shingles there is too little text to call anything a duplicate
+MIN_SHINGLES = 24
+
+# Estimated Jaccard similarity at which two listings are the same opportunity
+NEAR_DUP_THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", "0.7"))
+
+# Each "permutation" is an XOR mask over 32-bit shingle hashes, so the min can be
+# taken with map() at C speed. Fixed seed: stored signatures must stay comparable.
+_rng = random.Random(20260301)
+_MASKS = [_rng.getrandbits(32) for _ in range(NUM_PERM)]
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def shingles(text: str) -> set:
+    normalized = _NON_WORD.sub(" ", (text or "").lower()).strip()[:MAX_TEXT_CHARS]
+    return {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+
+def signature_text(opp_data: Dict) -> str:
+    return f"{opp_data.get('title') or ''} {opp_data.get('description') or ''}"
+
+
+def minhash(text: str) -> Optional[List[int]]:
+    """NUM_PERM-value MinHash signature, or None if the text is too short to judge."""
+    grams = shingles(text)
+    if len(grams) < MIN_SHINGLES:
+        return None
+    hashes = [int.from_bytes(blake2b(g.encode(), digest_size=4).digest(), "little") for g in grams]
+    return [min(map(mask.__xor__, hashes)) for mask in _MASKS]
+
+
+def band_keys(signature: List[int]) -> List[str]:
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS:(band + 1) * ROWS]
+        digest = blake2b(",".join(map(str, rows)).encode(), digest_size=8).hexdigest()
+        keys.append(f"{band}:{digest}")
+    return keys
+
+
+def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    """Estimated Jaccard similarity of the two shingle sets."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    """
+    Per-run view over the persisted LSH buckets plus the items seen earlier in
+    the run. Only listings from a *different* source count as duplicates: one
+    platform's items are already told apart by source_id, and template-heavy
+    sources (bounty boards) would otherwise collapse into each other.
+    """
+
+    def __init__(self, db: Session, threshold: float = None):
+        self.db = db
+        self.threshold = NEAR_DUP_THRESHOLD if threshold is None else threshold
+        self._buckets: Dict[str, set] = defaultdict(set)
+        self._seen: Dict[int, Tuple[str, str, List[int]]] = {}
+
+    def find(self, opp_data: Dict) -> Optional[Tuple[str, str, float]]:
+        """(source, title, similarity) of the closest cross-source near-duplicate, or None."""
+        signature = minhash(signature_text(opp_data))
+        opp_data["_minhash"] = signature
+        if signature is None:
+            return None
+        keys = band_keys(signature)
+        source = (opp_data.get("source") or "").lower()
+
+        candidates = []
+        for key in keys:
+            for seen_id in self._buckets.get(key, ()):
+                candidates.append(self._seen[seen_id])
+        if self.db is not None:
+            rows = (
+                self.db.query(Opportunity.source, Opportunity.title, OpportunityFingerprint.signature)
+                .join(OpportunityLSHBucket, OpportunityLSHBucket.opportunity_id == Opportunity.id)
+                .join(OpportunityFingerprint, OpportunityFingerprint.opportunity_id == Opportunity.id)
+                .filter(OpportunityLSHBucket.band_key.in_(keys))
+                .distinct()
+                .all()
+            )
+            candidates.extend((row.source, row.title, row.signature) for row in rows)
+
+        best = None
+        for cand_source, cand_title, cand_signature in candidates:
+            if (cand_source or "").lower() == source:
+                continue
+            score = similarity(signature, cand_signature)
+            if score >= self.threshold and (best is None or score > best[2]):
+                best = (cand_source, cand_title, score)
+        return best
+
+    def remember(self, opp_data: Dict):
+        """Make an item visible to later lookups in this run (before it is saved)."""
+        signature = opp_data.get("_minhash")
+        if signature is None:
+            return
+        seen_id = len(self._seen)
+        self._seen[seen_id] = (opp_data.get("source"), opp_data.get("title"), signature)
+        for key in band_keys(signature):
+            self._buckets[key].add(seen_id)
+
+    @staticmethod
+    def index_saved(db: Session, opportunities: List[Opportunity]) -> int:
+        """Persist fingerprints + bands for freshly saved rows. Caller commits."""
+        fingerprints, buckets = [], []
+        for opp in opportunities:
+            signature = minhash(signature_text({"title": opp.title, "description": opp.description}))
+            if signature is None:
+                continue
+            fingerprints.append({"opportunity_id": opp.id, "signature": signature})
+            buckets.extend({"band_key": key, "opportunity_id": opp.id} for key in set(band_keys(signature)))
+        if fingerprints:
+            db.execute(OpportunityFingerprint.__table__.insert(), fingerprints)
+            db.execute(OpportunityLSHBucket.__table__.insert(), buckets)
+        return len(fingerprints)
@@ -0,0 +1,132 @@
+"""
+Inverted preference index for new-opportunity notifications.
+
+Instead of testing every (opportunity, user) pair, users are loaded once per run
+and indexed by the preference values they filter on. Matching an opportunity is
+then a handful of set lookups and intersections:
+
+    allowed  = users whose notification categories admit the opportunity's category
+    by_cat   = users with no preferred categories  | users preferring its category
+    by_chain = users with no preferred chains      | users preferring its chain
+    by_skill = users with no skills                | users with a skill found in its text
+    matched  = allowed & ((by_cat & by_chain) | by_skill)
+
+which is exactly the per-pair rule the pipeline used before. Skills are matched
+as substrings of title + description like before, but once per *distinct* skill
+rather than once per user.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from ..models.user import User
+
+# notification_settings.categories uses the frontend's plural names
+CATEGORY_ALIASES = {
+    "grants": "grant", "hackathons": "hackathon", "bounties": "bounty",
+    "airdrops": "airdrop", "testnets": "testnet", "ambassador": "ambassador", "jobs": "job",
+}
+
+
+class Recipient:
+    __slots__ = ("id", "email")
+
+    def __init__(self, id, email):
+        self.id = id
+        self.email = email
+
+
+class PreferenceIndex:
+    def __init__(self):
+        self.recipients: List[Recipient] = []
+        self.everyone: Set[int] = set()
+
+        # notification_settings.categories filter
+        self.any_category_filter: Set[int] = set()
+        self.allowed_by_category: Dict[str, Set[int]] = defaultdict(set)
+
+        # profile preferences
+        self.no_preferred_category: Set[int] = set()
+        self.by_category: Dict[str, Set[int]] = defaultdict(set)
+        self.no_preferred_chain: Set[int] = set()
+        self.by_chain: Dict[str, Set[int]] = defaultdict(set)
+        self.no_skills: Set[int] = set()
+        self.by_skill: Dict[str, Set[int]] = defaultdict(set)
+
+    @classmethod
+    def load(cls, db: Session) -> "PreferenceIndex":
+        """Index every user who wants instant new-opportunity alerts (one query, columns only)."""
+        rows = db.query(
+            User.id,
+            User.email,
+            User.notification_settings,
+            User.preferred_categories,
+            User.preferred_chains,
+            User.skills,
+        ).all()
+        index = cls()
+        for row in rows:
+            index.add(row.id, row.email, row.notification_settings, row.preferred_categories,
+                      row.preferred_chains, row.skills)
+        print(f"[Notify] Preference index: {len(index.recipients)} of {len(rows)} users want instant alerts.")
+        return index
+
+    def add(self, user_id, email, settings, categories, chains, skills):
+        prefs = settings or {}
+        if not prefs.get("email_alerts", True): # Default True
+            return
+        # Respect frequency preference — skip instant if user wants digest only
+        if prefs.get("frequency", "instant") != "instant":
+            return
+        # Respect new_opportunities toggle
+        if not prefs.get("new_opportunities", True):
+            return
+
+        uid = len(self.recipients)
+        self.recipients.append(Recipient(user_id, email))
+        self.everyone.add(uid)
+
+        allowed = prefs.get("categories", [])
+        if allowed:
+            for category in allowed:
+                self.allowed_by_category[CATEGORY_ALIASES.get(category, category)].add(uid)
+        else:
+            self.any_category_filter.add(uid)
+
+        _index_values(uid, categories, self.no_preferred_category, self.by_category)
+        _index_values(uid, chains, self.no_preferred_chain, self.by_chain)
+        _index_values(uid, skills, self.no_skills, self.by_skill)
+
+    def match(self, opp: Dict) -> List[Recipient]:
+        category = (opp.get("category") or "").lower()
+        chain = (opp.get("chain") or "").lower()
+
+        if category:
+            allowed = self.any_category_filter | self.allowed_by_category.get(category, set())
+        else:
+            allowed = self.everyone
+        if not allowed:
+            return []
+
+        by_cat = self.no_preferred_category | (self.by_category.get(category, set()) if category else set())
+        by_chain = self.no_preferred_chain | (self.by_chain.get(chain, set()) if chain else set())
+
+        text_blob = ((opp.get("description") or "") + (opp.get("title") or "")).lower()
+        by_skill = set(self.no_skills)
+        for skill, users in self.by_skill.items():
+            if skill in text_blob:
+                by_skill |= users
+
+        matched = allowed & ((by_cat & by_chain) | by_skill)
+        return [self.recipients[uid] for uid in matched]
+
+
+def _index_values(uid: int, values: Optional[list], wildcard: Set[int], index: Dict[str, Set[int]]):
+    values = [v.lower() for v in (values or []) if isinstance(v, str)]
+    if not values:
+        wildcard.add(uid)
+        return
+    for value in values:
+        index[value].add(uid)
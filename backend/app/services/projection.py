@@ -0,0 +1,107 @@
+"""
+Column projections and sparse fieldsets for opportunity lists.
+
+List endpoints accept `view=summary` (the card fields of OpportunitySummary)
+or `fields=title,deadline,...` (any OpportunityResponse field, computed
+aliases included). Only the columns behind the requested fields are loaded
+(description / ai_summary / ai_strategy stay in the database unless asked
+for), and rows are turned into plain dicts with the same values the pydantic
+schemas produce, ready for core/responses.py to serialize.
+
+    fields = resolve_fields(view, fields)           # InvalidFields on unknown names
+    rows = db.query(*columns_for(fields)).filter(...).all()
+    return FastJSONResponse(project(rows, fields))
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..models.opportunity import Opportunity
+from ..schemas.opportunity import OpportunityResponse, OpportunitySummary, coerce_ai_score
+
+VIEWS = ("full", "summary")
+
+
+class InvalidFields(ValueError):
+    pass
+
+
+class Computed(NamedTuple):
+    needs: Tuple[str, ...]            # stored fields the value is derived from
+    value: Callable[[dict], object]
+
+
+# Mirrors the computed fields on OpportunityResponse (tests compare the two)
+COMPUTED: Dict[str, Computed] = {
+    "type": Computed(("category",), lambda r: r["category"]),
+    "reward": Computed(("reward_pool",), lambda r: r["reward_pool"]),
+    "score": Computed(("ai_score",), lambda r: r["ai_score"]),
+    "summary": Computed(("ai_summary", "description"),
+                        lambda r: r["ai_summary"] or (r["description"][:300] if r["description"] else "")),
+    "strategy": Computed(("ai_strategy",),
+                         lambda r: r["ai_strategy"] or "Focus on community engagement and technical excellence."),
+    "requirements": Computed(("mission_requirements", "required_skills"),
+                             lambda r: r["mission_requirements"] or r["required_skills"]),
+}
+
+STORED = tuple(OpportunityResponse.model_fields)
+FULL_FIELDS = STORED + tuple(COMPUTED)
+SUMMARY_FIELDS = tuple(OpportunitySummary.model_fields) + ("type", "reward", "score")
+
+# What a NULL column becomes (the schemas would reject None for these)
+_DEFAULTS = {
+    name: field.default for name, field in OpportunityResponse.model_fields.items()
+    if field.default is not None and not field.is_required()
+}
+
+
+def resolve_fields(view: str = "full", fields: Optional[str] = None) -> Tuple[str, ...]:
+    """Output fields for a request: `fields` (comma-separated) wins over `view`. `id` is always included."""
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(FULL_FIELDS))
+        if unknown:
+            raise InvalidFields(f"Unknown field(s): {', '.join(unknown)}")
+        return tuple(dict.fromkeys(["id"] + requested))
+    if view not in VIEWS:
+        raise InvalidFields(f"Unknown view: {view}")
+    return SUMMARY_FIELDS if view == "summary" else FULL_FIELDS
+
+
+def stored_fields(fields: Tuple[str, ...], extra: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+    """Stored columns needed for `fields` (computed ones expanded) plus `extra`."""
+    needed = []
+    for name in fields + extra:
+        needed.extend(COMPUTED[name].needs if name in COMPUTED else (name,))
+    return tuple(dict.fromkeys(needed))
+
+
+def columns_for(fields: Tuple[str, ...], extra: Tuple[str, ...] = ("updated_at", "created_at")) -> list:
+    """
+    Opportunity columns for db.query(*columns). `extra` defaults to the
+    recency columns keyset pagination reads back from the last row.
+    """
+    return [getattr(Opportunity, name) for name in stored_fields(fields, extra)]
+
+
+def project(rows, fields: Tuple[str, ...], updates: Optional[List[dict]] = None) -> List[dict]:
+    """
+    Rows (column tuples or ORM objects) as dicts holding exactly `fields`.
+    `updates[i]` overrides stored values of row i before computed fields are
+    derived (e.g. a personalized ai_score).
+    """
+    stored = stored_fields(fields)
+    computed = [(name, COMPUTED[name].value) for name in fields if name in COMPUTED]
+    out = []
+    for i, row in enumerate(rows):
+        values = {name: getattr(row, name) for name in stored}
+        if updates and updates[i]:
+            values.update(updates[i])
+        for name, default in _DEFAULTS.items():
+            if name in values and values[name] is None:
+                values[name] = default
+        if "ai_score" in values:
+            values["ai_score"] = coerce_ai_score(values["ai_score"])
+        for name, value in computed:
+            values[name] = value(values)
+        out.append({name: values[name] for name in fields})
+    return out
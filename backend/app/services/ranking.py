@@ -0,0 +1,248 @@
+"""
+Personalized ranking for /opportunities/priority.
+
+A user's score for an opportunity is its stored ai_score plus a match bonus
+(+5 per user skill found in its tags / required skills, +10 when its chain is
+one of the user's preferred chains), capped at 100.
+
+Instead of loading and re-lowercasing every open row per request, a feature
+snapshot is built from a column-only query and kept for RANKING_SNAPSHOT_TTL
+seconds:
+
+    order     open opportunities presorted by (base score, recency)
+    by_term   lowercased tag / required skill -> opportunities carrying it
+    by_chain  lowercased chain -> its opportunities, presorted by score + chain bonus
+
+Opportunities matching one of the user's skills are ranked with a top-k heap;
+everything else has a fixed bonus per chain, so those come lazily from the
+presorted lists. The streams are merged, and a page costs
+O(skill matches * log k + k) rather than a pass over the whole table.
+Pages are cursor-based (the cursor is the sort key of the last item), and
+results are cached per (preferences, cursor, limit) for RANKING_RESULT_TTL
+seconds.
+
+Writers do not invalidate the snapshot directly: they bump the
+"opportunities" version of the response cache (core/cache.py), which is
+shared through Redis when CACHE_REDIS_URL is set, and a snapshot built under
+an older version is rebuilt on its next use. Writes from Celery workers thus
+reach every API process; without Redis only same-process writes do, and
+RANKING_SNAPSHOT_TTL bounds the staleness.
+"""
+
+import heapq
+import os
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ..core.cache import ResponseCache
+from ..models.opportunity import Opportunity
+from ..utils.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+RANKING_SNAPSHOT_TTL = int(os.getenv("RANKING_SNAPSHOT_TTL", "120"))
+RANKING_RESULT_TTL = int(os.getenv("RANKING_RESULT_TTL", "30"))
+RANKING_RESULT_CACHE_SIZE = 4096
+# Response cache namespace whose version a snapshot is built under
+VERSION_NAMESPACE = "opportunities"
+
+SKILL_MATCH_BONUS = 5
+CHAIN_MATCH_BONUS = 10
+MAX_SCORE = 100
+
+SortKey = Tuple[int, float, str]   # (-score, -recency, id): ascending = best first
+
+
+class RankedItem(NamedTuple):
+    id: object      # Opportunity.id
+    score: int      # personalized score, 0-100
+
+
+class RankedPage(NamedTuple):
+    items: List[RankedItem]
+    next_cursor: Optional[str]
+
+
+def base_score(ai_score) -> int:
+    """Stored ai_score as an int 0-100 (older rows hold 0.0-1.0 similarity floats)."""
+    if ai_score is None:
+        return 0
+    if isinstance(ai_score, float):
+        return int(round(ai_score * 100)) if ai_score < 1.0 else int(round(ai_score))
+    return int(ai_score)
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value else None
+
+
+def _decode_key(cursor: str) -> SortKey:
+    neg_score, neg_recency, opp_id = decode_cursor(cursor, 3)
+    try:
+        return int(neg_score), float(neg_recency), str(opp_id)
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+
+
+class FeatureSnapshot:
+    def __init__(self, rows: Iterable, built_at: float = None, version: Optional[int] = None):
+        self.built_at = built_at or time.monotonic()
+        self.version = version
+        self.ids: list = []
+        self.scores: List[int] = []
+        self.recency: List[float] = []
+        self.deadlines: List[Optional[float]] = []
+        self.chains: List[Optional[str]] = []
+        self.by_term: Dict[str, List[int]] = defaultdict(list)
+
+        for row in rows:
+            idx = len(self.ids)
+            self.ids.append(row.id)
+            self.scores.append(min(base_score(row.ai_score), MAX_SCORE))
+            self.recency.append(_timestamp(row.updated_at or row.created_at) or 0.0)
+            self.deadlines.append(_timestamp(row.deadline))
+            terms = {t.lower() for t in (row.tags or []) + (row.required_skills or []) if isinstance(t, str)}
+            for term in terms:
+                self.by_term[term].append(idx)
+            self.chains.append(row.chain.lower() if row.chain else None)
+
+        self.order = sorted(range(len(self.ids)), key=lambda i: self.key(i, self.scores[i]))
+        self.keys = [self.key(i, self.scores[i]) for i in self.order]
+
+        # Per chain, sorted by the score a user preferring that chain sees
+        members: Dict[str, List[int]] = defaultdict(list)
+        for idx, chain in enumerate(self.chains):
+            if chain:
+                members[chain].append(idx)
+        self.by_chain: Dict[str, Tuple[List[SortKey], List[int]]] = {}
+        for chain, idxs in members.items():
+            keyed = sorted((self.key(i, min(self.scores[i] + CHAIN_MATCH_BONUS, MAX_SCORE)), i) for i in idxs)
+            self.by_chain[chain] = ([k for k, _ in keyed], [i for _, i in keyed])
+
+    @classmethod
+    def load(cls, db: Session, version: Optional[int] = None) -> "FeatureSnapshot":
+        """Open, unexpired opportunities (one query, ranking columns only)."""
+        rows = db.query(
+            Opportunity.id,
+            Opportunity.ai_score,
+            Opportunity.tags,
+            Opportunity.required_skills,
+            Opportunity.chain,
+            Opportunity.deadline,
+            Opportunity.updated_at,
+            Opportunity.created_at,
+        ).filter(
+            Opportunity.is_open == True,
+            or_(Opportunity.deadline == None, Opportunity.deadline >= datetime.now()),
+        ).all()
+        return cls(rows, version=version)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def key(self, idx: int, score: int) -> SortKey:
+        return -score, -self.recency[idx], str(self.ids[idx])
+
+    def _walk(self, keys: List[SortKey], order: List[int], after: Optional[SortKey], bonus: int, skip, expired):
+        """Lazily yield (key, idx, score) from a presorted list, starting after `after`."""
+        for pos in range(bisect_right(keys, after) if after else 0, len(order)):
+            idx = order[pos]
+            if not skip(idx) and not expired(idx):
+                yield keys[pos], idx, min(self.scores[idx] + bonus, MAX_SCORE)
+
+    def page(self, skills: frozenset, chains: frozenset, after: Optional[SortKey],
+             limit: int, now: float = None) -> Tuple[List[RankedItem], Optional[SortKey]]:
+        """Best `limit` items ranked after `after`, and the key to continue from (None on the last page)."""
+        now = time.time() if now is None else now
+
+        def expired(idx: int) -> bool:
+            deadline = self.deadlines[idx]
+            return deadline is not None and deadline < now
+
+        # Skill matches get a per-item bonus: ranked explicitly with a top-k heap
+        skill_bonus: Dict[int, int] = defaultdict(int)
+        for skill in skills:
+            for idx in self.by_term.get(skill, ()):
+                skill_bonus[idx] += SKILL_MATCH_BONUS
+        boosted = []
+        for idx, extra in skill_bonus.items():
+            if expired(idx):
+                continue
+            if self.chains[idx] in chains:
+                extra += CHAIN_MATCH_BONUS
+            score = min(self.scores[idx] + extra, MAX_SCORE)
+            key = self.key(idx, score)
+            if after is None or key > after:
+                boosted.append((key, idx, score))
+        streams = [heapq.nsmallest(limit + 1, boosted)]
+
+        # Everything else has a fixed bonus (chain match or none): walk presorted lists
+        for chain in chains:
+            if chain in self.by_chain:
+                keys, order = self.by_chain[chain]
+                streams.append(self._walk(keys, order, after, CHAIN_MATCH_BONUS, skill_bonus.__contains__, expired))
+        streams.append(self._walk(
+            self.keys, self.order, after, 0,
+            lambda idx: idx in skill_bonus or self.chains[idx] in chains, expired,
+        ))
+
+        ranked = list(islice(heapq.merge(*streams), limit + 1))
+        items = [RankedItem(self.ids[idx], score) for _, idx, score in ranked[:limit]]
+        next_key = ranked[limit - 1][0] if len(ranked) > limit else None
+        return items, next_key
+
+
+class RankingService:
+    _snapshot: Optional[FeatureSnapshot] = None
+    _results: "OrderedDict[tuple, Tuple[float, RankedPage]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def snapshot(cls, db: Session) -> FeatureSnapshot:
+        # Read before loading: a bump during the load leaves this snapshot already outdated
+        (version,) = ResponseCache.versions((VERSION_NAMESPACE,))
+        with cls._lock:
+            current = cls._snapshot
+            if (current is None or current.version != version
+                    or time.monotonic() - current.built_at > RANKING_SNAPSHOT_TTL):
+                current = cls._snapshot = FeatureSnapshot.load(db, version)
+                cls._results.clear()
+            return current
+
+    @classmethod
+    def invalidate(cls):
+        """Drop this process's snapshot and cached pages (tests; writers bump the response cache instead)."""
+        with cls._lock:
+            cls._snapshot = None
+            cls._results.clear()
+
+    @classmethod
+    def rank(cls, db: Session, skills: Optional[list] = None, chains: Optional[list] = None,
+             cursor: Optional[str] = None, limit: int = 50) -> RankedPage:
+        """One page of the priority stream for a user with these skills / preferred chains."""
+        after = _decode_key(cursor) if cursor else None
+        skills = frozenset(s.lower() for s in (skills or []) if isinstance(s, str))
+        chains = frozenset(c.lower() for c in (chains or []) if isinstance(c, str))
+        snapshot = cls.snapshot(db)
+
+        cache_key = (id(snapshot), skills, chains, cursor, limit)
+        now = time.monotonic()
+        with cls._lock:
+            hit = cls._results.get(cache_key)
+            if hit and hit[0] > now:
+                cls._results.move_to_end(cache_key)
+                return hit[1]
+
+        items, next_key = snapshot.page(skills, chains, after, limit)
+        page = RankedPage(items, encode_cursor(next_key) if next_key else None)
+        with cls._lock:
+            cls._results[cache_key] = (now + RANKING_RESULT_TTL, page)
+            while len(cls._results) > RANKING_RESULT_CACHE_SIZE:
+                cls._results.popitem(last=False)
+        return page
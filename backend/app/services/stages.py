@@ -0,0 +1,197 @@
+"""
+Minimal asyncio stage runner for the ingestion pipeline.
+
+Stages are chained by bounded queues, so a slow stage (LLM triage, embedding)
+applies backpressure upstream instead of letting items pile up in memory, and
+fast stages keep working while slow ones wait on the network. Each stage can
+run several workers and can take items one at a time or in batches.
+
+Every stage keeps a StageStats record (items in/out, errors, busy time) so the
+bottleneck of a run is visible in its summary.
+"""
+
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+_DONE = object()
+
+# Name of the stage whose handler is running (e.g. to attribute DB queries to it)
+current_stage: ContextVar[Optional[str]] = ContextVar("current_stage", default=None)
+
+
+def run_sync(coro):
+    """asyncio.run that also works when the caller is already inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+class StageStats:
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0  # summed across workers
+        self.latencies: List[float] = []  # seconds per handler call (per batch for batching stages)
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items handled per busy worker-second: the stage's capacity, not its arrival rate."""
+        return self.items_in / self.busy_seconds if self.busy_seconds else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of the handler latencies, in seconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, min(len(ordered), math.ceil(p / 100 * len(ordered))))
+        return ordered[rank - 1]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "in": self.items_in,
+            "out": self.items_out,
+            "errors": self.errors,
+            "busy_s": round(self.busy_seconds, 3),
+            "wall_s": round(self.wall_seconds, 3),
+            "items_per_s": round(self.throughput, 2),
+        }
+
+
+class Stage:
+    """
+    handler(item) -> iterable of outputs, or handler(list_of_items) when batch_size > 1.
+    Outputs are passed to the next stage; an empty result drops the item.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[Iterable[Any]]],
+        workers: int = 1,
+        batch_size: int = 1,
+        linger: float = 0.0,
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        # Seconds a worker waits for a partial batch to fill before handling it
+        self.linger = linger
+        self.stats = StageStats(name, self.workers)
+
+
+class StagedPipeline:
+    def __init__(self, stages: List[Stage], queue_size: int = 200):
+        self.stages = stages
+        self.queue_size = queue_size
+
+    @property
+    def stats(self) -> List[StageStats]:
+        return [stage.stats for stage in self.stages]
+
+    async def run(self, source: AsyncIterator[Any], source_stats: StageStats = None):
+        """Feed `source` through every stage; returns when the last stage has drained."""
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+
+        async def feed():
+            try:
+                async for item in source:
+                    if source_stats is not None:
+                        source_stats.items_out += 1
+                    await queues[0].put(item)
+            finally:
+                await queues[0].put(_DONE)
+
+        tasks = [asyncio.create_task(feed())]
+        for i, stage in enumerate(self.stages):
+            outbox = queues[i + 1] if i + 1 < len(queues) else None
+            tasks.append(asyncio.create_task(self._run_stage(stage, queues[i], outbox)))
+        await asyncio.gather(*tasks)
+
+    async def _run_stage(self, stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]):
+        stage.stats.started_at = time.monotonic()
+        await asyncio.gather(*(self._worker(stage, inbox, outbox) for _ in range(stage.workers)))
+        stage.stats.finished_at = time.monotonic()
+        if outbox is not None:
+            await outbox.put(_DONE)
+
+    async def _worker(self, stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]):
+        stats = stage.stats
+        current_stage.set(stage.name)
+        while True:
+            batch, finished = await self._take(stage, inbox)
+            if batch:
+                stats.items_in += len(batch)
+                started = time.monotonic()
+                try:
+                    outputs = await stage.handler(batch if stage.batch_size > 1 else batch[0])
+                    outputs = list(outputs or [])
+                except Exception as e:
+                    stats.errors += len(batch)
+                    outputs = []
+                    print(f"[Pipeline] Stage '{stage.name}' failed on {len(batch)} item(s): {e}")
+                elapsed = time.monotonic() - started
+                stats.busy_seconds += elapsed
+                stats.latencies.append(elapsed)
+                stats.items_out += len(outputs)
+                if outbox is not None:
+                    for output in outputs:
+                        await outbox.put(output)
+            if finished:
+                # Let the stage's other workers see the end of input too
+                await inbox.put(_DONE)
+                return
+
+    @staticmethod
+    async def _take(stage: Stage, inbox: asyncio.Queue):
+        """Up to stage.batch_size items; (items, end_of_input)."""
+        first = await inbox.get()
+        if first is _DONE:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + stage.linger
+        while len(batch) < stage.batch_size:
+            try:
+                item = inbox.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(inbox.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+
+def format_stats(stats: List[StageStats]) -> str:
+    lines = [f"{'stage':<10}{'wk':>4}{'in':>7}{'out':>7}{'err':>5}{'busy s':>9}{'items/s':>10}"]
+    for s in stats:
+        lines.append(
+            f"{s.name:<10}{s.workers:>4}{s.items_in:>7}{s.items_out:>7}{s.errors:>5}"
+            f"{s.busy_seconds:>9.2f}{s.throughput:>10.1f}"
+        )
+    return "\n".join(lines)
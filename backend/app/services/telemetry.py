@@ -0,0 +1,124 @@
+"""
+Per-run ingestion telemetry, persisted as IngestionRun + IngestionSourceStats.
+
+The pipeline reports item outcomes through RunTelemetry.count(); stage timings
+come from the StageStats of the staged pipeline and fetch/parse timings from
+each scraper's run(). Telemetry writes never fail a run.
+"""
+
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..models.ingestion_run import IngestionRun, IngestionSourceStats
+
+# Outcomes tracked per run and per source (columns on both tables)
+EVENTS = ("found", "duplicate", "near_duplicate", "stale", "noise", "saved", "errors")
+
+
+class RunTelemetry:
+    def __init__(self, db: Session, trigger: str = None):
+        self.db = db
+        self.trigger = trigger
+        self.run_id = None
+        self.by_source: Dict[str, Counter] = defaultdict(Counter)
+        self.timings: Dict[str, Dict] = {}
+        self.llm_calls = 0
+        self.triage_cache_hits = 0
+        self._started = time.monotonic()
+
+    def count(self, source: Optional[str], event: str, n: int = 1):
+        if n:
+            self.by_source[source or "unknown"][event] += n
+
+    def record_source(self, source: str, fetch_seconds: float = None, parse_seconds: float = None, timed_out: bool = False):
+        self.timings[source] = {"fetch_seconds": fetch_seconds, "parse_seconds": parse_seconds, "timed_out": timed_out}
+
+    def totals(self) -> Counter:
+        total = Counter()
+        for counts in self.by_source.values():
+            total.update(counts)
+        return total
+
+    def start(self):
+        """Insert the run as 'running' so in-flight runs show up on the admin dashboard."""
+        try:
+            run = IngestionRun(trigger=self.trigger, status="running")
+            self.db.add(run)
+            self.db.commit()
+            self.run_id = run.id
+        except Exception as e:
+            self.db.rollback()
+            print(f"[Telemetry] Could not record run start: {e}")
+
+    def finish(self, stages: List[dict], error: str = None, failed_items: int = 0) -> Optional[IngestionRun]:
+        totals = self.totals()
+        # failed_items covers every item lost to an error, attributed to a source or not
+        errors = max(totals["errors"], failed_items)
+        if error:
+            status = "failed"
+        elif errors or any(t["timed_out"] for t in self.timings.values()):
+            status = "partial"
+        else:
+            status = "success"
+        try:
+            run = self.db.get(IngestionRun, self.run_id) if self.run_id else None
+            if run is None:
+                run = IngestionRun(trigger=self.trigger)
+                self.db.add(run)
+            run.status = status
+            for event in EVENTS:
+                setattr(run, event, totals[event])
+            run.errors = errors
+            run.llm_calls = self.llm_calls
+            run.triage_cache_hits = self.triage_cache_hits
+            run.stages = stages
+            run.error = error
+            run.finished_at = datetime.utcnow()
+            run.duration_seconds = round(time.monotonic() - self._started, 3)
+
+            for source in sorted(set(self.by_source) | set(self.timings)):
+                counts = self.by_source.get(source, Counter())
+                timing = self.timings.get(source, {})
+                run.sources.append(IngestionSourceStats(
+                    source=source,
+                    fetch_seconds=timing.get("fetch_seconds"),
+                    parse_seconds=timing.get("parse_seconds"),
+                    timed_out=timing.get("timed_out", False),
+                    **{event: counts[event] for event in EVENTS},
+                ))
+            self.db.commit()
+            return run
+        except Exception as e:
+            self.db.rollback()
+            print(f"[Telemetry] Could not record run: {e}")
+            return None
+
+
+def serialize_run(run: IngestionRun) -> dict:
+    return {
+        "id": str(run.id),
+        "trigger": run.trigger,
+        "status": run.status,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+        "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+        "duration_seconds": run.duration_seconds,
+        "counts": {event: getattr(run, event) or 0 for event in EVENTS},
+        "llm_calls": run.llm_calls or 0,
+        "triage_cache_hits": run.triage_cache_hits or 0,
+        "stages": run.stages or [],
+        "error": run.error,
+        "sources": [
+            {
+                "source": s.source,
+                "fetch_seconds": s.fetch_seconds,
+                "parse_seconds": s.parse_seconds,
+                "timed_out": s.timed_out,
+                **{event: getattr(s, event) or 0 for event in EVENTS},
+            }
+            for s in run.sources
+        ],
+    }
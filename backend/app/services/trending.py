@@ -0,0 +1,124 @@
+"""
+Trending score for /opportunities/trending.
+
+Opportunity.trending_score is a running, time-decayed sum of engagement:
+
+    track   someone adds it to their tracker       +5
+    chat    a chat message about it (user side)    +3
+    view    a detail page view                     +1
+    new     every opportunity starts at            +10  (recency)
+
+Events add their weight in place (record(), same transaction as the event),
+and a Celery job (tasks/trending_tasks.py) multiplies every non-zero score by
+0.5 ** (elapsed / TRENDING_HALF_LIFE_HOURS), so a signal counts half as much
+after one half-life. Scores that fall under TRENDING_FLOOR drop to 0, which
+keeps the decay job's working set to recently active rows. Reading trending
+is a range scan of the partial (trending_score, id) index on open rows.
+
+rebuild() recomputes every score from the stored history (tracker entries,
+chat messages, views, created_at); run it after adding the column
+(app/scripts/add_trending_score.py) or to repair drift.
+
+The score updates never touch updated_at: it drives the recency ordering of
+the feed, and engagement is not an edit.
+"""
+
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import bindparam, case, or_, update
+from sqlalchemy.orm import Session
+
+from ..models.chat import ChatMessage
+from ..models.opportunity import Opportunity
+from ..models.tracking import TrackedApplication
+
+logger = logging.getLogger(__name__)
+
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "24"))
+TRENDING_FLOOR = 0.01
+
+EVENT_WEIGHTS = {"view": 1.0, "chat": 3.0, "track": 5.0}
+NEW_OPPORTUNITY_BOOST = 10.0  # also the column default on Opportunity.trending_score
+
+# rebuild(): history older than this contributes under 0.1% and is skipped
+_HISTORY_HALF_LIVES = 10
+
+_table = Opportunity.__table__
+
+
+def decay_factor(hours: float) -> float:
+    return 0.5 ** (hours / TRENDING_HALF_LIFE_HOURS)
+
+
+def _age_hours(ts: Optional[datetime], now: datetime) -> float:
+    if ts is None:
+        return float("inf")
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)  # SQLite stores UTC without an offset
+    return max(0.0, (now - ts).total_seconds() / 3600)
+
+
+def record(db: Session, opportunity_id, event: str, count: int = 1):
+    """Add an engagement event to an opportunity's score. Runs in the caller's transaction."""
+    weight = EVENT_WEIGHTS[event] * count
+    db.execute(
+        update(_table)
+        .where(_table.c.id == opportunity_id)
+        .values(trending_score=_table.c.trending_score + weight, updated_at=_table.c.updated_at)
+    )
+
+
+def decay(db: Session, hours: float) -> int:
+    """Decay every score by `hours` worth of half-life. Returns the number of rows touched."""
+    factor = decay_factor(hours)
+    decayed = _table.c.trending_score * factor
+    result = db.execute(
+        update(_table)
+        .where(_table.c.trending_score > 0)
+        .values(trending_score=case((decayed < TRENDING_FLOOR, 0.0), else_=decayed),
+                updated_at=_table.c.updated_at)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def rebuild(db: Session, now: Optional[datetime] = None) -> int:
+    """Recompute every score from stored history. Returns the number of opportunities scored."""
+    now = now or datetime.now(timezone.utc)
+    since = (now - timedelta(hours=TRENDING_HALF_LIFE_HOURS * _HISTORY_HALF_LIVES)).replace(tzinfo=None)
+    scores = defaultdict(float)
+
+    def add(opportunity_id, weight: float, ts: Optional[datetime]):
+        scores[opportunity_id] += weight * decay_factor(_age_hours(ts, now))
+
+    for opp_id, created_at, updated_at, views in db.query(
+            Opportunity.id, Opportunity.created_at, Opportunity.updated_at, Opportunity.views_count).filter(
+            or_(Opportunity.created_at >= since, Opportunity.updated_at >= since)):
+        add(opp_id, NEW_OPPORTUNITY_BOOST, created_at)
+        # Views are not timestamped: date them at the last activity
+        add(opp_id, EVENT_WEIGHTS["view"] * (views or 0), updated_at or created_at)
+    for opp_id, created_at in db.query(TrackedApplication.opportunity_id, TrackedApplication.created_at).filter(
+            TrackedApplication.created_at >= since):
+        add(opp_id, EVENT_WEIGHTS["track"], created_at)
+    for opp_id, ts in db.query(ChatMessage.related_opportunity_id, ChatMessage.timestamp).filter(
+            ChatMessage.related_opportunity_id != None, ChatMessage.sender == "user",
+            ChatMessage.timestamp >= since):
+        add(opp_id, EVENT_WEIGHTS["chat"], ts)
+
+    db.execute(update(_table).values(trending_score=0.0, updated_at=_table.c.updated_at))
+    rows = [{"_id": opp_id, "_score": round(score, 4)} for opp_id, score in scores.items()
+            if opp_id is not None and score >= TRENDING_FLOOR]
+    if rows:
+        db.execute(
+            update(_table)
+            .where(_table.c.id == bindparam("_id"))
+            .values(trending_score=bindparam("_score"), updated_at=_table.c.updated_at),
+            rows,
+        )
+    db.commit()
+    logger.info(f"[Trending] Rebuilt scores for {len(rows)} opportunities")
+    return len(rows)
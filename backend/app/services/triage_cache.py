@@ -0,0 +1,103 @@
+"""
+Persistent cache of AI triage verdicts.
+
+Trusted feeds (curated lists, the Superteam fallback, ...) return the same items
+every run. Items that were judged noise, or refined and then dropped downstream,
+never reach the opportunities table, so the dedup index cannot stop them from
+going back to the classifier and risk agent. Verdicts are stored by content hash
+and reused until they expire or the classifier model/prompt version changes.
+"""
+
+import os
+from datetime import datetime, timedelta, date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.triage_cache import TriageCacheEntry
+from .curator import CLASSIFY_MODEL
+
+TRIAGE_PROMPT_VERSION = os.getenv("TRIAGE_PROMPT_VERSION", "1")
+TRIAGE_CACHE_TTL_DAYS = int(os.getenv("TRIAGE_CACHE_TTL_DAYS", "14"))
+
+# Only definitive answers are cached; "error" and "bypass" are retried next run
+CACHEABLE_VERDICTS = {"refined", "noise"}
+
+
+def cache_version() -> str:
+    return f"{CLASSIFY_MODEL}:{TRIAGE_PROMPT_VERSION}"
+
+
+def _jsonable(fields: Optional[Dict]) -> Optional[Dict]:
+    if not fields:
+        return fields
+    return {k: v.isoformat() if isinstance(v, (datetime, date)) else v for k, v in fields.items()}
+
+
+class TriageCache:
+
+    @staticmethod
+    def lookup(db: Session, hashes: Iterable[str]) -> Dict[str, Tuple[str, Optional[Dict]]]:
+        """Fresh, current-version verdicts for the given hashes: {hash: (verdict, fields)}."""
+        hashes = [h for h in set(hashes) if h]
+        if not hashes:
+            return {}
+        cutoff = datetime.utcnow() - timedelta(days=TRIAGE_CACHE_TTL_DAYS)
+        rows = db.query(TriageCacheEntry).filter(
+            TriageCacheEntry.content_hash.in_(hashes),
+            TriageCacheEntry.version == cache_version(),
+            TriageCacheEntry.created_at >= cutoff,
+        ).all()
+        return {row.content_hash: (row.verdict, row.fields) for row in rows}
+
+    @staticmethod
+    def store(db: Session, verdicts: List[Tuple[str, str, Optional[Dict]]]):
+        """Upsert (hash, verdict, fields) triples; non-cacheable verdicts are ignored."""
+        rows = {
+            content_hash: {
+                "content_hash": content_hash,
+                "version": cache_version(),
+                "verdict": verdict,
+                "fields": _jsonable(fields),
+            }
+            for content_hash, verdict, fields in verdicts
+            if content_hash and verdict in CACHEABLE_VERDICTS
+        }
+        if not rows:
+            return
+        try:
+            dialect = db.get_bind().dialect.name
+            if dialect in ("postgresql", "sqlite"):
+                if dialect == "postgresql":
+                    from sqlalchemy.dialects.postgresql import insert
+                else:
+                    from sqlalchemy.dialects.sqlite import insert
+                stmt = insert(TriageCacheEntry)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[TriageCacheEntry.content_hash],
+                    set_={
+                        "version": stmt.excluded.version,
+                        "verdict": stmt.excluded.verdict,
+                        "fields": stmt.excluded.fields,
+                        "created_at": func.now(),
+                    },
+                )
+                db.execute(stmt, list(rows.values()))
+            else:
+                for row in rows.values():
+                    db.merge(TriageCacheEntry(**row, created_at=datetime.utcnow()))
+            db.commit()
+        except Exception as e:
+            # The cache is an optimisation; never fail ingestion over it
+            db.rollback()
+            print(f"[TriageCache] Store failed: {e}")
+
+    @staticmethod
+    def purge_expired(db: Session) -> int:
+        cutoff = datetime.utcnow() - timedelta(days=TRIAGE_CACHE_TTL_DAYS)
+        deleted = db.query(TriageCacheEntry).filter(
+            (TriageCacheEntry.created_at < cutoff) | (TriageCacheEntry.version != cache_version())
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
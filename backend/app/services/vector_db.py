@@ -72,53 +72,70 @@ class VectorDBService:
             return model.encode(text).tolist()
         return [0.0] * 384 # Mock embedding
 
+    @staticmethod
+    def _document(opportunity: Dict[str, Any]):
+        """Search text and filter metadata for one opportunity."""
+        # Combine fields specifically for search relevance
+        title = opportunity.get('title', '')
+        desc = opportunity.get('description', '')
+        tags = opportunity.get('tags', []) or []
+        cat = opportunity.get('category', '')
+        chain = opportunity.get('chain', '')
+        
+        text_content = f"{title}. {desc} {cat} {chain} {' '.join(tags)}"
+        
+        # Metadata for filtering (Chroma only supports str, int, float, bool)
+        metadata = {
+            "category": str(cat),
+            "chain": str(chain),
+            "source": str(opportunity.get("source", "Unknown")),
+            "reward_pool": str(opportunity.get("reward_pool", "")),
+            "deadline": str(opportunity.get("deadline", ""))
+        }
+        return text_content, metadata
+
     @classmethod
     def add_opportunity(cls, opportunity: Dict[str, Any]):
         """
         Add a single opportunity to vector DB.
         opportunity dict must have: id, title, description. Optional: category, tags, chain.
         """
+        return cls.add_opportunities([opportunity])
+
+    @classmethod
+    def add_opportunities(cls, opportunities: List[Dict[str, Any]]):
+        """
+        Add a batch of opportunities: one encode call and one upsert for the whole chunk.
+        """
         try:
             # Fallback for mock data
-            cls._mock_data.append(opportunity)
+            cls._mock_data.extend(opportunities)
             
             if not CHROMA_AVAILABLE or not TRANSFORMERS_AVAILABLE:
-                print(f"[VectorDB] Mock added: {opportunity.get('title')[:30]}")
+                print(f"[VectorDB] Mock added {len(opportunities)} opportunities")
                 return True
 
             collection = cls.get_collection()
             if not collection: return False
-            
-            # Combine fields specifically for search relevance
-            title = opportunity.get('title', '')
-            desc = opportunity.get('description', '')
-            tags = opportunity.get('tags', []) or []
-            cat = opportunity.get('category', '')
-            chain = opportunity.get('chain', '')
-            
-            text_content = f"{title}. {desc} {cat} {chain} {' '.join(tags)}"
-            
-            embedding = cls.generate_embedding(text_content)
-            
-            # Metadata for filtering (Chroma only supports str, int, float, bool)
-            metadata = {
-                "category": str(cat),
-                "chain": str(chain),
-                "source": str(opportunity.get("source", "Unknown")),
-                "reward_pool": str(opportunity.get("reward_pool", "")),
-                "deadline": str(opportunity.get("deadline", ""))
-            }
-
-            print(f"[VectorDB] Upserting: {title[:30]}...")
+            if not opportunities: return True
+
+            documents, metadatas = zip(*(cls._document(o) for o in opportunities))
+            model = cls.get_model()
+            if model:
+                embeddings = model.encode(list(documents)).tolist()
+            else:
+                embeddings = [cls.generate_embedding(d) for d in documents]
+
+            print(f"[VectorDB] Upserting {len(opportunities)} opportunities...")
             collection.upsert(
-                documents=[text_content],
-                embeddings=[embedding],
-                metadatas=[metadata],
-                ids=[str(opportunity.get("id"))] # Use DB ID as vector ID
+                documents=list(documents),
+                embeddings=embeddings,
+                metadatas=list(metadatas),
+                ids=[str(o.get("id")) for o in opportunities] # Use DB ID as vector ID
             )
             return True
         except Exception as e:
-            print(f"[VectorDB] Error adding opportunity: {e}")
+            print(f"[VectorDB] Error adding opportunities: {e}")
             return False
 
     @classmethod
@@ -0,0 +1,56 @@
+"""
+Persisted per-source scraping watermarks.
+
+load() hands each scraper the watermark of its last successful ingest before it
+runs; save() stores the watermarks the scrapers computed, and is only called
+once their items have been ingested without errors, so a failed run is simply
+re-fetched in full next time.
+"""
+
+from typing import Iterable
+
+from sqlalchemy.orm import Session
+
+from ..models.scraper_watermark import ScraperWatermark
+from ..scrapers.base import BaseScraper, as_utc
+
+
+def load_watermarks(db: Session, scrapers: Iterable[BaseScraper]):
+    scrapers = list(scrapers)
+    names = [scraper.source_name for scraper in scrapers]
+    if not names:
+        return
+    stored = {
+        row.source: row
+        for row in db.query(ScraperWatermark).filter(ScraperWatermark.source.in_(names)).all()
+    }
+    for scraper in scrapers:
+        row = stored.get(scraper.source_name)
+        scraper.watermark = {
+            "source_id": row.last_source_id,
+            "posted_at": as_utc(row.last_posted_at),
+            "cursor": row.cursor,
+        } if row else None
+
+
+def save_watermarks(db: Session, scrapers: Iterable[BaseScraper]) -> int:
+    saved = 0
+    for scraper in scrapers:
+        mark = scraper.next_watermark
+        if not mark:
+            continue
+        db.merge(ScraperWatermark(
+            source=scraper.source_name,
+            last_source_id=mark.get("source_id"),
+            last_posted_at=as_utc(mark.get("posted_at")),
+            cursor=mark.get("cursor"),
+        ))
+        saved += 1
+    db.commit()
+    return saved
+
+
+def reset_watermark(db: Session, source: str):
+    """Force the next run of `source` to fetch everything again."""
+    db.query(ScraperWatermark).filter(ScraperWatermark.source == source).delete()
+    db.commit()
@@ -12,7 +12,7 @@ from app.database import SessionLocal
 from app.models.ecosystem import Ecosystem
 from app.models.opportunity import Opportunity
 from app.scrapers import gitcoin, twitter, reddit
-from app.services.ingestion import ingest_opportunity
+from app.services.ingestion import IngestionPipeline, ingest_opportunities
 
 logger = logging.getLogger(__name__)
 
@@ -148,12 +148,10 @@ def scrape_twitter():
         
         db = SessionLocal()
         count = 0
-        for opp_data in results:
-            try:
-                ingest_opportunity(db, opp_data)
-                count += 1
-            except Exception as e:
-                logger.error(f"Error ingesting Twitter opportunity: {e}")
+        try:
+            count = len(ingest_opportunities(db, results, trigger="scrape_twitter"))
+        except Exception as e:
+            logger.error(f"Error ingesting Twitter opportunities: {e}")
         
         db.close()
         logger.info(f"✅ Twitter scrape complete: {count} opportunities")
@@ -164,6 +162,26 @@ def scrape_twitter():
         return {"source": "twitter", "error": str(e)}
 
 
+@shared_task
+def scrape_reddit():
+    """
+    Scrape Reddit for Web3 opportunities.
+    Runs every 3 hours. Goes through the staged pipeline so each subreddit's
+    watermark (newest post seen) is loaded before and saved after the run.
+    """
+    try:
+        logger.info("👽 Scraping Reddit...")
+        db = SessionLocal()
+        # run() closes the session
+        summary = IngestionPipeline(db=db, scrapers=[reddit.RedditScraper()], trigger="scrape_reddit").run(notify=False)
+        logger.info(f"✅ Reddit scrape complete: {summary['new']} opportunities")
+        return {"source": "reddit", "count": summary["new"]}
+
+    except Exception as e:
+        logger.error(f"Reddit scrape failed: {e}")
+        return {"source": "reddit", "error": str(e)}
+
+
 @shared_task
 def scrape_grant_platforms():
     """
@@ -175,7 +193,6 @@ def scrape_grant_platforms():
         logger.info("Scraping grant platforms...")
 
         db = SessionLocal()
-        ingested_ids = []
 
         from app.scrapers.ethglobal import ETHGlobalScraper
         from app.scrapers.dorahacks import DoraHacksScraper
@@ -195,30 +212,16 @@ def scrape_grant_platforms():
             GitcoinScraper(),
         ]
 
-        for scraper in scrapers:
-            try:
-                logger.info(f"Running {scraper.source_name}...")
-                results = scraper.run()
-                new_for_source = 0
-                for opp_data in results:
-                    try:
-                        saved = ingest_opportunity(db, opp_data)
-                        if saved:
-                            for opp in saved:
-                                ingested_ids.append(str(opp.id))
-                            new_for_source += len(saved)
-                    except Exception as e:
-                        logger.error(f"Ingest error from {scraper.source_name}: {e}")
-                logger.info(f"{scraper.source_name}: {len(results)} scraped, {new_for_source} new")
-            except Exception as e:
-                logger.error(f"{scraper.source_name} failed: {e}")
-                continue
-
-        db.close()
+        # Sources are fetched concurrently and streamed through the staged pipeline
+        # (one dedup index for the whole run); run() closes the session
+        summary = IngestionPipeline(db=db, scrapers=scrapers, trigger="scrape_grant_platforms").run(notify=False)
+        new_count = summary["new"]
+        for stage in summary["stages"]:
+            logger.info(f"  stage {stage['stage']}: {stage}")
 
         # Trigger AI analysis for newly ingested opportunities
-        if ingested_ids:
-            logger.info(f"Triggering AI analysis for {len(ingested_ids)} new opportunities")
+        if new_count:
+            logger.info(f"Triggering AI analysis for {new_count} new opportunities")
             try:
                 from app.tasks.ai_tasks import batch_score_opportunities, batch_risk_assessment
                 batch_score_opportunities.delay()
@@ -226,11 +229,12 @@ def scrape_grant_platforms():
             except Exception as ai_err:
                 logger.warning(f"AI trigger failed (non-critical): {ai_err}")
 
-        logger.info(f"Platform scrape complete: {len(ingested_ids)} new opportunities")
+        logger.info(f"Platform scrape complete: {new_count} new opportunities")
         return {
             "source": "platforms",
-            "new_count": len(ingested_ids),
+            "new_count": new_count,
             "scrapers": len(scrapers),
+            "stages": summary["stages"],
         }
 
     except Exception as e:
@@ -347,9 +351,23 @@ def cleanup_old_opportunities():
         db.commit()
 
         logger.info(f"🗑️ Purged {purged_count} stale opportunities (90+ days old, no trackers)")
+
+        if archived_count or purged_count:
+            from app.core.cache import ResponseCache
+            from app.services import dashboard_stats
+            dashboard_stats.refresh(db, now)
+            ResponseCache.bump("opportunities")
+
+        # ── Phase 3: Drop expired / outdated AI triage verdicts ──────────────
+        from app.services.triage_cache import TriageCache
+        triage_purged = TriageCache.purge_expired(db)
+        if triage_purged:
+            logger.info(f"🧹 Dropped {triage_purged} expired triage cache entries")
+
         return {
             "archived": archived_count,
             "purged": purged_count,
+            "triage_cache_purged": triage_purged,
             "timestamp": now.isoformat()
         }
 
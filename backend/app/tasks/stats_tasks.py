@@ -0,0 +1,28 @@
+"""Dashboard Statistics Snapshot"""
+
+from celery import shared_task
+from app.database import SessionLocal
+from app.services import dashboard_stats
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_dashboard_stats():
+    """
+    Every 5 minutes: recompute the catalog-wide /stats/dashboard figures
+    (active, closing soon, total pool) into the stats snapshot row.
+    """
+    db = SessionLocal()
+    try:
+        snapshot = dashboard_stats.refresh(db)
+        logger.info(f"📊 Dashboard stats refreshed: {snapshot.active_count} active, "
+                    f"{snapshot.closing_soon} closing soon")
+        return {
+            "active_count": snapshot.active_count,
+            "closing_soon": snapshot.closing_soon,
+            "total_pool_usd": snapshot.total_pool_usd,
+        }
+    finally:
+        db.close()
@@ -0,0 +1,36 @@
+"""Trending Score Maintenance"""
+
+from celery import shared_task
+from app.database import SessionLocal
+from app.services import trending
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Matches the "decay-trending-scores" beat schedule in celery_config.py
+DECAY_INTERVAL_HOURS = 1
+
+
+@shared_task
+def decay_trending_scores():
+    """
+    Hourly: decay every trending score by an hour's worth of half-life
+    (TRENDING_HALF_LIFE_HOURS). Scores that reach ~0 drop out of the update.
+    """
+    db = SessionLocal()
+    try:
+        count = trending.decay(db, DECAY_INTERVAL_HOURS)
+        logger.info(f"📉 Decayed {count} trending scores")
+        return {"decayed": count}
+    finally:
+        db.close()
+
+
+@shared_task
+def rebuild_trending_scores():
+    """Recompute every trending score from stored engagement history (manual / repair)."""
+    db = SessionLocal()
+    try:
+        return {"scored": trending.rebuild(db)}
+    finally:
+        db.close()
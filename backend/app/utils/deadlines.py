@@ -0,0 +1,188 @@
+"""
+Deadline / start-date extraction from free text.
+
+All phrases are found in one pass of a single precompiled pattern. Date
+strings are normalized (case, spacing, commas) and parsed through an LRU
+cache: listings repeat the same few dates, so a backfill over historical
+descriptions parses each distinct string once.
+Common shapes (ISO, "March 15, 2026", "03/15/2026") are parsed directly;
+anything else falls back to dateutil.
+
+Relative phrases ("ends in 3 days", "closes tomorrow") resolve against `now`
+and are never cached.
+
+    extract_deadline("Deadline: March 15, 2026")          -> "2026-03-15"
+    extract_dates(["Starts May 1, 2026. Ends in 3 days"]) -> [DateInfo(deadline=..., start_date="2026-05-01")]
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional
+
+from dateutil import parser as date_parser
+
+# Dates the patterns below capture
+_MONTH_DAY_YEAR = r"[a-zA-Z]{3,9}\.?\s\d{1,2}(?:st|nd|rd|th)?,?\s?\d{4}"   # March 15, 2026
+_NUMERIC = r"\d{1,2}/\d{1,2}/\d{4}"                                     # 03/15/2026
+_ISO = r"\d{4}-\d{2}-\d{2}"                                               # 2026-03-15
+_MONTH_DAY = r"[a-zA-Z]{3,9}\s\d{1,2}"                                    # March 15 (year implied)
+
+_DEADLINE_WORDS = ("deadline", "closing", "closes", "apply by", "ends", "ending", "until", "due", "expires")
+_START_WORDS = ("starts", "start date", "opens", "kicks off", "begins", "launches")
+
+# One pass over the text: a keyword, then an absolute date or a relative phrase
+DATE_PHRASE = re.compile(
+    r"\b(?P<keyword>" + "|".join(sorted(_DEADLINE_WORDS + _START_WORDS, key=len, reverse=True)) + r")"
+    r":?\s*(?:on\s)?"
+    r"(?:(?P<month_day_year>" + _MONTH_DAY_YEAR + r")"
+    r"|(?P<numeric>" + _NUMERIC + r")"
+    r"|(?P<iso>" + _ISO + r")"
+    r"|(?P<month_day>" + _MONTH_DAY + r")"
+    r"|in\s+(?P<count>\d{1,3}|an?|one|two|three|four|five|six|seven)\s+(?P<unit>hour|day|week|month)s?\b"
+    r"|(?P<word>today|tonight|tomorrow)\b)",
+    re.IGNORECASE,
+)
+# Absolute date shapes, most specific first (a full date beats a bare "March 15")
+_SHAPES = ("month_day_year", "numeric", "iso", "month_day")
+
+_MONTHS = {
+    name: i for i, names in enumerate(
+        [("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"), ("may",),
+         ("jun", "june"), ("jul", "july"), ("aug", "august"), ("sep", "sept", "september"),
+         ("oct", "october"), ("nov", "november"), ("dec", "december")], start=1)
+    for name in names
+}
+_WORD_NUMBERS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7}
+_UNIT_DAYS = {"hour": 1 / 24, "day": 1, "week": 7, "month": 30}
+_FAST_MONTH_DAY_YEAR = re.compile(r"([a-z]+)\.? (\d{1,2})(?:st|nd|rd|th)? ?(\d{4})")
+_FAST_NUMERIC = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_FAST_MONTH_DAY = re.compile(r"([a-z]+) (\d{1,2})")
+
+
+class DateInfo(NamedTuple):
+    deadline: Optional[str]     # ISO date (YYYY-MM-DD)
+    start_date: Optional[str]   # ISO date
+
+
+def _normalize(date_str: str) -> str:
+    return " ".join(date_str.lower().replace(",", " ").split())
+
+
+@lru_cache(maxsize=4096)
+def parse_date(normalized: str) -> Optional[date]:
+    """
+    Parse a normalized date string (see _normalize). A string without a year
+    comes back with year 1 so the caller can place it relative to today.
+    """
+    if len(normalized) == 10 and normalized[4] == "-":
+        try:
+            return date.fromisoformat(normalized)
+        except ValueError:
+            return None
+    match = _FAST_MONTH_DAY_YEAR.fullmatch(normalized)
+    if match and match.group(1) in _MONTHS:
+        try:
+            return date(int(match.group(3)), _MONTHS[match.group(1)], int(match.group(2)))
+        except ValueError:
+            return None
+    match = _FAST_NUMERIC.fullmatch(normalized)
+    if match:
+        # Month first, like dateutil's default
+        try:
+            return date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+        except ValueError:
+            return None
+    match = _FAST_MONTH_DAY.fullmatch(normalized)
+    if match and match.group(1) in _MONTHS:
+        try:
+            return date(1, _MONTHS[match.group(1)], int(match.group(2)))
+        except ValueError:
+            return None
+    try:
+        return date_parser.parse(normalized).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+def _resolve(date_str: str, today: date) -> Optional[str]:
+    parsed = parse_date(_normalize(date_str))
+    if parsed is None:
+        return None
+    if parsed.year == 1:
+        # No year given: the next occurrence of that day
+        parsed = parsed.replace(year=today.year)
+        if parsed < today:
+            parsed = parsed.replace(year=today.year + 1)
+    return parsed.isoformat()
+
+
+def _relative(match, now: datetime) -> str:
+    word = (match.group("word") or "").lower()
+    if word:
+        days = 1 if word == "tomorrow" else 0
+    else:
+        count = match.group("count").lower()
+        days = (int(count) if count.isdigit() else _WORD_NUMBERS[count]) * _UNIT_DAYS[match.group("unit").lower()]
+    return (now + timedelta(days=days)).date().isoformat()
+
+
+def _scan(text: str, now: datetime):
+    """(explicit deadline, relative deadline, start date) from a single regex pass."""
+    today = now.date()
+    deadlines = {}   # shape -> first parsable date of that shape
+    starts = {}
+    relative = None
+    for match in DATE_PHRASE.finditer(text):
+        is_start = match.group("keyword").lower() in _START_WORDS
+        shape = next((name for name in _SHAPES if match.group(name)), None)
+        if shape is None:
+            if not is_start and relative is None:
+                relative = _relative(match, now)
+            continue
+        found = starts if is_start else deadlines
+        if shape not in found:
+            resolved = _resolve(match.group(shape), today)
+            if resolved:
+                found[shape] = resolved
+    deadline = next((deadlines[shape] for shape in _SHAPES if shape in deadlines), None)
+    start = next((starts[shape] for shape in _SHAPES if shape in starts), None)
+    return deadline, relative, start
+
+
+def extract_deadline(text: str, now: datetime = None) -> Optional[str]:
+    """Explicit deadline date in the text, as an ISO date string, or None."""
+    if not text:
+        return None
+    return _scan(text, now or datetime.utcnow())[0]
+
+
+def relative_deadline(text: str, now: datetime = None) -> Optional[str]:
+    """Deadline from phrases like "ends in 3 days" / "closes tomorrow", as an ISO date."""
+    if not text:
+        return None
+    return _scan(text, now or datetime.utcnow())[1]
+
+
+def extract_start_date(text: str, now: datetime = None) -> Optional[str]:
+    """Start date ("Starts May 1, 2026", "Opens 2026-05-01"), as an ISO date string."""
+    if not text:
+        return None
+    return _scan(text, now or datetime.utcnow())[2]
+
+
+def extract_dates(texts: Iterable[str], now: datetime = None) -> List[DateInfo]:
+    """
+    Deadline and start date for each text, one scan per text. An explicit
+    deadline wins over a relative phrase; all relative phrases resolve against
+    the same `now`.
+    """
+    now = now or datetime.utcnow()
+    results = []
+    for text in texts:
+        if not text:
+            results.append(DateInfo(None, None))
+            continue
+        deadline, relative, start = _scan(text, now)
+        results.append(DateInfo(deadline or relative, start))
+    return results
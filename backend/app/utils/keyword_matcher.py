@@ -0,0 +1,99 @@
+"""
+Multi-keyword matching in one pass over the text.
+
+A vocabulary of terms (each mapped to a label, e.g. "zero-knowledge" -> "ZK")
+is compiled once into a single regex whose alternation is factored as a trie,
+so the regex engine follows at most one branch per character instead of trying
+every term at every position. Matching cost grows with the length of the text,
+not with the size of the vocabulary.
+
+Every occurrence is reported, including terms that overlap or that are a
+prefix of a longer term ("smart contract" inside "smart contract audit"), so
+the result equals testing each term on its own.
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping, Set, Union
+
+_END = ""  # trie key marking the end of a term
+
+
+def _trie_pattern(node: dict) -> str:
+    """Regex for a trie; longer continuations are tried first (greedy)."""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char != _END]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if _END in node:
+        # The term may stop here, but prefer the longest continuation
+        return "(?:" + body + ")?" if len(branches) == 1 else body + "?"
+    return body
+
+
+class KeywordMatcher:
+    """
+    terms: iterable of terms, or mapping of term -> label. Matching is
+    case-insensitive. With word_boundaries a term only matches as a whole word
+    (no letter, digit or underscore directly before or after it); without,
+    any substring occurrence counts.
+    """
+
+    def __init__(self, terms: Union[Mapping[str, str], Iterable[str]], word_boundaries: bool = True):
+        if not isinstance(terms, Mapping):
+            terms = {term: term for term in terms}
+        self.labels: Dict[str, str] = {}
+        for term, label in terms.items():
+            term = " ".join(term.lower().split())
+            if term:
+                self.labels.setdefault(term, label)
+        self.word_boundaries = word_boundaries
+
+        trie: dict = {}
+        for term in self.labels:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[_END] = True
+
+        # Shorter terms that are a prefix of a longer one: the regex reports the
+        # longest term at a position, these are added back from it.
+        self._prefixes: Dict[str, List[str]] = {
+            term: [term[:i] for i in range(1, len(term)) if term[:i] in self.labels and self._ends_word(term, i)]
+            for term in self.labels
+        }
+
+        core = _trie_pattern(trie) if self.labels else "(?!)"
+        if word_boundaries:
+            core = r"(?<!\w)" + "(" + core + r")(?!\w)"
+        else:
+            core = "(" + core + ")"
+        # Zero-width lookahead so matches may start inside an earlier match
+        self.pattern = re.compile("(?=" + core + ")")
+
+    def _ends_word(self, term: str, i: int) -> bool:
+        """Can a match of term[:i] end at i inside `term` under the boundary rule?"""
+        if not self.word_boundaries:
+            return True
+        return not (term[i].isalnum() or term[i] == "_")
+
+    def terms_in(self, text: str) -> List[str]:
+        """Distinct matched terms (lower-cased), in order of first occurrence."""
+        if not text:
+            return []
+        seen: Dict[str, None] = {}
+        for match in self.pattern.finditer(text.lower()):
+            term = match.group(1)
+            for prefix in self._prefixes[term]:
+                seen.setdefault(prefix)
+            seen.setdefault(term)
+        return list(seen)
+
+    def labels_in(self, text: str) -> List[str]:
+        """Distinct labels of the matched terms, in order of first occurrence."""
+        return list(dict.fromkeys(self.labels[term] for term in self.terms_in(text)))
+
+    def label_set(self, text: str) -> Set[str]:
+        return set(self.labels_in(text))
+
+    def __len__(self) -> int:
+        return len(self.labels)
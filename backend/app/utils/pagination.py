@@ -0,0 +1,103 @@
+"""
+Keyset (cursor) pagination.
+
+Lists are ordered by a (sort key, id) tuple, newest first. The cursor is an
+opaque token holding that tuple for the last row of a page; the next page is
+
+    WHERE (sort, id) < (:sort, :id) ORDER BY sort DESC, id DESC LIMIT :n
+
+which is an index range scan (see the (sort, id) indexes on the models)
+whatever the depth, and does not skip or repeat rows when new ones are
+inserted between requests. The id breaks ties between equal sort values.
+
+Endpoints return the token in the X-Next-Cursor header when more rows remain,
+and cap `limit` at MAX_PAGE_SIZE.
+Requests without a cursor still honour the old page / skip offsets.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Largest `limit` a keyset-paginated endpoint accepts (more rows: follow the cursor)
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class Page(NamedTuple):
+    items: list
+    next_cursor: Optional[str]
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "uuid" in value:
+            return uuid.UUID(value["uuid"])
+        raise ValueError(value)
+    return value
+
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Values of a cursor made by encode_cursor; InvalidCursor if it is malformed or not `size` long."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError(cursor)
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError, AttributeError):
+        raise InvalidCursor(cursor)
+
+
+class Keyset:
+    """
+    sort: column or expression to order by (descending); id_column: the
+    tie-breaker; value: reads the sort value back from a result row (defaults
+    to the attribute named like `sort`).
+    """
+
+    def __init__(self, sort, id_column, value: Callable[[Any], Any] = None):
+        self.sort = sort
+        self.id_column = id_column
+        self.value = value or (lambda row: getattr(row, sort.key))
+
+    def paginate(self, query: Query, limit: int, cursor: Optional[str] = None, offset: int = 0) -> Page:
+        """One page of `query`, after `cursor` or (without one) from `offset`."""
+        limit = max(1, limit)
+        if cursor:
+            sort_value, last_id = decode_cursor(cursor, 2)
+            query = query.filter(tuple_(self.sort, self.id_column) < tuple_(sort_value, last_id))
+        query = query.order_by(self.sort.desc(), self.id_column.desc())
+        if not cursor and offset:
+            query = query.offset(offset)
+        rows = query.limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor([self.value(last), getattr(last, self.id_column.key)])
+        return Page(rows, next_cursor)
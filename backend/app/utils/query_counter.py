@@ -0,0 +1,41 @@
+"""
+Counts SQL statements executed on an engine, by statement kind and by the
+ingestion stage that issued them (see stages.current_stage).
+
+    with QueryCounter(engine) as queries:
+        pipeline.run()
+    print(queries.total, queries.by_kind, queries.by_stage)
+"""
+
+import threading
+from collections import Counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..services.stages import current_stage
+
+
+class QueryCounter:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.by_kind = Counter()
+        self.by_stage = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_kind.values())
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        kind = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "?"
+        with self._lock:
+            self.by_kind[kind] += 1
+            self.by_stage[current_stage.get() or "-"] += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._count)
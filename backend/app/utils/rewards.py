@@ -0,0 +1,131 @@
+"""
+Reward normalization: one parser for every reward string in the system.
+
+normalize_reward("$1.5M")        -> RewardValue(usd=1500000.0, token=None)
+normalize_reward("10K USDC")     -> RewardValue(usd=10000.0, token="USDC")
+normalize_reward("25 ETH")       -> RewardValue(usd=87500.0, token="ETH")   (price table)
+normalize_reward("TBD")          -> RewardValue(usd=None, token=None)
+
+apply_reward() runs on every write of reward_pool (ingestion's _enrich, the
+manual and admin create / edit endpoints) and sets estimated_value_usd /
+reward_token, so readers sum or compare the numeric column instead of
+re-parsing strings. Token amounts are converted with the
+local price table in app/resources/token_prices.json (no network lookups).
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
+
+TOKEN_PRICES_PATH = os.getenv(
+    "TOKEN_PRICES_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "token_prices.json"),
+)
+
+# Rewards that are not an amount at all
+NON_MONETARY = re.compile(r"alpha|tbd|tba|varies|see details|token allocation|future|unknown", re.IGNORECASE)
+
+# An amount: optional currency sign, number (1,000.50 / 1000 / 1.5), optional
+# magnitude, optional unit word right after it
+AMOUNT = re.compile(
+    r"(?P<sign>[$€£])?\s*"
+    r"(?P<number>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)"
+    r"\s*(?P<magnitude>thousand|million|billion|k|m|b)?(?![a-z])"
+    r"\s*(?P<unit>[a-z]{2,6}\b)?",
+    re.IGNORECASE,
+)
+
+# Units that are countable but not money ("500 points")
+UNPRICED_UNITS = {"POINTS", "PTS", "XP", "NFT", "NFTS"}
+MAGNITUDES = {"k": 1e3, "thousand": 1e3, "m": 1e6, "million": 1e6, "b": 1e9, "billion": 1e9}
+# Currency signs, valued at par with USD (close enough for pool estimates)
+FIAT = {"$": 1.0, "€": 1.0, "£": 1.0}
+
+
+class RewardValue(NamedTuple):
+    usd: Optional[float]
+    token: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def token_prices() -> Dict[str, float]:
+    with open(TOKEN_PRICES_PATH, encoding="utf-8") as f:
+        return {symbol.upper(): float(price) for symbol, price in json.load(f)["usd"].items()}
+
+
+@lru_cache(maxsize=1)
+def _token_mention() -> re.Pattern:
+    """Any known token symbol as a whole word, for strings like '$5,000 paid in SOL'."""
+    symbols = sorted(token_prices(), key=len, reverse=True)
+    return re.compile(r"\b(" + "|".join(map(re.escape, symbols)) + r")\b", re.IGNORECASE)
+
+
+def normalize_reward(reward_pool, reward_token: Optional[str] = None) -> RewardValue:
+    """
+    USD value and token of a reward string. usd is None when the reward is not
+    a recognisable amount, or is in a unit with no known price.
+    """
+    token = reward_token.strip().upper() if isinstance(reward_token, str) and reward_token.strip() else None
+    if reward_pool is None:
+        return RewardValue(None, token)
+    if isinstance(reward_pool, (int, float)):
+        return RewardValue(float(reward_pool), token)
+
+    text = str(reward_pool)
+    prices = token_prices()
+    # A signed or token-denominated amount beats a bare number ("Top 3 share $10K")
+    match = None
+    for candidate in AMOUNT.finditer(text):
+        if candidate.group("sign") or (candidate.group("unit") or "").upper() in prices:
+            match = candidate
+            break
+        match = match or candidate
+    if match is None:
+        return RewardValue(None, token)
+    if not (match.group("sign") or (match.group("unit") or "").upper() in prices) and NON_MONETARY.search(text):
+        # "Alpha", "TBD", "Season 2 token allocation": no real amount
+        return RewardValue(None, token)
+
+    amount = float(match.group("number").replace(",", ""))
+    amount *= MAGNITUDES.get((match.group("magnitude") or "").lower(), 1)
+
+    unit = (match.group("unit") or "").upper()
+    if unit in prices:
+        token = token or unit
+    elif not token:
+        mention = _token_mention().search(text)
+        token = mention.group(1).upper() if mention else None
+
+    if match.group("sign"):
+        # "$5,000" (optionally "paid in SOL"): already a USD figure
+        return RewardValue(amount * FIAT.get(match.group("sign"), 1.0), token)
+    if unit in prices:
+        return RewardValue(amount * prices[unit], token)
+    if unit in UNPRICED_UNITS:
+        return RewardValue(None, token)
+    if token in prices:
+        return RewardValue(amount * prices[token], token)
+    # Bare number: assume USD, as every earlier parser did
+    return RewardValue(amount, token)
+
+
+def reward_usd(reward_pool, reward_token: Optional[str] = None) -> Optional[float]:
+    return normalize_reward(reward_pool, reward_token).usd
+
+
+def apply_reward(values: dict) -> dict:
+    """
+    Set estimated_value_usd / reward_token in `values` (opportunity fields) from
+    its reward_pool. An estimated_value_usd already in `values` is kept only
+    when reward_pool has no recognisable amount.
+    """
+    reward = normalize_reward(values.get("reward_pool"), values.get("reward_token"))
+    if reward.usd is not None:
+        values["estimated_value_usd"] = reward.usd
+    else:
+        values.setdefault("estimated_value_usd", None)
+    if reward.token and not values.get("reward_token"):
+        values["reward_token"] = reward.token
+    return values
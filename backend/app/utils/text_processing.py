@@ -48,46 +48,35 @@ def generate_content_hash(text: str) -> str:
     return hashlib.sha256(clean.encode('utf-8')).hexdigest()
 
 from datetime import datetime
+from functools import lru_cache
+import json
+import os
 
-COMMON_SKILLS = [
-    "Rust", "Solidity", "Python", "TypeScript", "React", "Next.js", "Go", "C++", 
-    "Move", "Cairo", "Vyper", "ZK", "Zero Knowledge", "DeFi", "NFT", "DAO", 
-    "Smart Contract", "Frontend", "Backend", "Fullstack", "Mobile", "iOS", "Android"
-]
+from .keyword_matcher import KeywordMatcher
+from .deadlines import extract_deadline  # noqa: F401  (re-exported; used to live here)
 
-def extract_deadline(text: str):
-    """
-    Extracts deadline using regex patterns.
-    Returns ISO date string (YYYY-MM-DD) or None.
-    """
-    if not text: return None
-    
-    # Patterns for deadlines
-    patterns = [
-        r"(?:deadline|closing|apply by|ends|until):?\s*([a-zA-Z]{3,9}\s\d{1,2},?\s?\d{4})", # Deadline: March 15, 2024
-        r"(?:deadline|closing|apply by|ends|until):?\s*(\d{1,2}/\d{1,2}/\d{4})", # Apply by: 01/01/2024
-        r"(?:deadline|closing|apply by|ends|until):?\s*(\d{4}-\d{2}-\d{2})", # Ends: 2024-01-01
-        r"due:?\s*([a-zA-Z]{3,9}\s\d{1,2})", # Due March 15
-    ]
-    
-    for pat in patterns:
-        match = re.search(pat, text, re.IGNORECASE)
-        if match:
-            date_str = match.group(1)
-            try:
-                from dateutil import parser
-                dt = parser.parse(date_str)
-                # If year is missing (e.g. "March 15"), assume current year (2026) or next year
-                if dt.year == 1900: # specific to some dateutil defaults
-                     now = datetime.now()
-                     dt = dt.replace(year=now.year)
-                     if dt < now: dt = dt.replace(year=now.year + 1)
-                
-                return dt.date().isoformat()
-            except:
-                 pass
-                 
-    return None
+# Skill / chain / category vocabulary (label -> terms); point this at a larger file to extend it
+VOCABULARY_PATH = os.getenv(
+    "KEYWORD_VOCABULARY_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "vocabulary.json"),
+)
+
+
+@lru_cache(maxsize=1)
+def load_vocabulary() -> dict:
+    with open(VOCABULARY_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def vocabulary_matcher(section: str, word_boundaries: bool = True) -> KeywordMatcher:
+    """Compiled matcher for one vocabulary section, built on first use."""
+    entries = load_vocabulary()[section]
+    if isinstance(entries, dict):
+        terms = {term: label for label, aliases in entries.items() for term in aliases}
+    else:
+        terms = entries
+    return KeywordMatcher(terms, word_boundaries=word_boundaries)
 
 def extract_reward_pool(text: str) -> str:
     """Extracts monetary values or token amounts."""
@@ -110,17 +99,12 @@ def extract_reward_pool(text: str) -> str:
     return None
 
 def extract_skills(text: str) -> list[str]:
-    """Extracts skills from text based on a predefined list."""
-    if not text: return []
-    found = []
-    text_lower = text.lower()
-    
-    for skill in COMMON_SKILLS:
-        # Simple word boundary check
-        if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-            found.append(skill)
-            
-    return list(set(found))
+    """Skills (vocabulary labels) mentioned in the text, as whole words."""
+    return vocabulary_matcher("skills").labels_in(text)
+
+def extract_chains(text: str) -> list[str]:
+    """Chains (vocabulary labels) mentioned in the text, in order of first mention."""
+    return vocabulary_matcher("chains").labels_in(text)
 
 def is_opportunity_fresh(date_str: str) -> bool:
     """Checks if opportunity is from 2026 onwards."""
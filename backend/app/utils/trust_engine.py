@@ -1,8 +1,9 @@
 import requests
 from typing import Dict, List
-import socket
 from datetime import datetime
 
+from ..services.domain_reputation import DomainReputationCache
+
 class TrustEngine:
     """
     The Anti-Deception Engine for OppForge.
@@ -38,11 +39,8 @@ class TrustEngine:
             score -= 40
             
         # 🛡️ Signal 5: Domain Freshness (Optional - requires API or whois)
-        # For now, let's just do a reachability check
-        try:
-            domain = url.split('//')[-1].split('/')[0]
-            socket.gethostbyname(domain)
-        except:
+        # For now, let's just do a reachability check (cached per domain)
+        if not DomainReputationCache.lookup(url).resolves:
             score -= 30 # Domain doesn't resolve? High risk.
 
         return max(0, min(100, score))
@@ -13,5 +13,5 @@ source venv/bin/activate
 celery -A app.celery_config.celery_app worker \
     --loglevel=info \
     --concurrency=4 \
-    --queues=scraping,ai_processing,notifications \
+    --queues=scraping,ai_processing,notifications,maintenance \
     --max-tasks-per-child=50
@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app import models  # noqa: F401  (registers all tables)
+from app.services import ingestion
+
+
+@pytest.fixture
+def engine():
+    """Fresh in-memory database. One shared connection, so TestClient's worker thread sees the same data."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def offline_pipeline(monkeypatch):
+    """No AI engine, DNS or embeddings: every item passes triage unchanged."""
+    async def bypass(items, concurrency=None, client=None):
+        return [("bypass", None)] * len(items)
+
+    monkeypatch.setattr(ingestion.AgentCurator, "assess_batch", staticmethod(bypass))
+    monkeypatch.setattr("app.utils.trust_engine.TrustEngine.calculate_score", staticmethod(lambda data: 80))
+    monkeypatch.setattr(ingestion.VectorDBService, "add_opportunities", classmethod(lambda cls, payloads: True))
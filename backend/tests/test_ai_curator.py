@@ -1,6 +1,10 @@
 import pytest
+import asyncio
+import json
 import os
+import httpx
 from unittest.mock import MagicMock
+from app.services import curator
 from app.services.curator import AgentCurator
 
 @pytest.fixture
@@ -43,3 +47,64 @@ def test_triage_structure(sample_raw_opportunity):
     else:
         # Fallback behavior
         pass
+
+
+def _mock_engine(monkeypatch, classify):
+    """Fake AI engine: records peak concurrency; `classify` maps title -> is_opportunity."""
+
+    monkeypatch.setattr(curator, "GROQ_API_KEY", "test-key")
+    state = {"active": 0, "peak": 0, "risk_calls": 0}
+
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        body = json.loads(request.content)
+        if request.url.path == "/ai/risk-assess":
+            state["risk_calls"] += 1
+            return httpx.Response(200, json={"data": {"risk_score": 10, "risk_level": "Low", "flags": []}})
+        title = body["raw_text"].split(".")[0]
+        return httpx.Response(200, json={"data": {"is_opportunity": classify(title), "title": title.upper()}})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), state
+
+
+def _items(n):
+    return [
+        {"title": f"Grant {i}", "description": "Apply for this ecosystem grant today.", "source": "Twitter"}
+        for i in range(n)
+    ]
+
+
+def test_triage_batch_is_bounded_and_keeps_order(monkeypatch):
+    client, state = _mock_engine(monkeypatch, classify=lambda title: True)
+
+    results = asyncio.run(AgentCurator.triage_batch(_items(10), concurrency=3, client=client))
+
+    assert [r["title"] for r in results] == [f"GRANT {i}" for i in range(10)]
+    assert all(r["risk_level"] == "Low" for r in results)
+    assert state["peak"] <= 3 * 2  # classify + risk per in-flight item
+    assert state["peak"] > 2       # and items really overlap
+
+
+def test_triage_batch_discards_noise(monkeypatch):
+    client, _ = _mock_engine(monkeypatch, classify=lambda title: title.endswith("1"))
+
+    results = asyncio.run(AgentCurator.triage_batch(_items(3), client=client))
+
+    assert results[0] is None and results[2] is None
+    assert results[1]["title"] == "GRANT 1"
+
+
+def test_triage_bypasses_when_engine_unreachable(monkeypatch):
+    monkeypatch.setattr(curator, "GROQ_API_KEY", "test-key")
+
+    def refuse(request):
+        raise httpx.ConnectError("engine down")
+
+    items = _items(2)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(refuse))
+    results = asyncio.run(AgentCurator.triage_batch(items, client=client))
+
+    assert results == items
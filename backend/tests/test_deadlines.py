@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+
+from app.utils import deadlines
+from app.utils.deadlines import DateInfo, extract_dates, extract_deadline, extract_start_date, relative_deadline
+from app.utils.text_processing import extract_deadline as reexported
+
+NOW = datetime(2026, 10, 18, 12, 0)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Deadline: March 15, 2026", "2026-03-15"),
+    ("Deadline on June 3rd 2026", "2026-06-03"),
+    ("until Sept. 5, 2026", "2026-09-05"),
+    ("Apply by 01/02/2026", "2026-01-02"),
+    ("Ends: 2026-01-01", "2026-01-01"),
+    ("Due Dec 1", "2026-12-01"),
+    ("Due March 15", "2027-03-15"),                 # no year: next occurrence
+    ("Ends 2026-01-01. deadline: Jan 5, 2026", "2026-01-05"),  # full date beats ISO, as before
+    ("Deadline: Febr 30, 2026", None),
+    ("weekends: March 5, 2026", None),
+    ("No date mentioned", None),
+    ("", None),
+])
+def test_extract_deadline(text, expected):
+    assert extract_deadline(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Submissions ends in 3 days", "2026-10-21"),
+    ("Closes tomorrow", "2026-10-19"),
+    ("Registration closes in two weeks", "2026-11-01"),
+    ("ends in 12 hours", "2026-10-19"),
+    ("Deadline: March 15, 2026", None),
+])
+def test_relative_deadline(text, expected):
+    assert relative_deadline(text, NOW) == expected
+
+
+def test_start_date_is_not_taken_as_deadline():
+    text = "Starts May 1st, 2026. Deadline on June 3rd 2026"
+    assert extract_start_date(text, NOW) == "2026-05-01"
+    assert extract_deadline(text, NOW) == "2026-06-03"
+
+
+def test_extract_dates_batch():
+    texts = [
+        "Starts May 1, 2026. Ends in 3 days",
+        "Deadline: March 15, 2026. Closes tomorrow",
+        None,
+        "Opens 2026-11-01",
+    ]
+    assert extract_dates(texts, NOW) == [
+        DateInfo("2026-10-21", "2026-05-01"),
+        DateInfo("2026-03-15", None),           # explicit date wins over a relative phrase
+        DateInfo(None, None),
+        DateInfo(None, "2026-11-01"),
+    ]
+
+
+def test_parse_cache_shares_normalized_strings():
+    deadlines.parse_date.cache_clear()
+    extract_dates(["Deadline: March 15, 2026", "deadline: march 15 2026", "DEADLINE:  March 15,2026"], NOW)
+    info = deadlines.parse_date.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_text_processing_reexport():
+    assert reexported is extract_deadline
@@ -0,0 +1,71 @@
+import asyncio
+import socket
+
+import pytest
+
+from app.services import domain_reputation
+from app.services.domain_reputation import DomainReputationCache
+from app.utils.trust_engine import TrustEngine
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    DomainReputationCache.clear()
+    yield
+    DomainReputationCache.clear()
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    """Fake DNS: hosts ending in .invalid fail, the rest resolve. Records every query."""
+    queries = []
+
+    async def getaddrinfo(self, host, port, *args, **kwargs):
+        queries.append(host)
+        await asyncio.sleep(0)
+        if host.endswith(".invalid"):
+            raise socket.gaierror("not found")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 0))]
+
+    def gethostbyname(host):
+        queries.append(host)
+        if host.endswith(".invalid"):
+            raise socket.gaierror("not found")
+        return "127.0.0.1"
+
+    monkeypatch.setattr(asyncio.base_events.BaseEventLoop, "getaddrinfo", getaddrinfo)
+    monkeypatch.setattr(domain_reputation.socket, "gethostbyname", gethostbyname)
+    return queries
+
+
+def test_resolve_many_queries_each_domain_once(resolver):
+    urls = [f"https://earn.superteam.fun/listing/{i}" for i in range(20)] + [
+        "https://gone.invalid/grant",
+        "https://gone.invalid/other",
+    ]
+    assert asyncio.run(DomainReputationCache.resolve_many(urls)) == 2
+    assert sorted(resolver) == ["earn.superteam.fun", "gone.invalid"]
+
+    # Warm cache: no further queries, and TrustEngine reads the cached verdicts
+    assert asyncio.run(DomainReputationCache.resolve_many(urls)) == 0
+    description = "A long enough description of a perfectly ordinary grant program."
+    good = TrustEngine.calculate_score({"url": urls[0], "source": "superteam", "title": "Grant", "description": description})
+    bad = TrustEngine.calculate_score({"url": urls[-1], "source": "superteam", "title": "Grant", "description": description})
+    assert good - bad == 30
+    assert len(resolver) == 2
+
+
+def test_failures_expire_sooner_than_successes(resolver, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(domain_reputation.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(domain_reputation, "DOMAIN_CACHE_TTL", 3600)
+    monkeypatch.setattr(domain_reputation, "DOMAIN_NEGATIVE_TTL", 60)
+
+    assert DomainReputationCache.lookup("https://ok.example/a").resolves
+    assert not DomainReputationCache.lookup("https://down.invalid/a").resolves
+    assert len(resolver) == 2
+
+    clock[0] += 120
+    DomainReputationCache.lookup("https://ok.example/b")
+    DomainReputationCache.lookup("https://down.invalid/b")
+    assert resolver[2:] == ["down.invalid"]
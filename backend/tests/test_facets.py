@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app import database
+from app.core.cache import ResponseCache
+from app.main import app
+from app.models.opportunity import Opportunity
+from app.models.user import User
+from app.routers.admin import require_staff
+from app.services import facets
+from app.utils.query_counter import QueryCounter
+
+
+NOW = datetime(2026, 3, 10, 12)
+
+
+def _seed(db):
+    rows = [
+        # category, chain, source, difficulty, deadline, is_open
+        ("Grant", "Solana", "superteam", "Beginner", None, True),
+        ("Grant", "Ethereum", "superteam", "Expert", NOW + timedelta(days=3), True),
+        ("Hackathon", "Solana", "dorahacks", "Intermediate", NOW + timedelta(days=20), True),
+        ("Bounty", None, "code4rena", "Expert", NOW + timedelta(days=90), True),
+        ("Grant", "Solana", "superteam", "Beginner", NOW - timedelta(days=1), True),   # expired
+        ("Grant", "Solana", "superteam", "Beginner", None, False),                     # closed
+    ]
+    for i, (category, chain, source, difficulty, deadline, is_open) in enumerate(rows):
+        db.add(Opportunity(title=f"Opportunity {i}", url=f"https://example.com/{i}", source=source,
+                           source_id=str(i), category=category, chain=chain, difficulty=difficulty,
+                           deadline=deadline, is_open=is_open, is_verified=i % 2 == 0))
+    db.commit()
+
+
+def test_feed_facets_count_open_unexpired_rows_in_one_query(engine, db):
+    _seed(db)
+    with QueryCounter(engine) as queries:
+        result = facets.feed_facets(db, now=NOW)
+    assert queries.total == 1
+
+    assert result == {
+        "total": 4,
+        "category": {"Grant": 2, "Bounty": 1, "Hackathon": 1},
+        "chain": {"Solana": 2, "Ethereum": 1, "Unknown": 1},
+        "source": {"superteam": 2, "code4rena": 1, "dorahacks": 1},
+        "difficulty": {"Expert": 2, "Beginner": 1, "Intermediate": 1},
+        "deadline": {"later": 1, "month": 1, "none": 1, "week": 1},
+    }
+
+
+def test_count_facets_over_the_whole_table(db):
+    _seed(db)
+    result = facets.count_facets(db, ("source", "verified", "open"))
+    assert result["total"] == 6
+    assert result["verified"] == {"false": 3, "true": 3}
+    assert result["open"] == {"true": 5, "false": 1}
+    assert facets.count_facets(db, ("category",))["category"]["Grant"] == 4
+    with pytest.raises(ValueError):
+        facets.count_facets(db, ("category", "password"))
+
+
+def test_postgres_uses_grouping_sets():
+    rows = select(Opportunity.category, Opportunity.chain).subquery("facet_rows")
+    sql = str(facets.grouping_sets_statement(rows, ("category", "chain")).compile(dialect=postgresql.dialect()))
+    assert "GROUP BY GROUPING SETS((facet_rows.category), (facet_rows.chain))" in sql
+    assert "grouping(facet_rows.chain)" in sql
+
+
+def test_facets_endpoint_is_cached_until_opportunities_change(db):
+    _seed(db)
+    ResponseCache.clear()
+    app.dependency_overrides[database.get_db] = lambda: db
+    try:
+        client = TestClient(app)
+        first = client.get("/opportunities/facets")
+        second = client.get("/opportunities/facets")
+        ResponseCache.bump("opportunities")
+        third = client.get("/opportunities/facets")
+    finally:
+        app.dependency_overrides.clear()
+        ResponseCache.clear()
+
+    assert first.status_code == 200
+    assert first.json()["category"]["Grant"] >= 1
+    assert [r.headers["x-cache"] for r in (first, second, third)] == ["MISS", "HIT", "MISS"]
+
+
+def test_admin_scraper_status_reads_the_grouped_counts(db):
+    _seed(db)
+    app.dependency_overrides[database.get_db] = lambda: db
+    app.dependency_overrides[require_staff] = lambda: User(email="staff@example.com")
+    try:
+        body = TestClient(app).get("/admin/scraper/status", params={"runs": 0}).json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert body["total_opportunities"] == 6
+    assert body["verified"] == 3 and body["open"] == 5
+    assert body["by_source"] == {"superteam": 4, "code4rena": 1, "dorahacks": 1}
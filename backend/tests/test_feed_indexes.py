@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app import database
+from app.core.cache import ResponseCache
+from app.main import app
+from app.models.opportunity import FEED_INDEXES, Opportunity
+from app.scripts.add_feed_indexes import drop, migrate
+from app.scripts.bench_feed_indexes import explain, feed_queries
+
+
+def _index_names(db):
+    return {row[0] for row in db.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'opportunities'"))}
+
+
+def test_create_all_builds_the_feed_indexes(db):
+    assert set(FEED_INDEXES) <= _index_names(db)
+
+
+def test_migration_is_rerunnable(engine, db):
+    drop(engine)
+    assert not set(FEED_INDEXES) & _index_names(db)
+    migrate(engine, verbose=False)
+    migrate(engine, verbose=False)
+    assert set(FEED_INDEXES) <= _index_names(db)
+
+
+@pytest.mark.parametrize("name, index", [
+    ("feed page", "ix_opportunities_open_recent"),
+    ("category feed", "ix_opportunities_open_category_recent"),
+    ("chain feed", "ix_opportunities_open_chain_recent"),
+    ("closing soon count", "ix_opportunities_open_deadline"),
+])
+def test_feed_queries_use_the_partial_indexes(db, name, index):
+    plan = explain(db, feed_queries(db, datetime.now())[name])
+    assert index in plan
+
+
+def test_legacy_filters_cannot_use_them(db):
+    plan = explain(db, feed_queries(db, datetime.now(), legacy=True)["category feed"])
+    assert "ix_opportunities_open_category_recent" not in plan
+
+
+def test_feed_filters_stay_case_insensitive(db):
+    now = datetime.now()
+    rows = [
+        ("Solana grant", "Grant", "Solana", True, None),
+        ("Base grant", "grant", "BASE", True, now + timedelta(days=3)),
+        ("Closed grant", "Grant", "Solana", False, None),
+        ("Expired grant", "Grant", "Solana", True, now - timedelta(days=1)),
+        ("Solana bounty", "Bounty", "solana", True, None),
+    ]
+    for i, (title, category, chain, is_open, deadline) in enumerate(rows):
+        db.add(Opportunity(title=title, url=f"https://example.com/{i}", source="test", source_id=str(i),
+                           category=category, chain=chain, is_open=is_open, deadline=deadline))
+    db.commit()
+
+    ResponseCache.clear()
+    app.dependency_overrides[database.get_db] = lambda: db
+    try:
+        client = TestClient(app)
+        grants = client.get("/opportunities", params={"category": "GRANT"}).json()
+        solana = client.get("/opportunities", params={"chain": "solana"}).json()
+    finally:
+        app.dependency_overrides.clear()
+        ResponseCache.clear()
+
+    assert sorted(o["title"] for o in grants) == ["Base grant", "Solana grant"]
+    assert sorted(o["title"] for o in solana) == ["Solana bounty", "Solana grant"]
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app import database
+from app.main import app
+from app.models.opportunity import Opportunity
+from app.services import full_text
+from app.services.full_text import FullTextIndex, fts5_match
+
+
+@pytest.fixture
+def indexed(engine):
+    FullTextIndex.install(engine)
+
+
+def _add(db, title, description="", tags=None, **extra):
+    opp = Opportunity(title=title, description=description, tags=tags or [], url=f"https://example.com/{title}",
+                      source="manual", category=extra.pop("category", "Grant"), chain="Solana", **extra)
+    db.add(opp)
+    db.commit()
+    return opp
+
+
+def test_title_outranks_tags_outranks_description(db, indexed):
+    for i in range(6):  # bm25 needs a corpus where the term is rare
+        _add(db, f"Unrelated listing {i}", description="Gaming guild")
+    _add(db, "Community grants round", description="Fund zero knowledge research")
+    _add(db, "Builder program", tags=["Privacy", "ZK"], description="Open to all")
+    _add(db, "Privacy hackathon", description="Build wallets")
+    titles = [(opp.title, score) for opp, score in full_text.search(db, "privacy")]
+    assert [t for t, _ in titles] == ["Privacy hackathon", "Builder program"]
+    assert 0 < titles[1][1] < titles[0][1] < 1
+
+
+def test_index_follows_updates_and_deletes(db, indexed):
+    opp = _add(db, "Rust bounty")
+    assert [o.title for o, _ in full_text.search(db, "rust")] == ["Rust bounty"]
+    opp.title = "Move bounty"
+    db.commit()
+    assert full_text.search(db, "rust") == []
+    assert [o.title for o, _ in full_text.search(db, "move")] == ["Move bounty"]
+    db.delete(opp)
+    db.commit()
+    assert full_text.search(db, "move") == []
+
+
+def test_rows_written_before_install_are_backfilled(db):
+    _add(db, "Solana accelerator")
+    FullTextIndex.install(db.get_bind())
+    assert [o.title for o, _ in full_text.search(db, "accelerator")] == ["Solana accelerator"]
+
+
+def test_caller_filters_apply(db, indexed):
+    _add(db, "Grant A: DeFi tooling")
+    _add(db, "Hackathon B: DeFi", category="Hackathon")
+    query = db.query(Opportunity).filter(Opportunity.category == "Hackathon")
+    assert [o.title for o, _ in full_text.search(db, "defi", query=query)] == ["Hackathon B: DeFi"]
+
+
+def test_last_word_is_a_prefix_and_syntax_is_escaped():
+    assert fts5_match('zk "priv') == '"zk" "priv"*'
+    assert fts5_match("NEAR OR -x*") == '"near" "or" "x"*'
+    assert fts5_match("  ?! ") is None
+
+
+def test_without_index_falls_back_to_substring_match(db):
+    _add(db, "Wallet bounty", description="Audit the wallet")
+    _add(db, "Audit contest", description="Any wallet")
+    results = full_text.search(db, "audit")
+    assert [(o.title, s) for o, s in results] == [("Audit contest", 0.6), ("Wallet bounty", 0.3)]
+
+
+def test_search_endpoints_rank_and_score(db, indexed):
+    _add(db, "Aptos move hackathon", description="Ship on Aptos")
+    _add(db, "Generic grant", description="Projects using Move are welcome")
+    _add(db, "Closed move grant", is_open=False)
+    _add(db, "Expired move bounty", deadline=datetime.now() - timedelta(days=1))
+    app.dependency_overrides[database.get_db] = lambda: db
+    try:
+        client = TestClient(app)
+        listed = client.get("/opportunities/search", params={"q": "move"}).json()
+        assert [o["title"] for o in listed] == ["Aptos move hackathon", "Generic grant"]
+
+        found = client.get("/search", params={"q": "move hackathon"}).json()
+        assert found["results"][0]["title"] == "Aptos move hackathon"
+        assert 0 < found["results"][0]["relevance_score"] < 1
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_index_installed_later_is_picked_up_without_restart(db):
+    assert not FullTextIndex.available(db)
+    FullTextIndex.install(db.get_bind())
+    assert FullTextIndex.available(db)
+
+
+def test_missing_index_is_rechecked_after_the_interval(db, monkeypatch):
+    assert not FullTextIndex.available(db)
+    # Installed by another process (the script), not through this one's install()
+    with db.get_bind().connect() as conn:
+        for statement in full_text._SQLITE_DDL:
+            conn.execute(text(statement))
+        conn.commit()
+    assert not FullTextIndex.available(db)  # negative answer still fresh
+    monkeypatch.setattr(full_text, "FULL_TEXT_RECHECK_SECONDS", 0)
+    assert FullTextIndex.available(db)
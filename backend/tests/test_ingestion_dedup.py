@@ -0,0 +1,119 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database
+from app.core.cache import ResponseCache
+from app.main import app
+from app.models.enums import UserRole
+from app.models.ingestion_run import IngestionRun
+from app.models.opportunity import Opportunity
+from app.models.user import User
+from app.routers.auth import get_current_user
+from app.scrapers.curated import CuratedScraper
+from app.services import ingestion
+from app.services.dedup import DedupIndex, content_signature
+
+
+pytestmark = pytest.mark.usefixtures("offline_pipeline")
+
+
+def _item(n, **overrides):
+    item = {
+        "title": f"Solana Grant Round {n}",
+        "description": "Funding for Rust developers building on Solana. Deadline: 2026-12-01",
+        "url": f"https://example.org/grants/{n}?utm_source=twitter",
+        "source": "Superteam",
+        "source_id": f"st-{n}",
+        "category": "Grant",
+        "chain": "Solana",
+    }
+    item.update(overrides)
+    return item
+
+
+def test_saves_new_items_and_stores_content_hash(db):
+    saved = ingestion.ingest_opportunities(db, [_item(1), _item(2)])
+
+    assert len(saved) == 2
+    stored = db.query(Opportunity).order_by(Opportunity.title).all()
+    assert [o.url for o in stored] == ["https://example.org/grants/1", "https://example.org/grants/2"]
+    assert all(o.content_hash for o in stored)
+
+
+def test_skips_known_ids_urls_and_titles(db):
+    ingestion.ingest_opportunities(db, [_item(1)])
+
+    again = ingestion.ingest_opportunities(db, [
+        _item(1),                                          # same source + source_id
+        _item(2, url="https://www.example.org/grants/1"),  # same normalized URL
+        _item(3, title="Solana Grant Round 1"),            # same title after triage
+    ])
+
+    assert again == []
+    assert db.query(Opportunity).count() == 1
+
+
+def test_duplicates_within_one_batch_are_saved_once(db):
+    saved = ingestion.ingest_opportunities(db, [_item(1), _item(1)])
+
+    assert len(saved) == 1
+
+
+def test_insert_ignores_rows_written_by_another_worker(db):
+    pipeline = ingestion.IngestionPipeline(db=db)
+    pipeline.dedup = DedupIndex()  # stale index: does not know about the row below
+    db.add(Opportunity(title="Other", url="https://example.org/grants/1", source="Superteam", source_id="st-1"))
+    db.commit()
+
+    assert pipeline._save_opportunities([_item(1)]) == []
+    assert db.query(Opportunity).count() == 1
+
+
+def test_content_signature_ignores_case_and_punctuation():
+    a = content_signature({"title": "ETH Global!", "description": "Hack", "source": "x"})
+    b = content_signature({"title": "eth global", "description": "hack.", "source": "X"})
+    assert a == b
+
+
+def test_flushes_in_chunks_with_mixed_fields(db, monkeypatch):
+    chunks = []
+    monkeypatch.setattr(ingestion.VectorDBService, "add_opportunities", classmethod(lambda cls, payloads: chunks.append(len(payloads))))
+    items = [_item(n) for n in range(5)]
+    items[1]["reward_pool"] = "$5,000"
+    items[3]["deadline"] = "2026-12-01T00:00:00Z"
+
+    saved = ingestion.IngestionPipeline(db=db, batch_size=2)._save_opportunities(items)
+
+    assert len(saved) == 5
+    assert chunks == [2, 2, 1]
+    assert {o.reward_pool for o in saved} >= {"$5,000"}
+
+
+def test_batch_ingest_invalidates_cached_feed_responses(db):
+    before = ResponseCache.versions(["opportunities"])
+    ingestion.ingest_opportunities(db, [_item(1)])
+    after = ResponseCache.versions(["opportunities"])
+    assert after != before
+
+    ingestion.ingest_opportunities(db, [_item(1)])  # nothing new: no invalidation
+    assert ResponseCache.versions(["opportunities"]) == after
+
+
+def test_admin_scrape_uses_the_ingestion_pipeline(db, monkeypatch):
+    ingestion.ingest_opportunities(db, [_item(1)])
+    monkeypatch.setattr(CuratedScraper, "run", lambda self: [_item(1), _item(2, reward_pool="$5,000")])
+    admin = User(email="admin@example.com", role=UserRole.ADMIN)
+    db.add(admin)
+    db.commit()
+
+    app.dependency_overrides[database.get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: admin
+    try:
+        body = TestClient(app).post("/admin/scrape", json={"source": "curated"}).json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert body["results"]["curated"] == {"found": 2, "saved": 1, "skipped": 1}
+    added = db.query(Opportunity).filter_by(source_id="st-2").one()
+    assert added.content_hash and added.estimated_value_usd == 5000.0
+    assert db.query(IngestionRun).filter_by(trigger="admin").count() == 1
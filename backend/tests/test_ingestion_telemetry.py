@@ -0,0 +1,79 @@
+from hashlib import sha256
+
+from app.models.ingestion_run import IngestionRun
+from app.routers import admin
+from app.scrapers.base import BaseScraper
+from app.services import ingestion
+
+
+class ListScraper(BaseScraper):
+    def __init__(self, name, items):
+        super().__init__(name)
+        self.items = items
+
+    def fetch(self):
+        return self.items
+
+    def parse(self, raw_data):
+        return raw_data
+
+
+def _item(source, n, **overrides):
+    item = {
+        "title": f"{source} listing {n}",
+        "description": f"Build tooling for the community. Ref {sha256(f'{source}{n}'.encode()).hexdigest()}",
+        "url": f"https://{source.lower()}.example/{n}",
+        "source": source,
+        "source_id": f"{source}-{n}",
+    }
+    item.update(overrides)
+    return item
+
+
+def test_run_records_counts_per_source_and_stage_timings(db, monkeypatch):
+    async def assess(items, concurrency=None, client=None):
+        return [("noise", None) if "noise" in item["title"] else ("bypass", None) for item in items]
+
+    monkeypatch.setattr(ingestion.AgentCurator, "assess_batch", staticmethod(assess))
+    monkeypatch.setattr("app.utils.trust_engine.TrustEngine.calculate_score", staticmethod(lambda data: 80))
+    monkeypatch.setattr(ingestion.VectorDBService, "add_opportunities", classmethod(lambda cls, payloads: True))
+
+    alpha = ListScraper("Alpha", [
+        _item("Alpha", 1),
+        _item("Alpha", 1),                                   # duplicate
+        _item("Alpha", 2, title="noise post"),               # noise
+        _item("Alpha", 3, description="Deadline: 2023-05-01"),  # stale
+    ])
+    beta = ListScraper("Beta", [_item("Beta", 1), _item("Beta", 2)])
+    pipeline = ingestion.IngestionPipeline(db=db, scrapers=[alpha, beta], trigger="test")
+    monkeypatch.setattr(db, "close", lambda: None)
+    pipeline.run(notify=False)
+
+    run = db.query(IngestionRun).one()
+    assert run.trigger == "test" and run.status == "success"
+    assert (run.found, run.duplicate, run.noise, run.stale, run.saved) == (6, 1, 1, 1, 3)
+    assert run.near_duplicate == 0
+    assert run.llm_calls == 1 and run.duration_seconds is not None
+    assert {s["stage"] for s in run.stages} >= {"fetch", "prepare", "triage", "enrich", "persist", "index"}
+
+    by_source = {s.source: s for s in run.sources}
+    assert (by_source["Alpha"].found, by_source["Alpha"].saved) == (4, 1)
+    assert (by_source["Beta"].found, by_source["Beta"].saved) == (2, 2)
+    assert by_source["Beta"].fetch_seconds is not None and not by_source["Beta"].timed_out
+
+    status = admin.scraper_status(runs=5, db=db, current_user=None)
+    assert status["by_source"] == {"Alpha": 1, "Beta": 2}
+    recent = status["recent_runs"][0]
+    assert recent["counts"]["saved"] == 3 and len(recent["sources"]) == 2
+
+
+def test_ai_engine_errors_mark_the_run_partial(db, monkeypatch):
+    async def failing(items, concurrency=None, client=None):
+        return [("error", None)] * len(items)
+
+    monkeypatch.setattr(ingestion.AgentCurator, "assess_batch", staticmethod(failing))
+    ingestion.ingest_opportunities(db, [_item("Gamma", 1)], trigger="scrape_twitter")
+
+    run = db.query(IngestionRun).one()
+    assert run.status == "partial" and run.errors == 1 and run.saved == 0
+    assert [(s.source, s.found, s.errors) for s in run.sources] == [("Gamma", 1, 1)]
@@ -0,0 +1,60 @@
+import random
+import re
+
+from app.scrapers.reddit import RedditScraper
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.text_processing import extract_skills, load_vocabulary, vocabulary_matcher
+
+
+def _naive(terms, text, word_boundaries):
+    """Each term tested on its own, like the loops the matcher replaces."""
+    text = text.lower()
+    hits = set()
+    for term in terms:
+        if word_boundaries:
+            if re.search(r"(?<!\w)" + re.escape(term) + r"(?!\w)", text):
+                hits.add(term)
+        elif term in text:
+            hits.add(term)
+    return hits
+
+
+def test_matches_equal_per_term_search_on_random_text():
+    vocabulary = load_vocabulary()
+    terms = [t for aliases in vocabulary["skills"].values() for t in aliases]
+    words = terms + ["the", "and", "builders", "smart", "contracts", "-", "/", "c", "go!", "node"]
+    rng = random.Random(7)
+    for word_boundaries in (True, False):
+        matcher = KeywordMatcher(terms, word_boundaries=word_boundaries)
+        for _ in range(300):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 25)))
+            assert set(matcher.terms_in(text)) == _naive(terms, text, word_boundaries), text
+
+
+def test_overlapping_and_prefix_terms_are_all_reported():
+    matcher = KeywordMatcher({"smart contract": "Smart Contract", "smart contract audit": "Audit", "zk": "ZK", "zksync": "zkSync"})
+    assert matcher.labels_in("A Smart Contract Audit on zkSync") == ["Smart Contract", "Audit", "zkSync"]
+
+    substrings = KeywordMatcher(["program", "validator program"], word_boundaries=False)
+    assert substrings.terms_in("our validator programme") == ["validator program", "program"]
+
+
+def test_extract_skills_handles_symbols_and_aliases():
+    text = "Need C++ and Next.js devs for a zero-knowledge rollup. Golang a plus; go!"
+    assert extract_skills(text) == ["C++", "Next.js", "Zero Knowledge", "Rollups", "Go"]
+    assert extract_skills("") == []
+    assert "Go" not in extract_skills("a good gopher")
+
+
+def test_reddit_categories_keep_priority_order():
+    scraper = RedditScraper()
+    posts = [
+        {"id": "1", "title": "Validator program open", "selftext": "", "_subreddit": "ethdev", "created_utc": 10},
+        {"id": "2", "title": "Bug bounty live", "selftext": "Submit reports", "_subreddit": "ethdev", "created_utc": 11, "ups": 0},
+        {"id": "3", "title": "Weekly discussion", "selftext": "gm", "_subreddit": "ethdev", "created_utc": 12},
+    ]
+    parsed = {item["source_id"]: item for item in scraper.parse(posts)}
+    assert parsed["1"]["category"] == "Grant"  # "program" outranks the Testnet phrase
+    assert parsed["2"]["category"] == "Bounty" and parsed["2"]["ai_score"] == 60
+    assert "3" not in parsed
+    assert len(vocabulary_matcher("opportunity_categories", word_boundaries=False)) > 0
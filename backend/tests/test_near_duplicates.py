@@ -0,0 +1,66 @@
+from app.models.near_duplicate import OpportunityLSHBucket
+from app.models.opportunity import Opportunity
+from app.services import ingestion
+from app.services.near_duplicates import NearDuplicateIndex, minhash, similarity, BANDS
+
+
+BANGKOK = (
+    "ETHGlobal Bangkok 2026",
+    "Join 1000+ builders in Bangkok for 36 hours of hacking on Ethereum, L2s and ZK. "
+    "Prizes from sponsors including Optimism, Polygon and more.",
+)
+BANGKOK_REPOST = (
+    "ETHGlobal Bangkok Hackathon 2026!",
+    "Join 1000+ builders in Bangkok for 36 hours of hacking on Ethereum, L2s & ZK. "
+    "Prizes from sponsors incl. Optimism, Polygon and more!",
+)
+SAGA = (
+    "Saga thread bounty",
+    "Write a thread about Solana Mobile's Saga phone and its dApp store; the best threads win USDC prizes.",
+)
+
+
+def _item(text, source, n):
+    title, description = text
+    return {"title": title, "description": description, "source": source,
+            "source_id": f"{source}-{n}", "url": f"https://{source.lower()}.example/{n}"}
+
+
+def test_signatures_separate_reposts_from_different_listings():
+    original = minhash(" ".join(BANGKOK))
+    assert similarity(original, minhash(" ".join(BANGKOK_REPOST))) > 0.7
+    assert similarity(original, minhash(" ".join(SAGA))) < 0.2
+    assert minhash("gm") is None  # too short to judge
+
+
+def test_lookup_uses_persisted_buckets_and_ignores_same_source(db):
+    opp = Opportunity(title=BANGKOK[0], description=BANGKOK[1], url="https://ethglobal.example/bkk", source="ETHGlobal")
+    db.add(opp)
+    db.flush()
+    NearDuplicateIndex.index_saved(db, [opp])
+    db.commit()
+    assert db.query(OpportunityLSHBucket).count() <= BANDS
+
+    index = NearDuplicateIndex(db)
+    source, title, score = index.find(_item(BANGKOK_REPOST, "DoraHacks", 1))
+    assert (source, title) == ("ETHGlobal", BANGKOK[0]) and score > 0.7
+    assert index.find(_item(BANGKOK_REPOST, "ETHGlobal", 2)) is None
+    assert index.find(_item(SAGA, "Superteam", 3)) is None
+
+
+def test_ingestion_skips_cross_source_reposts_before_triage(db, monkeypatch):
+    triaged = []
+
+    async def bypass(items, concurrency=None, client=None):
+        triaged.extend(item["title"] for item in items)
+        return [("bypass", None)] * len(items)
+
+    monkeypatch.setattr(ingestion.AgentCurator, "assess_batch", staticmethod(bypass))
+    monkeypatch.setattr("app.utils.trust_engine.TrustEngine.calculate_score", staticmethod(lambda data: 80))
+    monkeypatch.setattr(ingestion.VectorDBService, "add_opportunities", classmethod(lambda cls, payloads: True))
+
+    ingestion.ingest_opportunities(db, [_item(BANGKOK, "ETHGlobal", 1), _item(BANGKOK_REPOST, "Curated", 1)])
+    ingestion.ingest_opportunities(db, [_item(BANGKOK_REPOST, "Twitter", 1), _item(SAGA, "Superteam", 1)])
+
+    assert triaged == [BANGKOK[0], SAGA[0]]
+    assert db.query(Opportunity).count() == 2
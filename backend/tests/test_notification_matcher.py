@@ -0,0 +1,138 @@
+import asyncio
+import random
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.notification import Notification
+from app.models.user import User
+from app.services import email_service, ingestion
+from app.services.notification_matcher import PreferenceIndex
+
+
+CATEGORIES = ["Grant", "Hackathon", "Bounty", "Airdrop", None]
+CHAINS = ["Solana", "Ethereum", "Base", None]
+SKILLS = ["rust", "solidity", "react", "zk", "design"]
+SETTING_CATEGORIES = ["grants", "hackathons", "bounties", "airdrops", "jobs"]
+
+
+def _reference_match(opp, user):
+    """The original per-(opportunity, user) rule from IngestionPipeline._process_notifications."""
+    prefs = user["notification_settings"] or {}
+    if not prefs.get("email_alerts", True):
+        return False
+    if prefs.get("frequency", "instant") != "instant":
+        return False
+    if not prefs.get("new_opportunities", True):
+        return False
+    user_pref_cats = prefs.get("categories", [])
+    if user_pref_cats:
+        opp_cat = (opp["category"] or "").lower()
+        cat_map = {"grants": "grant", "hackathons": "hackathon", "bounties": "bounty",
+                   "airdrops": "airdrop", "testnets": "testnet", "ambassador": "ambassador", "jobs": "job"}
+        allowed_cats = [cat_map.get(c, c) for c in user_pref_cats]
+        if opp_cat and opp_cat not in allowed_cats:
+            return False
+    user_cats = [c.lower() for c in (user["preferred_categories"] or [])]
+    cat_match = not user_cats or (opp["category"] and opp["category"].lower() in user_cats)
+    user_chains = [c.lower() for c in (user["preferred_chains"] or [])]
+    chain_match = not user_chains or (opp["chain"] and opp["chain"].lower() in user_chains)
+    user_skills = [s.lower() for s in (user["skills"] or [])]
+    text_blob = (opp["description"] or "") + (opp["title"] or "")
+    skill_match = not user_skills or any(s in text_blob.lower() for s in user_skills)
+    return bool((cat_match and chain_match) or skill_match)
+
+
+def _random_user(rng, n):
+    return {
+        "id": n,
+        "email": f"user{n}@example.com",
+        "notification_settings": {
+            "email_alerts": rng.random() > 0.1,
+            "frequency": rng.choice(["instant", "instant", "instant", "daily"]),
+            "new_opportunities": rng.random() > 0.1,
+            "categories": rng.sample(SETTING_CATEGORIES, rng.randint(0, 3)),
+        } if rng.random() > 0.05 else None,
+        "preferred_categories": rng.sample([c for c in CATEGORIES if c], rng.randint(0, 2)),
+        "preferred_chains": rng.sample([c for c in CHAINS if c], rng.randint(0, 2)),
+        "skills": [s.title() for s in rng.sample(SKILLS, rng.randint(0, 2))],
+    }
+
+
+def _random_opp(rng, n):
+    return {
+        "id": str(n),
+        "title": f"Opportunity {n} {rng.choice(SKILLS)}",
+        "description": " ".join(rng.sample(SKILLS + ["builders", "wanted"], 3)),
+        "category": rng.choice(CATEGORIES),
+        "chain": rng.choice(CHAINS),
+    }
+
+
+def test_index_matches_the_per_pair_rule():
+    rng = random.Random(7)
+    users = [_random_user(rng, n) for n in range(400)]
+    opps = [_random_opp(rng, n) for n in range(60)]
+
+    index = PreferenceIndex()
+    for u in users:
+        index.add(u["id"], u["email"], u["notification_settings"], u["preferred_categories"],
+                  u["preferred_chains"], u["skills"])
+
+    for opp in opps:
+        expected = {u["id"] for u in users if _reference_match(opp, u)}
+        assert {r.id for r in index.match(opp)} == expected
+
+
+def test_notifications_are_written_in_bulk_and_emailed(engine, db, monkeypatch):
+    Session = sessionmaker(bind=engine)
+    solana_dev = User(email="sol@example.com", username="sol", preferred_chains=["Solana"], skills=["Rust"],
+                      notification_settings={"email_alerts": True, "frequency": "instant"})
+    digest_only = User(email="digest@example.com", username="digest",
+                       notification_settings={"frequency": "daily"})
+    db.add_all([solana_dev, digest_only])
+    db.commit()
+
+    sent = []
+
+    async def fake_send_emails(messages, concurrency=None):
+        sent.extend(messages)
+        return len(messages)
+
+    monkeypatch.setattr(ingestion, "SessionLocal", Session)
+    monkeypatch.setattr(ingestion, "send_emails", fake_send_emails)
+
+    opps = [
+        {"id": str(uuid.uuid4()), "title": "Solana grant", "description": "Funding", "category": "Grant",
+         "chain": "Solana", "reward_pool": "$5,000", "url": "https://example.org/a"},
+        {"id": str(uuid.uuid4()), "title": "Base bounty", "description": None, "category": "Bounty",
+         "chain": "Base", "reward_pool": None, "url": "https://example.org/b"},
+    ]
+    pipeline = ingestion.IngestionPipeline(db=db)
+    asyncio.run(pipeline._process_notifications(opps))
+
+    rows = db.query(Notification).all()
+    assert [(r.user_id, r.link) for r in rows] == [(solana_dev.id, f"/opportunities/{opps[0]['id']}")]
+    assert [(to, subject) for to, subject, _ in sent] == [("sol@example.com", "New Opportunity found: Solana grant")]
+
+
+def test_send_emails_bounds_requests_in_flight(monkeypatch):
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        return httpx.Response(200, json={"success": True})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(email_service, "PLUNK_API_KEY", "test-key")
+    monkeypatch.setattr(email_service.httpx, "AsyncClient",
+                        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs))
+
+    messages = [(f"user{i}@example.com", "Subject", "<p>Hi</p>") for i in range(20)]
+    assert asyncio.run(email_service.send_emails(messages, concurrency=4)) == 20
+    assert 1 < state["peak"] <= 4
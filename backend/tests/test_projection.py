@@ -0,0 +1,115 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database
+from app.core import responses
+from app.core.cache import ResponseCache
+from app.main import app
+from app.models.opportunity import Opportunity
+from app.schemas import OpportunityResponse, OpportunitySummary
+from app.services import projection
+from app.services.ranking import RankingService
+
+
+@pytest.fixture
+def client(db):
+    ResponseCache.clear()
+    RankingService.invalidate()
+    app.dependency_overrides[database.get_db] = lambda: db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    ResponseCache.clear()
+    RankingService.invalidate()
+
+
+def _opportunity(i, **overrides):
+    values = dict(
+        title=f"Opportunity {i}", url=f"https://example.com/{i}", source="test", source_id=str(i),
+        category="Grant", chain="Solana", tags=["Rust"], description="Long description " * 40,
+        ai_score=80 - i, created_at=datetime(2026, 3, 1) + timedelta(hours=i),
+    )
+    values.update(overrides)
+    return Opportunity(**values)
+
+
+def _seed(db):
+    db.add_all([
+        _opportunity(0, ai_summary="Short summary", ai_strategy="Ship fast", mission_requirements=["KYC"],
+                     reward_pool="$10,000", estimated_value_usd=10000.0,
+                     deadline=datetime(2026, 12, 1, 12, 30), updated_at=datetime(2026, 3, 5)),
+        _opportunity(1, ai_score=0.42, required_skills=["Solidity"], description=None),
+        # NULLs the schema would otherwise reject
+        _opportunity(2, tags=None, trust_score=None, views_count=None, win_probability=None),
+    ])
+    db.commit()
+
+
+def test_full_projection_matches_the_response_schema(db):
+    _seed(db)
+    rows = db.query(*projection.columns_for(projection.FULL_FIELDS)).order_by(Opportunity.title).all()
+    projected = json.loads(responses.dumps(projection.project(rows, projection.FULL_FIELDS)))
+
+    for opp, item in zip(db.query(Opportunity).order_by(Opportunity.title).all()[:2], projected):
+        assert item == OpportunityResponse.model_validate(opp).model_dump(mode="json")
+    assert projected[1]["ai_score"] == projected[1]["score"] == 42
+    assert projected[2]["tags"] == [] and projected[2]["trust_score"] == 70
+
+
+def test_summary_projection_matches_the_summary_schema(db):
+    _seed(db)
+    fields = projection.resolve_fields("summary")
+    rows = db.query(*projection.columns_for(fields)).order_by(Opportunity.title).all()
+    projected = json.loads(responses.dumps(projection.project(rows, fields)))
+
+    opp = db.query(Opportunity).order_by(Opportunity.title).first()
+    assert projected[0] == OpportunitySummary.model_validate(opp).model_dump(mode="json")
+
+
+def test_summary_does_not_load_long_text():
+    columns = {c.key for c in projection.columns_for(projection.resolve_fields("summary"))}
+    assert not columns & {"description", "ai_summary", "ai_strategy"}
+    # Computed fields pull in what they are derived from
+    columns = {c.key for c in projection.columns_for(projection.resolve_fields(fields="summary"))}
+    assert {"ai_summary", "description"} <= columns
+
+
+def test_resolve_fields():
+    assert projection.resolve_fields(fields="title, deadline,title") == ("id", "title", "deadline")
+    with pytest.raises(projection.InvalidFields):
+        projection.resolve_fields(fields="title,password")
+    with pytest.raises(projection.InvalidFields):
+        projection.resolve_fields(view="tiny")
+
+
+def test_stdlib_encoder_matches_orjson(monkeypatch):
+    content = [{"id": uuid.UUID(int=7), "at": datetime(2026, 1, 2, 3, 4, 5, 600, tzinfo=timezone.utc),
+                "naive": datetime(2026, 1, 2), "value": 1.5, "title": "Café"}]
+    fast = responses.dumps(content)
+    monkeypatch.setattr(responses, "ORJSON_AVAILABLE", False)
+    assert responses.dumps(content) == fast
+    assert json.loads(fast)[0]["at"] == "2026-01-02T03:04:05.000600Z"
+
+
+def test_list_endpoints_accept_fields_and_views(client, db):
+    _seed(db)
+    body = client.get("/opportunities", params={"fields": "title,reward"}).json()
+    assert body[0] == {"id": body[0]["id"], "title": "Opportunity 0", "reward": "$10,000"}
+
+    summary = client.get("/opportunities/trending", params={"view": "summary"}).json()
+    assert sorted(o["title"] for o in summary) == ["Opportunity 0", "Opportunity 1", "Opportunity 2"]
+    assert "description" not in summary[0] and summary[0]["type"] == "Grant"
+
+    assert client.get("/opportunities", params={"fields": "title,secret"}).status_code == 400
+    assert client.get("/opportunities/priority", params={"view": "huge"}).status_code == 400
+
+
+def test_priority_fields_carry_the_personalized_score(client, db):
+    _seed(db)
+    body = client.get("/opportunities/priority", params={"fields": "title,score", "limit": 2})
+    assert body.headers["content-type"] == "application/json"
+    assert body.headers.get("x-next-cursor")
+    assert body.json()[0] == {"id": body.json()[0]["id"], "title": "Opportunity 0", "score": 80}
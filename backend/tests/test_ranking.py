@@ -0,0 +1,135 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database
+from app.core.cache import ResponseCache
+from app.main import app
+from app.models.opportunity import Opportunity
+from app.routers.auth import get_optional_user
+from app.services.ranking import FeatureSnapshot, RankingService, base_score
+
+
+SKILLS = ["rust", "solidity", "python", "zk", "design", "defi", "move"]
+CHAINS = ["Solana", "Ethereum", "Base", "Sui", "Multi-chain"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_ranking():
+    RankingService.invalidate()
+    yield
+    RankingService.invalidate()
+
+
+def _seed(db, n=150, seed=0):
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1)
+    for i in range(n):
+        db.add(Opportunity(
+            title=f"Opportunity {i}",
+            url=f"https://example.com/{i}",
+            source="manual",
+            category=rng.choice(["Hackathon", "Grant", "Bounty"]),
+            ai_score=rng.choice([0, 40, 55, 70, 85, 95, 100]),
+            tags=[s.title() for s in rng.sample(SKILLS, rng.randint(0, 3))],
+            required_skills=rng.sample(SKILLS, rng.randint(0, 2)),
+            chain=rng.choice(CHAINS),
+            is_open=i % 10 != 0,
+            deadline=None if i % 3 else datetime.now() + timedelta(days=rng.randint(-5, 30)),
+            created_at=base + timedelta(hours=rng.randint(0, 5000)),
+        ))
+    db.commit()
+
+
+def _legacy_ranking(db, skills, chains):
+    """The per-request scoring the endpoint used to do, sorted best first."""
+    user_skills = {s.lower() for s in skills}
+    user_chains = {c.lower() for c in chains}
+    ranked = []
+    for opp in db.query(Opportunity).all():
+        if not opp.is_open or (opp.deadline and opp.deadline < datetime.now()):
+            continue
+        terms = {t.lower() for t in (opp.tags or []) + (opp.required_skills or [])}
+        bonus = len(user_skills & terms) * 5 + (10 if opp.chain and opp.chain.lower() in user_chains else 0)
+        score = min(base_score(opp.ai_score) + bonus, 100)
+        recency = (opp.updated_at or opp.created_at).timestamp()
+        ranked.append(((-score, -recency, str(opp.id)), (opp.id, score)))
+    return [item for _, item in sorted(ranked)]
+
+
+@pytest.mark.parametrize("skills, chains", [
+    ([], []),
+    (["Rust", "ZK"], ["solana"]),
+    (["python", "design", "defi", "move"], ["Ethereum", "Base"]),
+])
+def test_paginated_ranking_matches_full_sort(db, skills, chains):
+    _seed(db)
+    pages, cursor = [], None
+    while True:
+        page = RankingService.rank(db, skills, chains, cursor=cursor, limit=7)
+        pages.extend((item.id, item.score) for item in page.items)
+        cursor = page.next_cursor
+        if not cursor:
+            break
+    assert pages == _legacy_ranking(db, skills, chains)
+
+
+def test_expired_items_drop_out_without_rebuilding(db):
+    _seed(db, n=30)
+    snapshot = FeatureSnapshot.load(db)
+    with_deadline = [i for i, d in enumerate(snapshot.deadlines) if d is not None]
+    assert with_deadline
+    later = max(snapshot.deadlines[i] for i in with_deadline) + 1
+    items, _ = snapshot.page(frozenset(), frozenset(), None, limit=100, now=later)
+    assert len(items) == len(snapshot) - len(with_deadline)
+
+
+def test_results_are_cached_until_invalidated(db):
+    _seed(db, n=20)
+    first = RankingService.rank(db, ["rust"], [], limit=5)
+    assert RankingService.rank(db, ["Rust"], [], limit=5) is first
+    RankingService.invalidate()
+    assert RankingService.rank(db, ["rust"], [], limit=5) is not first
+
+
+def test_snapshot_is_rebuilt_when_the_shared_version_moves(db, monkeypatch):
+    _seed(db, n=20)
+    first = RankingService.rank(db, ["rust"], [], limit=5)
+    ResponseCache.bump("opportunities")
+    second = RankingService.rank(db, ["rust"], [], limit=5)
+    assert second is not first
+    assert RankingService.rank(db, ["rust"], [], limit=5) is second
+
+    # A Celery worker's bump only shows up in the shared (Redis) version
+    (version,) = ResponseCache.versions(["opportunities"])
+    monkeypatch.setattr(ResponseCache, "versions", classmethod(lambda cls, namespaces: (version + 1,)))
+    assert RankingService.rank(db, ["rust"], [], limit=5) is not second
+
+
+def test_priority_endpoint_pages_without_touching_rows(db):
+    _seed(db, n=40)
+    user = type("User", (), {"skills": ["rust"], "preferred_chains": ["Solana"]})()
+    app.dependency_overrides[database.get_db] = lambda: db
+    app.dependency_overrides[get_optional_user] = lambda: user
+    try:
+        client = TestClient(app)
+        response = client.get("/opportunities/priority", params={"limit": 10})
+        assert response.status_code == 200
+        assert len(response.json()) == 10
+        cursor = response.headers["X-Next-Cursor"]
+
+        second = client.get("/opportunities/priority", params={"limit": 10, "cursor": cursor}).json()
+        expected = _legacy_ranking(db, ["rust"], ["Solana"])
+        assert [(o["id"], o["ai_score"]) for o in response.json() + second] == \
+            [(str(i), s) for i, s in expected[:20]]
+
+        # The personalized score never lands on the stored rows
+        stored = {str(o.id): o.ai_score for o in db.query(Opportunity).all()}
+        assert all(stored[o["id"]] <= o["ai_score"] for o in second)
+        assert not db.dirty
+
+        assert client.get("/opportunities/priority", params={"cursor": "not-a-cursor"}).status_code == 400
+    finally:
+        app.dependency_overrides.clear()
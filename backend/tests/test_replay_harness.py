@@ -0,0 +1,75 @@
+import socket
+from datetime import datetime
+
+from app.scrapers.base import BaseScraper
+from app.scrapers.replay import ReplayScraper, load_replay_scrapers, read_fixture, write_fixture
+from app.scripts.bench_ingestion import benchmark
+from app.scripts.fake_ai_engine import FakeAIEngine
+from app.services import curator, domain_reputation
+
+
+class RecordedScraper(BaseScraper):
+    def __init__(self, items):
+        super().__init__("Recorded Source")
+        self.items = items
+
+    def fetch(self):
+        return self.items
+
+    def parse(self, raw_data):
+        return raw_data
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _items(n):
+    return [
+        {
+            "title": f"Replay Grant {i}",
+            "description": f"Grant number {i} funding {'rust' if i % 2 else 'solidity'} builders " * (i + 3),
+            "url": f"https://grants{i}.example/apply",
+            "source": "Recorded Source",
+            "source_id": f"rec-{i}",
+            "posted_at": datetime(2026, 3, 1 + i),
+            "tags": ["grant"],
+        }
+        for i in range(n)
+    ]
+
+
+def test_fixture_round_trip_keeps_datetimes(tmp_path):
+    path = write_fixture(tmp_path, RecordedScraper(_items(3)), _items(3))
+    assert path.name == "recorded_source.jsonl"
+
+    header, items = read_fixture(path)
+    assert header["source"] == "Recorded Source" and header["items"] == 3
+    assert items == _items(3)
+
+    replay = ReplayScraper(path)
+    first = replay.run()
+    first[0]["title"] = "mutated by the pipeline"
+    assert replay.run() == _items(3)
+    assert replay.next_watermark["posted_at"] == datetime(2026, 3, 3)
+
+
+def test_benchmark_replays_fixtures_through_the_fake_engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(curator, "AI_ENGINE_URL", curator.AI_ENGINE_URL)
+    monkeypatch.setattr(curator, "GROQ_API_KEY", None)
+    monkeypatch.setattr(domain_reputation.DomainReputationCache, "_entries", {})
+    write_fixture(tmp_path / "fixtures", RecordedScraper(_items(6)), _items(6))
+    assert len(load_replay_scrapers(tmp_path / "fixtures")) == 1
+
+    with FakeAIEngine(port=_free_port(), noise_rate=0.0) as fake:
+        report = benchmark(tmp_path / "fixtures", f"sqlite:///{tmp_path / 'bench.db'}", fake.url, batch_size=4)
+        calls = fake.calls
+
+    assert report["items"] == 6 and report["saved"] == 6
+    assert calls["classify"] == 6 and calls["risk-assess"] == 6
+    stages = {s["stage"]: s for s in report["stages"]}
+    assert stages["triage"]["p50_ms"] > 0
+    assert stages["persist"]["queries"] > 0
+    assert report["queries"]["by_kind"]["INSERT"] >= 1
@@ -0,0 +1,83 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database
+from app.core import cache
+from app.core.cache import ResponseCache
+from app.main import app
+from app.models.opportunity import Opportunity
+from app.utils.query_counter import QueryCounter
+
+
+@pytest.fixture
+def client(engine, db):
+    db.add(Opportunity(title="Cached grant", url="https://example.com/a", source="manual",
+                       category="Grant", chain="Solana", ai_score=80))
+    db.commit()
+    app.dependency_overrides[database.get_db] = lambda: db
+    ResponseCache.clear()
+    with QueryCounter(engine) as queries:
+        yield TestClient(app), db, queries
+    app.dependency_overrides.clear()
+    ResponseCache.clear()
+
+
+def test_second_request_is_served_from_cache(client):
+    http, _, queries = client
+    first = http.get("/opportunities/trending")
+    issued = queries.total
+    second = http.get("/opportunities/trending")
+    assert (first.headers["X-Cache"], second.headers["X-Cache"]) == ("MISS", "HIT")
+    assert second.json() == first.json()
+    assert queries.total == issued
+
+
+def test_query_params_are_normalized(client):
+    http, _, _ = client
+    http.get("/opportunities", params=[("limit", "5"), ("category", "Grant")])
+    assert http.get("/opportunities", params=[("category", "Grant"), ("limit", "5")]).headers["X-Cache"] == "HIT"
+    assert http.get("/opportunities", params={"limit": "6"}).headers["X-Cache"] == "MISS"
+
+
+def test_if_none_match_gets_304(client):
+    http, _, _ = client
+    etag = http.get("/opportunities/testnets").headers["ETag"]
+    not_modified = http.get("/opportunities/testnets", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert http.get("/opportunities/testnets", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_write_bump_invalidates(client):
+    http, db, _ = client
+    opp_id = str(db.query(Opportunity).one().id)
+    before = http.get(f"/opportunities/{opp_id}")
+    db.query(Opportunity).update({"title": "Renamed grant"})
+    db.commit()
+    assert http.get(f"/opportunities/{opp_id}").json()["title"] == "Cached grant"   # still cached
+    ResponseCache.bump("opportunities")
+    after = http.get(f"/opportunities/{opp_id}")
+    assert after.headers["X-Cache"] == "MISS"
+    assert after.json()["title"] == "Renamed grant"
+    assert after.headers["ETag"] != before.headers["ETag"]
+
+
+def test_errors_and_personalized_stats_are_not_cached(client):
+    http, _, _ = client
+    missing = "/opportunities/00000000-0000-0000-0000-000000000000"
+    assert http.get(missing).status_code == 404
+    assert "X-Cache" not in http.get(missing).headers
+
+    http.get("/stats/dashboard")
+    assert http.get("/stats/dashboard").headers["X-Cache"] == "HIT"
+    assert "X-Cache" not in http.get("/stats/dashboard", headers={"Authorization": "Bearer x"}).headers
+
+
+def test_unreachable_redis_degrades_to_local_cache(client, monkeypatch):
+    http, _, _ = client
+    monkeypatch.setattr(cache, "REDIS_RETRY_AFTER", 0)
+    monkeypatch.setattr(ResponseCache, "redis", cache.RedisTier("redis://127.0.0.1:1/0"))
+    assert http.get("/opportunities/trending").headers["X-Cache"] == "MISS"
+    assert http.get("/opportunities/trending").headers["X-Cache"] == "HIT"
+    ResponseCache.bump("opportunities")
+    assert http.get("/opportunities/trending").headers["X-Cache"] == "MISS"
@@ -0,0 +1,115 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database
+from app.main import app
+from app.models.enums import UserRole
+from app.models.opportunity import Opportunity
+from app.models.user import User
+from app.routers.auth import get_current_user
+from app.scripts.backfill_reward_values import backfill
+from app.services import ingestion
+from app.services.curator import parse_reward_to_usd
+from app.utils.rewards import apply_reward, normalize_reward, token_prices
+
+
+@pytest.mark.parametrize("reward, usd, token", [
+    ("$50,000", 50000.0, None),
+    ("$1.5M", 1_500_000.0, None),
+    ("10K USDC", 10000.0, "USDC"),
+    ("2.5 million USDT", 2_500_000.0, "USDT"),
+    ("$25,000+ in prizes", 25000.0, None),
+    ("Top 3 share $10K", 10000.0, None),
+    ("$5,000 paid in SOL", 5000.0, "SOL"),
+    ("5000", 5000.0, None),
+    ("500 points", None, None),
+    ("TBD", None, None),
+    ("Alpha", None, None),
+    ("Season 2 token allocation", None, None),
+    ("", None, None),
+])
+def test_normalize_reward(reward, usd, token):
+    assert normalize_reward(reward) == (usd, token)
+
+
+def test_token_amounts_use_the_price_table():
+    eth = token_prices()["ETH"]
+    assert normalize_reward("25 ETH") == (25 * eth, "ETH")
+    assert normalize_reward("1,200", "eth") == (1200 * eth, "ETH")
+    assert parse_reward_to_usd("TBD") == 0.0
+    assert parse_reward_to_usd("$1M") == 1_000_000.0
+
+
+def test_ingest_writes_numeric_reward(db, offline_pipeline):
+    ingestion.ingest_opportunities(db, [{
+        "title": "Arbitrum Builder Grant",
+        "description": "Funding for teams building on Arbitrum. Deadline: 2026-12-01",
+        "url": "https://example.org/arb-grant",
+        "source": "Superteam",
+        "source_id": "arb-1",
+        "reward_pool": "40K ARB",
+    }])
+    opp = db.query(Opportunity).one()
+    assert opp.reward_token == "ARB"
+    assert opp.estimated_value_usd == pytest.approx(40000 * token_prices()["ARB"])
+    assert opp.to_dict()["estimated_value_usd"] == opp.estimated_value_usd
+
+
+def test_apply_reward_keeps_a_given_value_only_without_an_amount():
+    assert apply_reward({"reward_pool": "$2,000", "estimated_value_usd": 0.0})["estimated_value_usd"] == 2000.0
+    assert apply_reward({"reward_pool": "TBD", "estimated_value_usd": 750.0})["estimated_value_usd"] == 750.0
+    assert apply_reward({"reward_pool": "TBD"}) == {"reward_pool": "TBD", "estimated_value_usd": None}
+    assert apply_reward({"reward_pool": "10K USDC"})["reward_token"] == "USDC"
+
+
+def test_manual_create_and_admin_edit_keep_the_usd_value_in_step(db):
+    admin = User(email="admin@example.com", role=UserRole.ADMIN)
+    db.add(admin)
+    db.commit()
+
+    app.dependency_overrides[database.get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: admin
+    try:
+        client = TestClient(app)
+        created = client.post("/opportunities", json={
+            "title": "Manual Grant", "url": "https://example.org/manual", "source": "manual",
+            "category": "Grant", "chain": "Arbitrum", "reward_pool": "40K ARB",
+        })
+        assert created.status_code == 200
+        opp = db.query(Opportunity).one()
+        assert opp.reward_token == "ARB"
+        assert opp.estimated_value_usd == pytest.approx(40000 * token_prices()["ARB"])
+
+        path = f"/admin/opportunities/{opp.id}"
+        assert client.put(path, json={"reward_pool": "$12,500"}).status_code == 200
+        db.refresh(opp)
+        assert opp.estimated_value_usd == 12500.0
+
+        client.put(path, json={"reward_pool": "TBD"})
+        db.refresh(opp)
+        assert opp.estimated_value_usd is None  # the old amount does not linger
+
+        client.put(path, json={"reward_pool": "TBD", "estimated_value_usd": 3000.0})
+        db.refresh(opp)
+        assert opp.estimated_value_usd == 3000.0
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_backfill_fills_missing_values_in_chunks(db):
+    rewards = ["$1,000", "TBD", "3 ETH", None, "$2M"]
+    for i, reward in enumerate(rewards):
+        db.add(Opportunity(title=f"Opp {i}", url=f"https://example.org/{i}", source="Manual", reward_pool=reward))
+    db.add(Opportunity(title="Valued", url="https://example.org/v", source="Manual", reward_pool="$5", estimated_value_usd=7.0))
+    db.commit()
+
+    backfill(chunk_size=2, db=db)
+    values = {o.reward_pool: (o.estimated_value_usd, o.reward_token) for o in db.query(Opportunity)}
+    assert values["$1,000"] == (1000.0, None)
+    assert values["3 ETH"] == (3 * token_prices()["ETH"], "ETH")
+    assert values["$2M"] == (2_000_000.0, None)
+    assert values["TBD"] == (None, None)
+    assert values["$5"] == (7.0, None)  # existing values are kept unless --all
+
+    backfill(recompute_all=True, db=db)
+    assert db.query(Opportunity).filter_by(title="Valued").one().estimated_value_usd == 5.0
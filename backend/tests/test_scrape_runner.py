@@ -0,0 +1,46 @@
+import time
+
+from app.scrapers.base import BaseScraper, run_concurrently
+
+
+class SleepyScraper(BaseScraper):
+    def __init__(self, name, delay, timeout=None):
+        super().__init__(name)
+        self.delay = delay
+        if timeout is not None:
+            self.timeout = timeout
+
+    def fetch(self):
+        time.sleep(self.delay)
+        return [{"title": self.source_name}]
+
+    def parse(self, raw_data):
+        return raw_data
+
+
+def test_sources_run_in_parallel_and_yield_in_completion_order():
+    scrapers = [SleepyScraper("slow", 0.3), SleepyScraper("fast", 0.05), SleepyScraper("mid", 0.15)]
+
+    started = time.monotonic()
+    order = [(s.source_name, items) for s, items in run_concurrently(scrapers)]
+    elapsed = time.monotonic() - started
+
+    assert [name for name, _ in order] == ["fast", "mid", "slow"]
+    assert order[0][1] == [{"title": "fast"}]
+    assert elapsed < 0.5  # ~slowest source, not the 0.5s sum
+
+
+def test_slow_source_is_abandoned_at_its_timeout():
+    scrapers = [SleepyScraper("hung", 2.0, timeout=0.1), SleepyScraper("ok", 0.01)]
+
+    started = time.monotonic()
+    results = dict((s.source_name, items) for s, items in run_concurrently(scrapers))
+
+    assert results == {"ok": [{"title": "ok"}], "hung": []}
+    assert time.monotonic() - started < 1.0
+
+
+def test_run_deadline_caps_every_source():
+    results = dict((s.source_name, items) for s, items in run_concurrently([SleepyScraper("hung", 2.0)], deadline=0.1))
+
+    assert results == {"hung": []}
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from hashlib import sha256
+
+import pytest
+
+from app.scrapers.base import BaseScraper
+from app.services import ingestion
+from app.services.stages import Stage, StagedPipeline, StageStats
+
+
+async def _source(n, fetched=None):
+    for i in range(n):
+        if fetched is not None:
+            fetched.append(i)
+        yield i
+
+
+def test_stages_run_in_order_with_batches_and_stats():
+    seen_batches = []
+
+    async def double(x):
+        return [x * 2]
+
+    async def collect(batch):
+        seen_batches.append(list(batch))
+        return batch
+
+    async def drop_odd_tens(x):
+        return [] if (x // 10) % 2 else [x]
+
+    stages = [Stage("double", double), Stage("batch", collect, batch_size=4), Stage("filter", drop_odd_tens)]
+    pipeline = StagedPipeline(stages, queue_size=2)
+    source_stats = StageStats("fetch", 1)
+    asyncio.run(pipeline.run(_source(10), source_stats))
+
+    assert sorted(x for b in seen_batches for x in b) == [x * 2 for x in range(10)]
+    assert all(len(b) <= 4 for b in seen_batches)
+    stats = {s.name: s.as_dict() for s in pipeline.stats}
+    assert source_stats.items_out == 10
+    assert stats["double"]["in"] == stats["double"]["out"] == 10
+    assert stats["filter"]["out"] == 5  # 10..18 dropped
+
+
+def test_bounded_queues_throttle_the_source():
+    fetched = []
+    max_lead = 0
+
+    async def slow(x):
+        nonlocal max_lead
+        max_lead = max(max_lead, len(fetched) - x)
+        await asyncio.sleep(0.005)
+        return [x]
+
+    pipeline = StagedPipeline([Stage("slow", slow)], queue_size=3)
+    asyncio.run(pipeline.run(_source(40, fetched)))
+
+    assert len(fetched) == 40
+    assert max_lead <= 3 + 2  # queue + the item in hand + one being offered
+
+
+def test_workers_overlap_and_errors_are_counted():
+    async def sleepy(x):
+        await asyncio.sleep(0.05)
+        if x == 3:
+            raise ValueError("bad item")
+        return [x]
+
+    stage = Stage("io", sleepy, workers=8)
+    started = time.monotonic()
+    asyncio.run(StagedPipeline([stage]).run(_source(16)))
+
+    assert time.monotonic() - started < 0.4  # 16 x 50ms would be 0.8s serially
+    assert stage.stats.items_in == 16 and stage.stats.items_out == 15 and stage.stats.errors == 1
+
+
+class ListScraper(BaseScraper):
+    def __init__(self, name, items):
+        super().__init__(name)
+        self.items = items
+
+    def fetch(self):
+        return self.items
+
+    def parse(self, raw_data):
+        return raw_data
+
+
+def test_full_run_streams_scrapers_through_every_stage(db, monkeypatch):
+    async def bypass(items, concurrency=None, client=None):
+        return [("bypass", None)] * len(items)
+
+    indexed = []
+    monkeypatch.setattr(ingestion.AgentCurator, "assess_batch", staticmethod(bypass))
+    monkeypatch.setattr("app.utils.trust_engine.TrustEngine.calculate_score", staticmethod(lambda data: 80))
+    monkeypatch.setattr(ingestion.VectorDBService, "add_opportunities", classmethod(lambda cls, payloads: indexed.extend(payloads)))
+
+    def items(source, n):
+        return [
+            {"title": f"{source} bounty {i}", "description": f"Build a Rust indexer. Ref {sha256(f'{source}{i}'.encode()).hexdigest()}",
+             "url": f"https://{source}.example/{i}", "source": source, "source_id": str(i)}
+            for i in range(n)
+        ]
+
+    scrapers = [ListScraper("alpha", items("alpha", 5)), ListScraper("beta", items("beta", 3) + items("beta", 1))]
+    summary = ingestion.IngestionPipeline(db=db, batch_size=2, scrapers=scrapers).run(notify=False)
+
+    assert summary["new"] == 8
+    assert len(indexed) == 8 and all(isinstance(p["id"], str) for p in indexed)
+    stages = {s["stage"]: s for s in summary["stages"]}
+    assert stages["fetch"]["out"] == 9
+    assert stages["prepare"]["in"] == 9 and stages["prepare"]["out"] == 8  # repeat dropped
+    assert stages["persist"]["out"] == 8
+    assert "notify" not in stages
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app import database
+from app.core.cache import ResponseCache
+from app.main import app
+from app.models.opportunity import Opportunity
+from app.models.stats_snapshot import StatsSnapshot
+from app.models.user import User
+from app.routers.auth import get_optional_user
+from app.services import dashboard_stats, ingestion
+from app.utils.query_counter import QueryCounter
+
+
+def _seed(db, start=0, count=1, **values):
+    for i in range(start, start + count):
+        db.add(Opportunity(title=f"Opportunity {i}", url=f"https://example.com/{i}", source="test",
+                           source_id=str(i), category="Grant", chain="Solana", **values))
+    db.commit()
+
+
+def _dashboard(db, user=None):
+    ResponseCache.clear()
+    app.dependency_overrides[database.get_db] = lambda: db
+    app.dependency_overrides[get_optional_user] = lambda: user
+    try:
+        return TestClient(app).get("/stats/dashboard").json()
+    finally:
+        app.dependency_overrides.clear()
+        ResponseCache.clear()
+
+
+def test_compute_aggregates_active_rows_in_one_query(engine, db):
+    now = datetime.utcnow()
+    _seed(db, 0, 2, estimated_value_usd=1000.0)                                          # no deadline
+    _seed(db, 2, 1, estimated_value_usd=500.0, deadline=now + timedelta(days=3))         # closing soon
+    _seed(db, 3, 1, deadline=now + timedelta(days=30))                                   # no value
+    _seed(db, 4, 1, estimated_value_usd=9999.0, deadline=now - timedelta(days=1))        # expired
+    _seed(db, 5, 1, estimated_value_usd=9999.0, is_open=False)                           # closed
+
+    with QueryCounter(engine) as queries:
+        figures = dashboard_stats.compute(db, now)
+    assert queries.total == 1
+    assert figures == {"active_count": 4, "closing_soon": 1, "total_pool_usd": 2500.0}
+
+
+def test_dashboard_reads_the_snapshot_in_constant_queries(engine, db):
+    _seed(db, 0, 3, estimated_value_usd=2_000_000.0)
+    first = _dashboard(db)  # no snapshot yet: computed and stored
+    assert first["active_grants"] == first["targets_identified"] == 3
+    assert first["total_pool"] == "$6.0M"
+    assert db.get(StatsSnapshot, dashboard_stats.DASHBOARD).active_count == 3
+
+    # New rows are not counted until the next refresh, and do not make the read any heavier
+    _seed(db, 3, 50, estimated_value_usd=10.0)
+    with QueryCounter(engine) as queries:
+        cached = _dashboard(db)
+    assert cached["active_grants"] == 3
+    assert queries.by_kind["SELECT"] == 1 and queries.total == 1
+
+    dashboard_stats.refresh(db)
+    assert _dashboard(db)["active_grants"] == 53
+
+
+def test_stale_snapshot_is_recomputed(db):
+    _seed(db, 0, 2)
+    db.add(StatsSnapshot(name=dashboard_stats.DASHBOARD, active_count=99, closing_soon=0, total_pool_usd=0.0,
+                         refreshed_at=datetime.utcnow() - timedelta(seconds=dashboard_stats.STATS_SNAPSHOT_MAX_AGE + 1)))
+    db.commit()
+    assert _dashboard(db)["active_grants"] == 2
+
+
+def test_win_probability_is_per_user(db):
+    dashboard_stats.refresh(db)
+    user = User(email="hunter@example.com", level=3, skills=["rust", "solidity"], wallet_address="0xabc")
+    assert _dashboard(db)["win_probability"] == "70%"
+    assert _dashboard(db, user)["win_probability"] == "83%"
+
+
+def test_batch_ingest_refreshes_the_snapshot(db, offline_pipeline):
+    dashboard_stats.refresh(db)
+
+    # The Twitter task's path (not IngestionPipeline.run)
+    ingestion.ingest_opportunities(db, [{
+        "title": "Solana Grant Round 1", "description": "Funding for Rust developers building on Solana.",
+        "url": "https://example.org/grants/1", "source": "Superteam", "source_id": "st-1",
+        "category": "Grant", "chain": "Solana", "reward_pool": "$5,000",
+    }])
+    stored = db.get(StatsSnapshot, dashboard_stats.DASHBOARD)
+    db.refresh(stored)
+    assert stored.active_count == 1 and stored.total_pool_usd == 5000.0
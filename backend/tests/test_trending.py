@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app import database
+from app.core.cache import ResponseCache
+from app.main import app
+from app.models.chat import ChatMessage
+from app.models.opportunity import Opportunity
+from app.models.tracking import TrackedApplication
+from app.models.user import User
+from app.routers.auth import get_current_user
+from app.services import trending
+
+
+NOW = datetime(2026, 3, 10, 12, tzinfo=timezone.utc)
+
+
+def _opportunity(db, i, **values):
+    opp = Opportunity(title=f"Opportunity {i}", url=f"https://example.com/{i}", source="test", source_id=str(i),
+                      category="Grant", chain="Solana", **values)
+    db.add(opp)
+    db.commit()
+    return opp
+
+
+def _score(db, opp):
+    return db.execute(text("SELECT trending_score FROM opportunities WHERE id = :id"),
+                      {"id": opp.id.hex}).scalar()
+
+
+def test_new_opportunities_start_with_the_recency_boost(db):
+    opp = _opportunity(db, 0)
+    assert _score(db, opp) == trending.NEW_OPPORTUNITY_BOOST
+
+
+def test_events_add_weight_without_touching_updated_at(db):
+    opp = _opportunity(db, 0, trending_score=0.0)
+    updated_at = opp.updated_at
+    trending.record(db, opp.id, "track")
+    trending.record(db, opp.id, "view", count=4)
+    db.commit()
+    db.refresh(opp)
+    assert opp.trending_score == 9.0
+    assert opp.updated_at == updated_at
+
+
+def test_decay_halves_per_half_life_and_floors_to_zero(db):
+    hot = _opportunity(db, 0, trending_score=8.0)
+    cold = _opportunity(db, 1, trending_score=0.015)
+    trending.decay(db, trending.TRENDING_HALF_LIFE_HOURS)
+    db.expire_all()
+    assert hot.trending_score == pytest.approx(4.0)
+    assert cold.trending_score == 0.0
+    assert hot.updated_at is None
+    # Zero scores are left alone
+    assert trending.decay(db, 1) == 1
+
+
+def test_rebuild_scores_from_history(db):
+    old = NOW - timedelta(hours=trending.TRENDING_HALF_LIFE_HOURS)
+    tracked = _opportunity(db, 0, created_at=old, trending_score=0.0)
+    discussed = _opportunity(db, 1, created_at=old, trending_score=0.0)
+    stale = _opportunity(db, 2, created_at=NOW - timedelta(days=60), trending_score=99.0)
+    db.add(TrackedApplication(opportunity_id=tracked.id, created_at=NOW))
+    db.add_all([ChatMessage(sender="user", content="?", related_opportunity_id=discussed.id, timestamp=NOW),
+                # AI replies do not count twice
+                ChatMessage(sender="ai", content="!", related_opportunity_id=discussed.id, timestamp=NOW)])
+    db.commit()
+
+    assert trending.rebuild(db, now=NOW) == 2
+    db.expire_all()
+    assert tracked.trending_score == pytest.approx(trending.NEW_OPPORTUNITY_BOOST / 2 + 5)
+    assert discussed.trending_score == pytest.approx(trending.NEW_OPPORTUNITY_BOOST / 2 + 3)
+    assert stale.trending_score == 0.0
+
+
+def test_trending_reads_the_partial_index(db):
+    plan = " ".join(row[-1] for row in db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT id FROM opportunities WHERE is_open = 1 "
+        "ORDER BY trending_score DESC, id DESC LIMIT 10")))
+    assert "ix_opportunities_open_trending" in plan
+
+
+def test_trending_endpoint_ranks_open_rows_by_engagement(db):
+    quiet = _opportunity(db, 0, trending_score=1.0)
+    popular = _opportunity(db, 1, trending_score=1.0)
+    _opportunity(db, 2, trending_score=50.0, is_open=False)
+    _opportunity(db, 3, trending_score=50.0, deadline=datetime.now() - timedelta(days=1))
+    user = User(email="fan@example.com")
+    db.add(user)
+    db.commit()
+
+    ResponseCache.clear()
+    app.dependency_overrides[database.get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: user
+    try:
+        client = TestClient(app)
+        assert client.post("/tracker", json={"opportunity_id": str(popular.id)}).status_code == 200
+        titles = [o["title"] for o in client.get("/opportunities/trending").json()]
+    finally:
+        app.dependency_overrides.clear()
+        ResponseCache.clear()
+
+    assert titles == [popular.title, quiet.title]
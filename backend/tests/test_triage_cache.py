@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.opportunity import Opportunity
+from app.models.triage_cache import TriageCacheEntry
+from app.services import ingestion, triage_cache
+from app.services.triage_cache import TriageCache
+
+
+@pytest.fixture
+def engine_calls(monkeypatch):
+    """Fake AI engine: items titled 'noise ...' are rejected, the rest refined."""
+    calls = []
+
+    async def assess_batch(items, concurrency=None, client=None):
+        calls.append([item["title"] for item in items])
+        return [
+            ("noise", None) if item["title"].startswith("noise")
+            else ("refined", {"category": "Grant", "deadline": datetime(2026, 12, 1), "ai_score": 90})
+            for item in items
+        ]
+
+    monkeypatch.setattr(ingestion.AgentCurator, "assess_batch", staticmethod(assess_batch))
+    monkeypatch.setattr("app.utils.trust_engine.TrustEngine.calculate_score", staticmethod(lambda data: 80))
+    monkeypatch.setattr(ingestion.VectorDBService, "add_opportunities", classmethod(lambda cls, payloads: True))
+    return calls
+
+
+def _item(title):
+    return {
+        "title": title,
+        "description": "Builders wanted for the ecosystem fund. Deadline: 2026-12-01",
+        "url": f"https://example.org/{title.replace(' ', '-')}",
+        "source": "Curated",
+        "source_id": title,
+    }
+
+
+def test_known_content_skips_the_ai_engine(db, engine_calls):
+    ingestion.ingest_opportunities(db, [_item("noise one"), _item("grant one")])
+    assert engine_calls == [["noise one", "grant one"]]
+
+    # Next run: the noise item comes back, the grant was stored and deleted since
+    db.query(Opportunity).delete()
+    db.commit()
+    saved = ingestion.ingest_opportunities(db, [_item("noise one"), _item("grant one"), _item("grant two")])
+
+    assert engine_calls[1] == ["grant two"]
+    assert sorted(o.title for o in saved) == ["grant one", "grant two"]
+    cached = db.query(Opportunity).filter_by(title="grant one").one()
+    assert cached.ai_score == 90 and cached.deadline.date().isoformat() == "2026-12-01"
+
+
+def test_expired_and_outdated_verdicts_are_rejudged(db, engine_calls, monkeypatch):
+    ingestion.ingest_opportunities(db, [_item("noise old"), _item("noise new")])
+    db.query(TriageCacheEntry).filter_by(content_hash=ingestion.content_signature(_item("noise old"))).update(
+        {"created_at": datetime.utcnow() - timedelta(days=30)}, synchronize_session=False
+    )
+    db.commit()
+
+    ingestion.ingest_opportunities(db, [_item("noise old"), _item("noise new")])
+    assert engine_calls[1] == ["noise old"]
+
+    monkeypatch.setattr(triage_cache, "TRIAGE_PROMPT_VERSION", "2")
+    ingestion.ingest_opportunities(db, [_item("noise new")])
+    assert engine_calls[2] == ["noise new"]
+
+
+def test_errors_are_not_cached_and_purge_drops_stale_rows(db, monkeypatch):
+    TriageCache.store(db, [("h1", "error", None), ("h2", "bypass", None), ("h3", "noise", None)])
+    assert [row.content_hash for row in db.query(TriageCacheEntry)] == ["h3"]
+
+    monkeypatch.setattr(triage_cache, "TRIAGE_PROMPT_VERSION", "2")
+    assert TriageCache.purge_expired(db) == 1
+    assert TriageCache.lookup(db, ["h3"]) == {}
@@ -0,0 +1,148 @@
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from redis.exceptions import ResponseError
+
+from app import database
+from app.core import view_counter
+from app.core.cache import RedisTier, ResponseCache
+from app.core.view_counter import ViewCounter
+from app.main import app
+from app.models.opportunity import Opportunity
+
+
+class FakeRedis:
+    """The handful of hash commands the counter uses, in memory."""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = bucket.get(field, 0) + amount
+        return bucket[field]
+
+    def rename(self, src, dst):
+        if src not in self.hashes:
+            raise ResponseError("no such key")
+        self.hashes[dst] = self.hashes.pop(src)
+        return True
+
+    def scan(self, cursor, match, count):
+        prefix = match.rstrip("*")
+        return 0, [key.encode() for key in self.hashes if key.startswith(prefix)]
+
+    def hgetall(self, key):
+        return {k.encode(): str(v).encode() for k, v in self.hashes.get(key, {}).items()}
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+        return len(keys)
+
+
+@pytest.fixture(autouse=True)
+def empty_counter():
+    ViewCounter.clear()
+    yield
+    ViewCounter.clear()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    tier = RedisTier("redis://fake")
+    tier.client = FakeRedis()
+    monkeypatch.setattr(ViewCounter, "redis", tier)
+    return tier.client
+
+
+def _opportunity(db, i=0, **values):
+    opp = Opportunity(title=f"Opportunity {i}", url=f"https://example.com/{i}", source="test", source_id=str(i),
+                      category="Grant", chain="Solana", trending_score=0.0, **values)
+    db.add(opp)
+    db.commit()
+    return opp
+
+
+def test_detail_reads_are_buffered_then_flushed_in_one_update(db):
+    opp = _opportunity(db)
+    ResponseCache.clear()
+    app.dependency_overrides[database.get_db] = lambda: db
+    try:
+        client = TestClient(app)
+        first = client.get(f"/opportunities/{opp.id}")
+        cached = client.get(f"/opportunities/{opp.id}")
+        not_modified = client.get(f"/opportunities/{opp.id}", headers={"If-None-Match": first.headers["etag"]})
+        assert client.get(f"/opportunities/{uuid.uuid4()}").status_code == 404
+    finally:
+        app.dependency_overrides.clear()
+        ResponseCache.clear()
+
+    assert cached.headers["x-cache"] == "HIT" and not_modified.status_code == 304
+    assert ViewCounter.pending() == {opp.id: 3}
+    db.refresh(opp)
+    assert opp.views_count == 0  # nothing written on the read path
+
+    assert ViewCounter.flush(db) == 1
+    db.refresh(opp)
+    assert opp.views_count == 3
+    assert opp.trending_score == 3.0
+    assert opp.updated_at is None
+    assert ViewCounter.pending() == {}
+    assert ViewCounter.flush(db) == 0
+
+
+def test_failed_flush_keeps_the_counts(db, monkeypatch):
+    opp = _opportunity(db, views_count=None)
+    ViewCounter.hit(opp.id, 2)
+
+    def broken(db, counts):
+        raise RuntimeError("database unavailable")
+
+    apply = view_counter._apply
+    monkeypatch.setattr(view_counter, "_apply", broken)
+    with pytest.raises(RuntimeError):
+        ViewCounter.flush(db)
+    ViewCounter.hit(opp.id)
+    monkeypatch.setattr(view_counter, "_apply", apply)
+
+    ViewCounter.flush(db)
+    db.refresh(opp)
+    assert opp.views_count == 3
+
+
+def test_redis_buffer_is_shared_and_deleted_after_commit(db, fake_redis):
+    opp = _opportunity(db)
+    ViewCounter.hit(opp.id)
+    ViewCounter.hit(opp.id)
+    assert ViewCounter.pending() == {}
+    assert fake_redis.hashes[view_counter._PENDING_KEY] == {str(opp.id): 2}
+
+    assert ViewCounter.flush(db) == 1
+    db.refresh(opp)
+    assert opp.views_count == 2
+    assert fake_redis.hashes == {}
+
+
+def test_redis_counts_survive_a_failed_flush(db, fake_redis, monkeypatch):
+    opp = _opportunity(db)
+    ViewCounter.hit(opp.id, 4)
+    apply = view_counter._apply
+    monkeypatch.setattr(view_counter, "_apply", lambda db, counts: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        ViewCounter.flush(db)
+    monkeypatch.setattr(view_counter, "_apply", apply)
+    (flushing,) = fake_redis.hashes
+    assert flushing.startswith(view_counter._FLUSHING_PREFIX)
+
+    # Too recent to be an orphan: may still belong to a live flush
+    assert ViewCounter.flush(db) == 0
+    stale = int(time.time()) - view_counter.VIEW_FLUSH_ORPHAN_AFTER
+    fake_redis.rename(flushing, f"{view_counter._FLUSHING_PREFIX}{stale}:dead")
+
+    assert ViewCounter.flush(db) == 1
+    db.refresh(opp)
+    assert opp.views_count == 4
+    assert fake_redis.hashes == {}
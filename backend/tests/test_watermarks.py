@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.scraper_watermark import ScraperWatermark
+from app.scrapers.base import BaseScraper, as_utc
+from app.scrapers.reddit import RedditScraper
+from app.scrapers.superteam import SuperteamScraper
+from app.services import ingestion
+from app.services.watermarks import load_watermarks, save_watermarks
+
+
+def test_as_utc_normalizes_mixed_inputs():
+    naive = datetime(2026, 3, 1, 12, 0)
+    assert as_utc("2026-03-01T12:00:00Z") == naive
+    assert as_utc(datetime(2026, 3, 1, 13, 0, tzinfo=timezone(timedelta(hours=1)))) == naive
+    assert as_utc(naive) == naive
+    assert as_utc("not a date") is None
+
+
+def test_superteam_drops_listings_behind_the_watermark(monkeypatch):
+    monkeypatch.setattr(SuperteamScraper, "_fetch_earn_api", lambda self: [])
+
+    first = SuperteamScraper()
+    assert len(first.run()) == 5
+    mark = first.next_watermark
+    assert mark["posted_at"] == datetime(2026, 3, 10)
+    assert mark["source_id"] == "superteam-st-zk-article-2026"
+
+    second = SuperteamScraper()
+    second.watermark = mark
+    assert second.run() == []
+    assert second.next_watermark["posted_at"] == mark["posted_at"]  # never moves backwards
+
+
+def test_reddit_parse_skips_posts_at_or_before_the_sub_anchor():
+    scraper = RedditScraper()
+    scraper.watermark = {"cursor": {"ethdev": {"before": "t3_b", "created_utc": 200}}}
+    posts = [
+        {"id": "c", "name": "t3_c", "title": "Hackathon announced", "created_utc": 300, "_subreddit": "ethdev"},
+        {"id": "b", "name": "t3_b", "title": "Grant program open", "created_utc": 200, "_subreddit": "ethdev"},
+        {"id": "z", "name": "t3_z", "title": "Bounty for a bug fix", "created_utc": 150, "_subreddit": "rust"},
+    ]
+    assert [p["source_id"] for p in scraper.parse(posts)] == ["c", "z"]
+
+
+class DatedScraper(BaseScraper):
+    def __init__(self, dates):
+        super().__init__("Dated")
+        self.dates = dates
+        self.seen_watermark = "unset"
+
+    def fetch(self):
+        self.seen_watermark = self.watermark
+        return [
+            {"title": f"Dated grant {i}", "description": f"Grant round number {i} for builders, apply today.",
+             "url": f"https://dated.example/{i}", "source": "Dated", "source_id": str(i), "posted_at": d}
+            for i, d in enumerate(self.dates)
+        ]
+
+    def parse(self, raw_data):
+        return [item for item in raw_data if not self.is_known(item["posted_at"])]
+
+
+def _pipeline(db, scraper, monkeypatch, status="bypass"):
+    async def assess(items, concurrency=None, client=None):
+        return [(status, None)] * len(items)
+
+    monkeypatch.setattr(ingestion.AgentCurator, "assess_batch", staticmethod(assess))
+    monkeypatch.setattr("app.utils.trust_engine.TrustEngine.calculate_score", staticmethod(lambda data: 80))
+    monkeypatch.setattr(ingestion.VectorDBService, "add_opportunities", classmethod(lambda cls, payloads: True))
+    pipeline = ingestion.IngestionPipeline(db=db, scrapers=[scraper])
+    monkeypatch.setattr(pipeline.db, "close", lambda: None)  # keep the in-memory DB for assertions
+    return pipeline
+
+
+def test_pipeline_saves_watermark_after_clean_run_only(db, monkeypatch):
+    failing = DatedScraper([datetime(2026, 3, 1), datetime(2026, 3, 5)])
+    _pipeline(db, failing, monkeypatch, status="error").run(notify=False)
+    assert db.query(ScraperWatermark).count() == 0  # AI engine errors: items must be refetched
+
+    clean = DatedScraper([datetime(2026, 3, 1), datetime(2026, 3, 5)])
+    _pipeline(db, clean, monkeypatch).run(notify=False)
+    stored = db.query(ScraperWatermark).one()
+    assert (stored.source, stored.last_source_id) == ("Dated", "1")
+    assert as_utc(stored.last_posted_at) == datetime(2026, 3, 5)
+
+    later = DatedScraper([datetime(2026, 3, 5), datetime(2026, 3, 9)])
+    summary = _pipeline(db, later, monkeypatch).run(notify=False)
+    assert later.seen_watermark["posted_at"] == datetime(2026, 3, 5)
+    assert summary["stages"][0]["out"] == 1  # only the post after the watermark was fetched through
+
+
+def test_load_and_save_round_trip(db):
+    scraper = DatedScraper([])
+    scraper.next_watermark = {"source_id": "7", "posted_at": "2026-03-02T00:00:00Z", "cursor": {"page": 3}}
+    assert save_watermarks(db, [scraper]) == 1
+
+    fresh = DatedScraper([])
+    load_watermarks(db, [fresh])
+    assert fresh.watermark == {"source_id": "7", "posted_at": datetime(2026, 3, 2), "cursor": {"page": 3}}
+
+
+class FakeRedditClient:
+    """httpx.Client stand-in serving one fixed listing per subreddit; records the params sent."""
+    requests = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, url, params=None):
+        FakeRedditClient.requests.append((url, dict(params or {})))
+        sub = url.split("/r/")[1].split("/")[0]
+        posts = [] if (params or {}).get("before") else [
+            {"data": {"id": f"{sub}1", "name": f"t3_{sub}1", "title": "Which wallet do you use?", "created_utc": 300}},
+        ]
+
+        class Response:
+            status_code = 200
+
+            @staticmethod
+            def json():
+                return {"data": {"children": posts}}
+        return Response()
+
+
+def test_reddit_cursor_advances_even_when_every_post_is_filtered_out(db, monkeypatch):
+    monkeypatch.setattr("app.scrapers.reddit.httpx.Client", FakeRedditClient)
+    FakeRedditClient.requests = []
+
+    scraper = RedditScraper()
+    _pipeline(db, scraper, monkeypatch).run(notify=False)
+    stored = db.query(ScraperWatermark).filter_by(source="Reddit").one()
+    assert stored.cursor["ethdev"] == {"before": "t3_ethdev1", "created_utc": 300}
+
+    FakeRedditClient.requests = []
+    _pipeline(db, RedditScraper(), monkeypatch).run(notify=False)
+    assert ("https://www.reddit.com/r/solana/new.json", {"limit": 25, "before": "t3_solana1"}) in FakeRedditClient.requests
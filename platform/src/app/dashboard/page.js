@@ -12,6 +12,20 @@ import ChainFilterSelect from '@/components/ui/ChainFilterSelect'
 
 const fetcher = url => api.get(url).then(res => res.data)
 
+// /opportunities/priority returns one page at a time; follow X-Next-Cursor so
+// the client-side filters below see every open opportunity, not just page 1
+const PRIORITY_PAGE_SIZE = 500
+const fetchAllPages = async url => {
+  const items = []
+  let cursor = null
+  do {
+    const res = await api.get(url, { params: { limit: PRIORITY_PAGE_SIZE, ...(cursor && { cursor }) } })
+    items.push(...res.data)
+    cursor = res.headers['x-next-cursor']
+  } while (cursor)
+  return items
+}
+
 const StatCard = ({ label, value, icon: Icon, color }) => (
   <div className="bg-[var(--bg-secondary)] border border-[var(--border-default)] rounded-lg p-4 flex items-center justify-between group hover:border-[var(--accent-primary)]/20 transition-colors">
     <div>
@@ -31,9 +45,15 @@ export default function DashboardPage() {
   const [reward, setReward] = useState('all')
   const [chain, setChain] = useState('all')
   const { data: stats, error: statsError } = useSWR('/stats/dashboard', fetcher, { refreshInterval: 120000 })
-  const { data: opportunities, error: oppsError, mutate } = useSWR('/opportunities/priority', fetcher, { refreshInterval: 60000 })
+  const { data: opportunities, error: oppsError, mutate } = useSWR('/opportunities/priority', fetchAllPages, { refreshInterval: 60000 })
 
   const loading = !stats && !statsError && !opportunities && !oppsError
+  const availableCount = stats?.active_grants ?? opportunities?.length ?? 0
+  // The list is in priority order, so the newest row can be anywhere in it
+  const lastAddedAt = (opportunities || []).reduce((latest, opp) => {
+    const created = opp.created_at ? new Date(opp.created_at).getTime() : 0
+    return created > latest ? created : latest
+  }, 0)
 
   const filteredOpps = (opportunities || []).filter(opp => {
     // Category filter
@@ -101,13 +121,13 @@ export default function DashboardPage() {
               Live
             </span>
             <span className="text-[var(--text-tertiary)]">·</span>
-            <span><span className="text-[var(--accent-primary)] font-semibold">{opportunities?.length || 0}</span> opportunities available</span>
-            {opportunities?.[0]?.created_at && (
+            <span><span className="text-[var(--accent-primary)] font-semibold">{availableCount}</span> opportunities available</span>
+            {lastAddedAt > 0 && (
               <>
                 <span className="text-(--text-tertiary)">·</span>
                 <span className="text-[11px] text-(--text-tertiary)">
                   Last added {(() => {
-                    const diff = Math.floor((Date.now() - new Date(opportunities[0].created_at).getTime()) / 60000)
+                    const diff = Math.floor((Date.now() - lastAddedAt) / 60000)
                     if (diff < 1) return 'just now'
                     if (diff < 60) return `${diff}m ago`
                     if (diff < 1440) return `${Math.floor(diff / 60)}h ago`